@@ -4,10 +4,10 @@ import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 import config
 from database import get_db
-from models import User
+from user_cache import CachedUser, cache_user, get_cached_user
+import repository
 
 # HTTP Bearer 토큰 스키마
 security = HTTPBearer()
@@ -67,7 +67,7 @@ def verify_token(token: str) -> dict:
             detail="토큰이 만료되었습니다.",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="유효하지 않은 토큰입니다.",
@@ -75,10 +75,50 @@ def verify_token(token: str) -> dict:
         )
 
 
+def get_token_user_id(token: str) -> int:
+    """
+    토큰을 검증하고 user_id 추출
+
+    Raises:
+        HTTPException: 토큰이 유효하지 않거나 사용자 정보가 없는 경우
+    """
+    payload = verify_token(token)
+
+    user_id: int = payload.get("user_id")
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="토큰에 사용자 정보가 없습니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user_id
+
+
+async def load_user(db: AsyncSession, user_id: int) -> Optional[CachedUser]:
+    """
+    사용자 조회 (캐시 우선, 없으면 DB 조회 후 캐시에 저장)
+
+    Args:
+        db: 데이터베이스 세션 (캐시 적중 시 커넥션을 사용하지 않음)
+        user_id: User.id
+
+    Returns:
+        CachedUser 또는 None
+    """
+    user = get_cached_user(user_id)
+    if user is not None:
+        return user
+
+    user = await repository.get_user_by_id(db, user_id)
+    if user is not None:
+        cache_user(user)
+    return user
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
-) -> User:
+) -> CachedUser:
     """
     현재 인증된 사용자 조회
 
@@ -87,27 +127,15 @@ async def get_current_user(
         db: 데이터베이스 세션
 
     Returns:
-        인증된 User 객체
+        인증된 사용자 (CachedUser)
 
     Raises:
         HTTPException: 인증 실패 시
     """
-    token = credentials.credentials
-    payload = verify_token(token)
+    user_id = get_token_user_id(credentials.credentials)
 
-    user_id: int = payload.get("user_id")
-    if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="토큰에 사용자 정보가 없습니다.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    # 데이터베이스에서 사용자 조회
-    result = await db.execute(
-        select(User).where(User.id == user_id)
-    )
-    user = result.scalar_one_or_none()
+    # 사용자 조회 (캐시 적중 시 DB 조회 없음)
+    user = await load_user(db, user_id)
 
     if user is None:
         raise HTTPException(
@@ -122,7 +150,7 @@ async def get_current_user(
 async def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     db: AsyncSession = Depends(get_db)
-) -> Optional[User]:
+) -> Optional[CachedUser]:
     """
     현재 사용자 조회 (선택적 인증)
 
@@ -133,7 +161,7 @@ async def get_current_user_optional(
         db: 데이터베이스 세션
 
     Returns:
-        인증된 User 객체 또는 None
+        인증된 사용자 (CachedUser) 또는 None
     """
     if credentials is None:
         return None
@@ -146,19 +174,14 @@ async def get_current_user_optional(
         if user_id is None:
             return None
 
-        result = await db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
-
-        return user
+        return await load_user(db, user_id)
     except HTTPException:
         return None
 
 
 async def get_current_admin_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: CachedUser = Depends(get_current_user)
+) -> CachedUser:
     """
     현재 관리자 사용자 조회
 
@@ -168,7 +191,7 @@ async def get_current_admin_user(
         current_user: 현재 인증된 사용자
 
     Returns:
-        관리자 User 객체
+        관리자 사용자 (CachedUser)
 
     Raises:
         HTTPException: 관리자 권한이 없는 경우
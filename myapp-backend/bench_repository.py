@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+repository.py 단건 조회 마이크로벤치마크
+
+같은 조회를 기존 방식(AsyncSession.execute(select(Model)) → ORM 객체)과
+repository 함수(캐시된 statement → Row / __slots__ 레코드)로 반복 실행하여
+호출당 평균 시간을 비교합니다. 두 방식 모두 같은 커넥션에서 같은 SQL 왕복을 하므로
+차이는 statement 생성 / ORM 컴파일 / 객체 생성 비용입니다.
+
+DATABASE_URL의 DB에 벤치마크용 데이터를 만들고 끝나면 삭제합니다.
+
+사용법:
+    python bench_repository.py --iterations 2000
+"""
+import argparse
+import asyncio
+import json
+import time
+from uuid import uuid4
+
+from sqlalchemy import delete, select
+
+import repository
+from database import AsyncSessionLocal, engine
+from models import Enrollment, Invitation, User
+
+
+async def _seed(db, run_id: str):
+    invitation = Invitation(code=f"BENCH-{run_id}", is_active=True)
+    db.add(invitation)
+    await db.flush()
+    user = User(
+        userId=f"bench-{run_id}", name="벤치마크", password="not-a-hash",
+        birthday="2000-01-01", phone=f"bench-{run_id}", invitationId=invitation.id,
+    )
+    db.add(user)
+    await db.flush()
+    db.add(Enrollment(userId=user.id, partyId=1, enrolled=True, status="approved"))
+    await db.commit()
+    return invitation, user
+
+
+async def _cleanup(db, invitation, user):
+    await db.execute(delete(Enrollment).where(Enrollment.userId == user.id))
+    await db.execute(delete(User).where(User.id == user.id))
+    await db.execute(delete(Invitation).where(Invitation.id == invitation.id))
+    await db.commit()
+
+
+async def _time(db, iterations: int, call) -> float:
+    """호출당 평균 시간(초) - 세션 identity map이 커지지 않도록 매번 비움"""
+    for _ in range(min(100, iterations)):
+        await call()
+        db.expunge_all()
+
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        await call()
+        db.expunge_all()
+    return (time.perf_counter() - started_at) / iterations
+
+
+async def main(iterations: int) -> dict:
+    run_id = uuid4().hex[:8]
+    results = {}
+    try:
+        async with AsyncSessionLocal() as db:
+            invitation, user = await _seed(db, run_id)
+            try:
+                cases = {
+                    "User by id": (
+                        lambda: _orm_first(db, select(User).where(User.id == user.id)),
+                        lambda: repository.get_user_by_id(db, user.id),
+                    ),
+                    "User by userId": (
+                        lambda: _orm_first(db, select(User).where(User.userId == user.userId)),
+                        lambda: repository.get_login_user(db, user.userId),
+                    ),
+                    "Enrollment by (userId, partyId)": (
+                        lambda: _orm_first(db, select(Enrollment).where(
+                            Enrollment.userId == user.id, Enrollment.partyId == 1
+                        ).order_by(Enrollment.createdAt.desc())),
+                        lambda: repository.get_enrollment(db, user.id, 1),
+                    ),
+                    "Invitation by code": (
+                        lambda: _orm_first(db, select(Invitation).where(Invitation.code == invitation.code)),
+                        lambda: repository.get_invitation_by_code(db, invitation.code),
+                    ),
+                }
+                for name, (orm_call, lean_call) in cases.items():
+                    orm = await _time(db, iterations, orm_call)
+                    lean = await _time(db, iterations, lean_call)
+                    results[name] = {
+                        "ormMicroseconds": round(orm * 1e6, 1),
+                        "repositoryMicroseconds": round(lean * 1e6, 1),
+                        "savedMicroseconds": round((orm - lean) * 1e6, 1),
+                        "savedPercent": round((orm - lean) / orm * 100, 1),
+                    }
+                await db.rollback()
+            finally:
+                await _cleanup(db, invitation, user)
+    finally:
+        await engine.dispose()
+    return results
+
+
+async def _orm_first(db, statement):
+    result = await db.execute(statement)
+    return result.scalars().first()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="repository.py microbenchmark")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    results = asyncio.run(main(args.iterations))
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    else:
+        print(f"{'lookup':<34} {'ORM µs':>10} {'repo µs':>10} {'saved µs':>10} {'saved %':>8}")
+        for name, r in results.items():
+            print(
+                f"{name:<34} {r['ormMicroseconds']:>10} {r['repositoryMicroseconds']:>10} "
+                f"{r['savedMicroseconds']:>10} {r['savedPercent']:>8}"
+            )
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+관리자 목록 응답 직렬화 벤치마크
+
+조회한 행(SQLAlchemy Row) N개로 GET /enrollments 응답 본문을 만드는 시간을 비교합니다.
+DB 조회 시간은 포함하지 않습니다. (DB 없이 실행 가능)
+
+- before: 행마다 dict + createdAt.isoformat() → jsonable_encoder → stdlib json (기존 방식)
+- response_model: 같은 dict를 pydantic 응답 모델로 검증 / 직렬화 → orjson
+- rows → orjson: schemas.listing_response (현재 방식)
+
+사용법:
+    python bench_serialization.py --rows 1000 --iterations 200
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from sqlalchemy.engine.result import result_tuple
+
+import schemas
+
+COLUMNS = ("id", "partyId", "enrolled", "createdAt", "user_id", "name", "birthday", "phone")
+
+
+def _rows(count: int):
+    make_row = result_tuple(COLUMNS)
+    started = datetime(2025, 12, 1)
+    return [
+        make_row((i, i % 3 + 1, True, started + timedelta(seconds=i, microseconds=i), 1000 + i,
+                  f"유저{i}", "2000-01-01", f"010-0000-{i:04d}"))
+        for i in range(1, count + 1)
+    ]
+
+
+def _dicts(rows, isoformat: bool):
+    return [
+        {
+            "id": row.id,
+            "partyId": row.partyId,
+            "enrolled": row.enrolled,
+            "createdAt": row.createdAt.isoformat() if isoformat else row.createdAt,
+            "user": {
+                "id": row.user_id,
+                "name": row.name,
+                "birthday": row.birthday,
+                "phone": row.phone,
+            },
+        }
+        for row in rows
+    ]
+
+
+def before(rows) -> bytes:
+    items = _dicts(rows, isoformat=True)
+    content = {"enrollments": items, "count": len(items), "nextCursor": None}
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def response_model(rows) -> bytes:
+    items = _dicts(rows, isoformat=False)
+    content = {"enrollments": items, "count": len(items), "nextCursor": None}
+    model = schemas.EnrollmentListResponse.model_validate(content)
+    return ORJSONResponse(model.model_dump(mode="json")).body
+
+
+def rows_to_orjson(rows) -> bytes:
+    return schemas.listing_response(
+        rows, schemas.ENROLLMENT_ITEM_FIELDS, schemas.ENROLLMENT_USER_FIELDS, None
+    ).body
+
+
+def _time(iterations: int, call, rows) -> float:
+    """호출당 평균 시간(초)"""
+    for _ in range(min(20, iterations)):
+        call(rows)
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        call(rows)
+    return (time.perf_counter() - started_at) / iterations
+
+
+def main(row_count: int, iterations: int) -> dict:
+    rows = _rows(row_count)
+    # 세 방식 모두 같은 JSON을 만드는지 확인
+    expected = json.loads(before(rows))
+    for call in (response_model, rows_to_orjson):
+        assert json.loads(call(rows)) == expected, call.__name__
+
+    per_1k = 1000 / row_count
+    results = {}
+    for name, call in (("before", before), ("response_model", response_model), ("rows → orjson", rows_to_orjson)):
+        seconds = _time(iterations, call, rows)
+        results[name] = {"millisecondsPer1kEnrollments": round(seconds * 1e3 * per_1k, 3)}
+
+    baseline = results["before"]["millisecondsPer1kEnrollments"]
+    for r in results.values():
+        r["speedup"] = round(baseline / r["millisecondsPer1kEnrollments"], 2)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Listing serialization benchmark")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    results = main(args.rows, args.iterations)
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    else:
+        print(f"{'serializer':<18} {'ms / 1k rows':>14} {'speedup':>8}")
+        for name, r in results.items():
+            print(f"{name:<18} {r['millisecondsPer1kEnrollments']:>14} {r['speedup']:>8}")
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -22,6 +23,89 @@ JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "default-jwt-secret-change-in-produ
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 JWT_EXPIRATION_HOURS = int(os.getenv("JWT_EXPIRATION_HOURS", "24"))
 
+# bcrypt 워커 풀 설정 (워커당 스레드 수, 대기열 최대 길이)
+BCRYPT_WORKERS = int(os.getenv("BCRYPT_WORKERS", "2"))
+BCRYPT_QUEUE_LIMIT = int(os.getenv("BCRYPT_QUEUE_LIMIT", "32"))
+
+# 인증 사용자 캐시 설정 (0이면 캐시 사용 안 함)
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", "10000"))
+
+# Party 테이블에 없는 파티의 기본 정원
+DEFAULT_PARTY_CAPACITY = int(os.getenv("DEFAULT_PARTY_CAPACITY", "50"))
+
+# 공개 조회 API 응답 캐시 TTL (초, Cache-Control max-age로도 사용)
+PARTY_INFO_CACHE_TTL_SECONDS = int(os.getenv("PARTY_INFO_CACHE_TTL_SECONDS", "5"))
+PAYMENT_INFO_CACHE_TTL_SECONDS = int(os.getenv("PAYMENT_INFO_CACHE_TTL_SECONDS", "300"))
+HEALTH_CACHE_TTL_SECONDS = int(os.getenv("HEALTH_CACHE_TTL_SECONDS", "5"))
+
+# 관리자 일괄 승인/거절 최대 건수
+BULK_ENROLLMENT_MAX = int(os.getenv("BULK_ENROLLMENT_MAX", "500"))
+
+# 워커 간 공유 상태 파일 경로 (같은 서버의 gunicorn 워커들이 공유)
+SHARED_STATE_DIR = os.getenv("SHARED_STATE_DIR", os.path.join(tempfile.gettempdir(), "vanta"))
+
+# 회원가입 세션 저장소 설정 (memory: 단일 워커용, shared: 여러 워커가 공유)
+REGISTER_SESSION_BACKEND = os.getenv("REGISTER_SESSION_BACKEND", "memory")
+REGISTER_SESSION_TTL_SECONDS = int(os.getenv("REGISTER_SESSION_TTL_SECONDS", "1800"))
+
+# 로그인 / 초대코드 검증 요청 수 제한 ("burst/seconds", rate_limit.py)
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+# memory: 단일 워커용, shared: 여러 워커가 공유 (기본값은 회원가입 세션 저장소와 같음)
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", REGISTER_SESSION_BACKEND)
+LOGIN_RATE_LIMIT_PER_IP = os.getenv("LOGIN_RATE_LIMIT_PER_IP", "30/60")
+LOGIN_RATE_LIMIT_PER_USER = os.getenv("LOGIN_RATE_LIMIT_PER_USER", "5/60")
+INVITATION_RATE_LIMIT_PER_IP = os.getenv("INVITATION_RATE_LIMIT_PER_IP", "20/60")
+# 초대코드는 여러 명이 같이 사용하므로 넉넉하게
+INVITATION_RATE_LIMIT_PER_CODE = os.getenv("INVITATION_RATE_LIMIT_PER_CODE", "120/60")
+# 앱 앞의 리버스 프록시 수 (X-Forwarded-For에서 클라이언트 IP를 찾을 위치, 0이면 접속 주소 사용)
+RATE_LIMIT_PROXY_HOPS = int(os.getenv("RATE_LIMIT_PROXY_HOPS", "0"))
+
+# 초대코드 인덱스 (invitation_index.py - 없는 / 비활성 코드는 DB 조회 없이 응답)
+INVITATION_INDEX_ENABLED = os.getenv("INVITATION_INDEX_ENABLED", "true").lower() == "true"
+# 놓친 변경 알림을 맞추기 위한 전체 재조회 간격
+INVITATION_INDEX_REFRESH_SECONDS = float(os.getenv("INVITATION_INDEX_REFRESH_SECONDS", "60"))
+
+# DB 커넥션 예산 (모든 워커의 커넥션 합계 상한 - 관리형 Postgres 요금제의 최대 커넥션 수에 맞춤)
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", "20"))
+# 마이그레이션, psql 등 앱 밖에서 사용할 커넥션 수 (예산에서 제외)
+DB_RESERVED_CONNECTIONS = int(os.getenv("DB_RESERVED_CONNECTIONS", "2"))
+# gunicorn 워커 수 (gunicorn.conf.py가 설정, 단독 uvicorn 실행 시 1)
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+# 풀 크기 직접 지정 (설정하지 않으면 커넥션 예산과 워커 수로 계산)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "0"))
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "10"))
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+# 워커 시작 시 미리 열어두는 풀 커넥션 수 (warmup.py, 풀 크기를 넘으면 풀 크기)
+DB_POOL_MIN_CONNECTIONS = int(os.getenv("DB_POOL_MIN_CONNECTIONS", "2"))
+# 유휴 커넥션 생존 확인 주기 (pool_pre_ping 대신 백그라운드에서 확인)
+DB_LIVENESS_INTERVAL_SECONDS = float(os.getenv("DB_LIVENESS_INTERVAL_SECONDS", "30"))
+
+# pgBouncer(transaction mode)를 거쳐 연결하는 경우 true - prepared statement 캐시 비활성화
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "false").lower() == "true"
+# LISTEN 등 세션 단위 기능용 직접 연결 URL (pgBouncer 사용 시 필요, 없으면 DATABASE_URL 사용)
+DATABASE_DIRECT_URL = os.getenv("DATABASE_DIRECT_URL", "")
+
+# 읽기 전용 복제본 (설정하면 get_read_db를 사용하는 조회 API가 복제본에서 읽음, 없으면 primary)
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL", "")
+# 복제본 데이터가 이보다 오래되었을 수 있으면 primary에서 읽음
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5"))
+# 복제 지연 확인 주기
+REPLICA_LAG_CHECK_SECONDS = float(os.getenv("REPLICA_LAG_CHECK_SECONDS", "1"))
+# 복제본 풀 크기 (설정하지 않으면 primary 풀과 같음)
+DB_REPLICA_POOL_SIZE = int(os.getenv("DB_REPLICA_POOL_SIZE", "0"))
+
+# 느린 쿼리 로그 기준 (밀리초)
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+
+# 요청 하나에서 같은 형태의 쿼리가 QUERY_REPEAT_LIMIT번을 넘으면 N+1로 판단
+# (off: 검사 안 함, warn: 경고 로그, raise: 예외 발생 - 테스트용)
+QUERY_REPEAT_LIMIT = int(os.getenv("QUERY_REPEAT_LIMIT", "10"))
+QUERY_REPEAT_MODE = os.getenv("QUERY_REPEAT_MODE", "warn" if ENVIRONMENT == "development" else "off")
+
+# /metrics 접근 토큰 (설정하면 Authorization: Bearer <토큰> 헤더 필요)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
 # 환경 검증
 def validate_production_config():
     """프로덕션 환경에서 필수 설정이 올바른지 검증"""
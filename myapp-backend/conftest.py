@@ -0,0 +1,127 @@
+"""
+pytest 공통 설정
+
+테스트는 로컬 PostgreSQL이 필요합니다. TEST_DATABASE_URL이 설정되지 않으면
+DB 테스트는 수집하지 않습니다. (테스트마다 스키마를 DROP/CREATE하므로
+운영 DB를 가리키면 안 됩니다.)
+
+    TEST_DATABASE_URL=postgresql://postgres@localhost/vanta_test pytest -q
+"""
+import asyncio
+import os
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+
+# 실행 중인 서버를 대상으로 하는 수동 테스트 스크립트
+collect_ignore = ["test_api.py"]
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+    os.environ.setdefault("ADMIN_USER_IDS", "1")
+    # 테스트 중 N+1 패턴이 생기면 요청을 실패시킴
+    os.environ.setdefault("QUERY_REPEAT_MODE", "raise")
+else:
+    collect_ignore_glob = ["test_*.py"]
+
+
+class TestData:
+    """테스트 데이터 생성 및 API 호출 헬퍼"""
+
+    def __init__(self):
+        from database import AsyncSessionLocal, engine
+        self.engine = engine
+        self.session_factory = AsyncSessionLocal
+
+    async def reset_schema(self):
+        from models import Base
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def create_user(self, id: int, **fields):
+        from models import User
+        async with self.session_factory() as db:
+            user = User(
+                id=id,
+                userId=fields.get("userId", f"user{id}"),
+                name=fields.get("name", f"유저{id}"),
+                password=fields.get("password", "not-a-hash"),
+                birthday=fields.get("birthday", "2000-01-01"),
+                phone=fields.get("phone", f"010-0000-{id:04d}"),
+                invitationId=fields.get("invitationId", 1),
+            )
+            db.add(user)
+            await db.commit()
+        return user
+
+    async def create_enrollment(self, user_id: int, party_id: int = 1, status: str = "pending", **fields):
+        from models import Enrollment
+        from occupancy import adjust_approved_count
+        async with self.session_factory() as db:
+            enrollment = Enrollment(
+                userId=user_id,
+                partyId=party_id,
+                enrolled=True,
+                status=status,
+                couponUsed=fields.get("couponUsed", False),
+                createdAt=fields.get("createdAt", datetime(2025, 12, 1) + timedelta(seconds=user_id)),
+            )
+            if status == "approved":
+                await adjust_approved_count(db, party_id, 1)
+            db.add(enrollment)
+            await db.commit()
+        return enrollment
+
+    @contextmanager
+    def count_queries(self):
+        """블록 안에서 실행된 SQL 문 개수 측정"""
+        from sqlalchemy import event
+
+        counter = {"count": 0}
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            counter["count"] += 1
+
+        event.listen(self.engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield counter
+        finally:
+            event.remove(self.engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    def auth_headers(self, user_id: int) -> dict:
+        from auth import create_access_token
+        return {"Authorization": f"Bearer {create_access_token(data={'user_id': user_id})}"}
+
+    def client(self):
+        import httpx
+        from main import app
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver")
+
+    def run(self, scenario):
+        """빈 스키마에서 async 시나리오를 실행하고 커넥션 풀을 정리"""
+        import rate_limit
+        import response_cache
+        from invitation_index import invitation_index
+        from user_cache import clear_user_cache
+
+        async def wrapper():
+            clear_user_cache()
+            response_cache.clear()
+            rate_limit.rate_limit_store.clear()
+            invitation_index.clear()
+            await self.reset_schema()
+            try:
+                return await scenario()
+            finally:
+                await self.engine.dispose()
+
+        return asyncio.run(wrapper())
+
+
+@pytest.fixture
+def data():
+    return TestData()
@@ -1,28 +1,89 @@
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from collections import Counter, deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Deque, Optional, Tuple
+from uuid import uuid4
+import asyncio
+import logging
 import os
+import re
+import time
 from dotenv import load_dotenv
 
+import config
+import metrics
+from metrics import InstrumentedAsyncQueuePool
+
 load_dotenv()
 
+
+def _async_url(url: str) -> str:
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+
 # Get DATABASE_URL and convert to async version
 DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is not set")
-if DATABASE_URL.startswith("postgresql://"):
-    DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+DATABASE_URL = _async_url(DATABASE_URL)
+
+logger = logging.getLogger(__name__)
+
+
+def pool_size_for_budget(max_connections: int, reserved: int, workers: int) -> int:
+    """
+    커넥션 예산을 워커 수로 나눈 워커당 풀 크기
+
+    워커마다 풀 밖에서 LISTEN 전용 커넥션 1개를 사용하므로 (events.py) 워커 수만큼 추가로 제외합니다.
+
+    Raises:
+        ValueError: 워커당 커넥션을 1개도 배정할 수 없는 경우
+    """
+    per_worker = (max_connections - reserved - workers) // workers
+    if per_worker < 1:
+        raise ValueError(
+            f"DB_MAX_CONNECTIONS={max_connections} is too small for {workers} workers "
+            f"(reserved={reserved}, plus one LISTEN connection per worker)"
+        )
+    return per_worker
+
+
+# 워커당 커넥션 수 상한 = pool_size (overflow 없음 - 모든 워커 합계가 예산을 넘지 않도록)
+POOL_SIZE = config.DB_POOL_SIZE or pool_size_for_budget(
+    config.DB_MAX_CONNECTIONS, config.DB_RESERVED_CONNECTIONS, config.WEB_CONCURRENCY
+)
+
+
+def _connect_args() -> dict:
+    if not config.DB_PGBOUNCER:
+        return {}
+    # pgBouncer transaction mode에서는 트랜잭션마다 서버 커넥션이 바뀌므로
+    # prepared statement를 캐시하면 다른 커넥션에서 찾지 못하거나 이름이 충돌함
+    return {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+
 
 # Create async engine
-# Using direct connection to Supabase (not through pgBouncer)
-# This allows us to use SQLAlchemy's connection pooling for better performance
+# - 풀 크기는 커넥션 예산(DB_MAX_CONNECTIONS)과 워커 수(WEB_CONCURRENCY)로 계산
+# - pool_pre_ping 대신 PoolMonitor가 백그라운드에서 유휴 커넥션을 확인 (체크아웃마다 왕복 1회 절약)
 engine = create_async_engine(
     DATABASE_URL,
     echo=False,  # Set to True for SQL logging
     future=True,
-    pool_size=5,  # Number of connections to keep in the pool
-    max_overflow=10,  # Maximum overflow connections
-    pool_pre_ping=True,  # Test connections before using them
-    pool_recycle=3600  # Recycle connections after 1 hour
+    poolclass=InstrumentedAsyncQueuePool,  # 커넥션 대기 시간 / 풀 상태를 /metrics로 노출
+    pool_size=POOL_SIZE,
+    max_overflow=0,
+    pool_timeout=config.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=config.DB_POOL_RECYCLE_SECONDS,
+    connect_args=_connect_args(),
 )
 
 # Create async session factory
@@ -33,6 +94,210 @@ AsyncSessionLocal = sessionmaker(
 )
 
 
+# ====================================================================================
+# 커넥션 풀 상태 / 생존 확인
+# ====================================================================================
+
+
+class PoolMonitor:
+    """
+    백그라운드 커넥션 생존 확인
+
+    주기마다 풀에서 커넥션 하나를 꺼내 SELECT 1을 실행합니다. (풀은 FIFO이므로 가장 오래 쉰
+    커넥션부터 확인) DB 재시작 등으로 끊긴 커넥션이 발견되면 SQLAlchemy가 풀 전체를 무효화하므로
+    이후 요청은 새 커넥션을 사용합니다.
+    """
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self.last_checked_at: Optional[datetime] = None
+        self.last_ok: Optional[bool] = None
+        self.last_latency_seconds: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.consecutive_failures = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def check(self) -> bool:
+        started_at = time.perf_counter()
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        except Exception as exc:
+            self.last_ok = False
+            self.last_error = str(exc)
+            self.consecutive_failures += 1
+            logger.warning(f"Database liveness check failed ({self.consecutive_failures} in a row): {exc}")
+        else:
+            self.last_ok = True
+            self.last_error = None
+            self.consecutive_failures = 0
+        self.last_checked_at = datetime.now(timezone.utc)
+        self.last_latency_seconds = time.perf_counter() - started_at
+        metrics.DB_LIVENESS_OK.set(1 if self.last_ok else 0)
+        return self.last_ok
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.check()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def status(self) -> dict:
+        """현재 워커의 풀 상태와 마지막 생존 확인 결과"""
+        pool = engine.sync_engine.pool
+        return {
+            "poolSize": pool.size(),
+            "checkedOut": pool.checkedout(),
+            "checkedIn": pool.checkedin(),
+            "timeoutSeconds": pool.timeout(),
+            "budget": {
+                "maxConnections": config.DB_MAX_CONNECTIONS,
+                "reserved": config.DB_RESERVED_CONNECTIONS,
+                "workers": config.WEB_CONCURRENCY,
+            },
+            "pgbouncer": config.DB_PGBOUNCER,
+            "liveness": {
+                "ok": self.last_ok,
+                "lastCheckedAt": self.last_checked_at.isoformat() if self.last_checked_at else None,
+                "latencyMs": round(self.last_latency_seconds * 1000, 2) if self.last_latency_seconds is not None else None,
+                "consecutiveFailures": self.consecutive_failures,
+                "lastError": self.last_error,
+            },
+        }
+
+
+pool_monitor = PoolMonitor(config.DB_LIVENESS_INTERVAL_SECONDS)
+
+
+# ====================================================================================
+# 요청별 쿼리 통계 / 느린 쿼리 로그 / N+1 감지
+# ====================================================================================
+
+
+class RepeatedQueryError(Exception):
+    """한 요청에서 같은 형태의 쿼리가 QUERY_REPEAT_LIMIT번을 넘게 실행됨 (QUERY_REPEAT_MODE=raise)"""
+
+
+# 바인드 파라미터 번호와 IN (...) 목록 길이를 무시하고 쿼리 형태 비교
+_BIND_PARAMS = re.compile(r"\$\d+(?:\s*,\s*\$\d+)*")
+
+
+def statement_shape(statement: str) -> str:
+    return _BIND_PARAMS.sub("?", statement)
+
+
+class QueryStats:
+    """요청 하나에서 실행된 SQL 통계"""
+
+    __slots__ = ("scope", "count", "seconds", "shapes")
+
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: Counter = Counter()
+
+    @property
+    def route(self) -> str:
+        # 라우팅 후에는 FastAPI가 scope["route"]에 매칭된 라우트를 넣어둠
+        route = self.scope.get("route")
+        return route.path if route is not None else "unmatched"
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+
+        if config.QUERY_REPEAT_MODE == "off":
+            return
+
+        shape = statement_shape(statement)
+        self.shapes[shape] += 1
+        if self.shapes[shape] == config.QUERY_REPEAT_LIMIT + 1:
+            message = (
+                f"Possible N+1 on {self.scope['method']} {self.route}: same statement ran more than "
+                f"{config.QUERY_REPEAT_LIMIT} times: {shape}"
+            )
+            if config.QUERY_REPEAT_MODE == "raise":
+                raise RepeatedQueryError(message)
+            logger.warning(message)
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """현재 요청의 쿼리 통계 (요청 밖이면 None)"""
+    return _current_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+    stats = _current_stats.get()
+
+    if elapsed * 1000 >= config.SLOW_QUERY_THRESHOLD_MS:
+        route = f"{stats.scope['method']} {stats.route}" if stats is not None else "(no request)"
+        logger.warning(f"Slow query ({elapsed * 1000:.1f} ms) on {route}: {statement_shape(statement)}")
+
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started_at"):
+        connection.info["query_started_at"].pop()
+
+
+def instrument_query_stats(async_engine) -> None:
+    """엔진에 요청별 쿼리 통계 / 느린 쿼리 로그 리스너 등록"""
+    event.listen(async_engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(async_engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(async_engine.sync_engine, "handle_error", _handle_error)
+
+
+instrument_query_stats(engine)
+
+
+class QueryStatsMiddleware:
+    """요청마다 SQL 실행 횟수와 DB 시간을 집계하여 /metrics와 debug 로그로 기록 (ASGI 미들웨어)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope)
+        token = _current_stats.set(stats)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_stats.reset(token)
+            metrics.observe_request_queries(stats.route, stats.count, stats.seconds)
+            logger.debug(
+                f"{scope['method']} {stats.route}: {stats.count} statements, {stats.seconds * 1000:.1f} ms in DB"
+            )
+
+
 # Dependency for getting DB session
 async def get_db():
     async with AsyncSessionLocal() as session:
@@ -40,3 +305,161 @@ async def get_db():
             yield session
         finally:
             await session.close()
+
+
+# ====================================================================================
+# 읽기 전용 복제본
+# ====================================================================================
+
+# 복제본이 재생한 WAL 위치 (복제본이 아닌 서버면 현재 위치)
+_REPLAYED_LSN = text("""
+    SELECT CASE WHEN pg_is_in_recovery() THEN pg_last_wal_replay_lsn() ELSE pg_current_wal_lsn() END - '0/0'::pg_lsn
+""")
+_PRIMARY_LSN = text("SELECT pg_current_wal_lsn() - '0/0'::pg_lsn")
+
+
+class ReplicaRouter:
+    """
+    복제본 라우팅 및 복제 지연 확인
+
+    주기마다 primary의 현재 WAL 위치를 기록하고 복제본이 재생한 위치와 비교합니다. 시각 t에 기록한
+    위치까지 재생했다면 복제본에는 t 이전에 커밋된 변경이 모두 있으므로, 복제본 데이터가 오래된 정도는
+    (지금 - 따라잡은 기록 중 가장 최근의 t) 이하입니다. 이 값이 max_lag_seconds 이하일 때만 복제본에서
+    읽습니다. 확인이 실패하거나 복제가 멈추면 값이 계속 커지므로 자동으로 primary로 돌아갑니다.
+    (복제 상태 뷰 조회 권한이 필요 없고, primary에 쓰기가 없는 동안에도 지연을 과대 평가하지 않음)
+    """
+
+    # 따라잡지 못한 primary 위치 기록 최대 개수
+    MAX_SAMPLES = 1000
+
+    def __init__(self, replica_engine, max_lag_seconds: float, interval_seconds: float):
+        self.engine = replica_engine
+        self.max_lag_seconds = max_lag_seconds
+        self.interval_seconds = interval_seconds
+        self.session_factory = (
+            sessionmaker(replica_engine, class_=AsyncSession, expire_on_commit=False)
+            if replica_engine is not None else None
+        )
+        self.last_error: Optional[str] = None
+        self._samples: Deque[Tuple[float, int]] = deque(maxlen=self.MAX_SAMPLES)
+        self._caught_up_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def configured(self) -> bool:
+        return self.engine is not None
+
+    def lag_seconds(self) -> Optional[float]:
+        """복제본 데이터가 오래되었을 수 있는 최대 시간 (한 번도 확인하지 못했으면 None)"""
+        if self._caught_up_at is None:
+            return None
+        return time.monotonic() - self._caught_up_at
+
+    def usable(self) -> bool:
+        lag = self.lag_seconds()
+        return self.configured and lag is not None and lag <= self.max_lag_seconds
+
+    async def _replayed_lsn(self) -> int:
+        async with self.engine.connect() as conn:
+            return int(await conn.scalar(_REPLAYED_LSN))
+
+    async def check(self) -> Optional[float]:
+        try:
+            async with engine.connect() as conn:
+                primary_lsn = int(await conn.scalar(_PRIMARY_LSN))
+            self._samples.append((time.monotonic(), primary_lsn))
+            replayed = await self._replayed_lsn()
+        except Exception as exc:
+            self.last_error = str(exc)
+            logger.warning(f"Replica lag check failed: {exc}")
+        else:
+            self.last_error = None
+            while self._samples and self._samples[0][1] <= replayed:
+                self._caught_up_at = self._samples.popleft()[0]
+
+        lag = self.lag_seconds()
+        metrics.DB_REPLICA_LAG.set(lag if lag is not None else float("inf"))
+        return lag
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.check()
+
+    async def start(self) -> None:
+        """복제본이 설정된 경우 지연 확인 시작 (첫 확인은 바로 실행)"""
+        if self.configured and self._task is None:
+            await self.check()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def status(self) -> dict:
+        lag = self.lag_seconds()
+        return {
+            "configured": self.configured,
+            "inUse": self.usable(),
+            "lagSeconds": round(lag, 3) if lag is not None else None,
+            "maxLagSeconds": self.max_lag_seconds,
+            "lastError": self.last_error,
+        }
+
+
+def _create_replica_engine():
+    if not config.DATABASE_REPLICA_URL:
+        return None
+
+    replica = create_async_engine(
+        _async_url(config.DATABASE_REPLICA_URL),
+        future=True,
+        pool_size=config.DB_REPLICA_POOL_SIZE or POOL_SIZE,
+        max_overflow=0,
+        pool_timeout=config.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=config.DB_POOL_RECYCLE_SECONDS,
+        connect_args=_connect_args(),
+    )
+    instrument_query_stats(replica)
+    return replica
+
+
+replica_router = ReplicaRouter(
+    _create_replica_engine(), config.REPLICA_MAX_LAG_SECONDS, config.REPLICA_LAG_CHECK_SECONDS
+)
+
+# 복제본을 사용할 수 없을 때의 조회 세션 (primary, 복제본과 같이 읽기 전용 트랜잭션)
+_PrimaryReadSessionLocal = sessionmaker(
+    engine.execution_options(postgresql_readonly=True),
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+
+
+def read_session_factory():
+    """조회 전용 세션 팩토리 - 복제 지연이 허용 범위 안이면 복제본, 아니면 primary"""
+    if replica_router.usable():
+        metrics.DB_READ_SESSIONS.labels("replica").inc()
+        return replica_router.session_factory
+
+    metrics.DB_READ_SESSIONS.labels("primary").inc()
+    return _PrimaryReadSessionLocal
+
+
+async def get_read_db():
+    """
+    조회 전용 API의 DB 세션 (Depends(get_read_db))
+
+    결과는 최대 REPLICA_MAX_LAG_SECONDS 전의 데이터일 수 있습니다. 트랜잭션이 읽기 전용이므로
+    변경이 필요하거나 방금 쓴 데이터를 다시 읽어야 하는 핸들러는 get_db(primary)를 사용하세요.
+    """
+    async with read_session_factory()() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
@@ -0,0 +1,227 @@
+"""
+실시간 이벤트 (남은 자리 수, 참가 신청 상태) pub/sub
+
+핸들러는 트랜잭션 안에서 publish_events (또는 publish_status_changes)를 호출합니다.
+- 커밋되면 현재 워커의 구독자에게 바로 전달합니다. (롤백되면 버림)
+- 같은 트랜잭션에서 pg_notify를 실행하므로 커밋 시 PostgreSQL이 다른 gunicorn 워커에
+  전달하고, 각 워커의 리스너가 자기 구독자에게 fan-out 합니다.
+
+워커마다 LISTEN 전용 커넥션 1개만 사용하며, 구독자(SSE 연결)는 DB를 사용하지 않습니다.
+(LISTEN 커넥션은 풀 밖에서 열리므로 database.py의 커넥션 예산 계산에 포함되어 있습니다.)
+
+토픽:
+- party:{party_id}                  남은 자리 수 변경
+- enrollment:{user_id}:{party_id}   참가 신청 상태 변경
+- invitation                        초대코드 변경 (Invitation 트리거가 발행, invitation_index.py)
+"""
+import asyncio
+import json
+import logging
+import os
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import asyncpg
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+import config
+import database
+import invitation_index
+import response_cache
+from occupancy import get_occupancy
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "vanta_events"
+
+# 구독자별 대기 이벤트 최대 개수 (느린 클라이언트는 오래된 이벤트부터 버림)
+SUBSCRIBER_QUEUE_SIZE = 16
+
+RECONNECT_DELAY_SECONDS = 5
+
+# SSE 연결 유지용 주석 전송 간격
+KEEPALIVE_SECONDS = 15
+
+
+def party_topic(party_id: int) -> str:
+    return f"party:{party_id}"
+
+
+def enrollment_topic(user_id: int, party_id: int) -> str:
+    return f"enrollment:{user_id}:{party_id}"
+
+
+class EventBroker:
+    """워커 내 구독자 관리 및 PostgreSQL LISTEN 리스너"""
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._listener_task: Optional[asyncio.Task] = None
+
+    @contextmanager
+    def subscribe(self, *topics: str):
+        """토픽 구독 - 블록을 벗어나면 구독 해제"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        for topic in topics:
+            self._subscribers.setdefault(topic, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            for topic in topics:
+                subscribers = self._subscribers.get(topic)
+                if subscribers is not None:
+                    subscribers.discard(queue)
+                    if not subscribers:
+                        del self._subscribers[topic]
+
+    def subscriber_count(self) -> int:
+        return len({queue for queues in self._subscribers.values() for queue in queues})
+
+    def publish_local(self, topic: str, data: dict) -> None:
+        """현재 워커의 구독자에게 이벤트 전달"""
+        if topic == invitation_index.TOPIC:
+            # 초대코드 트리거 알림 (구독자 없음)
+            invitation_index.invitation_index.apply(data)
+            return
+
+        if topic.startswith("party:"):
+            # 다른 워커에서 변경된 경우에도 응답 캐시 무효화
+            response_cache.invalidate(response_cache.party_info_key(int(topic.split(":")[1])))
+
+        for queue in self._subscribers.get(topic, ()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait((topic, data))
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        message = json.loads(payload)
+        if message.get("pid") == os.getpid():
+            # 현재 워커에서 발생한 이벤트는 커밋 시 이미 전달함
+            return
+        self.publish_local(message["topic"], message["data"])
+
+    async def _listen(self) -> None:
+        # LISTEN은 세션 단위 기능이므로 pgBouncer(transaction mode)를 거치지 않는 직접 연결 사용
+        dsn = (config.DATABASE_DIRECT_URL or database.DATABASE_URL).replace("postgresql+asyncpg://", "postgresql://", 1)
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(NOTIFY_CHANNEL, self._on_notify)
+                logger.info(f"Listening for events on '{NOTIFY_CHANNEL}'")
+                await closed.wait()
+                logger.warning("Event listener connection closed, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning(f"Event listener failed: {exc}")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    async def start(self) -> None:
+        """LISTEN 리스너 시작 (연결 실패 시 백그라운드에서 재시도)"""
+        if self._listener_task is None:
+            self._listener_task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+
+
+event_broker = EventBroker()
+
+
+async def publish_events(db: AsyncSession, events: List[Tuple[str, dict]]) -> None:
+    """
+    이벤트 발행 (트랜잭션 커밋 시 전달, 건수와 관계없이 쿼리 1회)
+
+    Args:
+        db: 상태 변경과 같은 트랜잭션의 세션
+        events: (토픽, JSON으로 직렬화 가능한 데이터) 목록
+    """
+    if not events:
+        return
+
+    pid = os.getpid()
+    payloads = [json.dumps({"pid": pid, "topic": topic, "data": data}) for topic, data in events]
+    await db.execute(
+        text("SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"),
+        {"channel": NOTIFY_CHANNEL, "payloads": payloads},
+    )
+    db.sync_session.info.setdefault("pending_events", []).extend(events)
+
+
+async def publish_status_changes(db: AsyncSession, changes: Iterable[Tuple[int, int, int, str]]) -> None:
+    """
+    Enrollment 상태 변경 이벤트와 파티별 남은 자리 수 이벤트 발행
+
+    Args:
+        db: 상태 변경과 같은 트랜잭션의 세션 (커밋 전에 호출)
+        changes: (user_id, party_id, enrollment_id, 새 상태) 목록
+    """
+    changes = list(changes)
+    events = [
+        (enrollment_topic(user_id, party_id), {"enrollmentId": enrollment_id, "partyId": party_id, "status": status})
+        for user_id, party_id, enrollment_id, status in changes
+    ]
+    for party_id in sorted({party_id for _, party_id, _, _ in changes}):
+        total_spots, enrolled_count = await get_occupancy(db, party_id)
+        events.append((party_topic(party_id), spots_payload(party_id, total_spots, enrolled_count)))
+
+    await publish_events(db, events)
+
+
+def spots_payload(party_id: int, total_spots: int, enrolled_count: int) -> dict:
+    return {
+        "partyId": party_id,
+        "totalSpots": total_spots,
+        "enrolledCount": enrolled_count,
+        "spotsLeft": max(0, total_spots - enrolled_count),
+    }
+
+
+def _format_sse(topic: str, data: dict) -> str:
+    event_name = "spots" if topic.startswith("party:") else "status"
+    return f"event: {event_name}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def stream_events(topics: List[str], initial: List[Tuple[str, dict]]):
+    """
+    SSE 스트림 생성 (StreamingResponse용)
+
+    현재 상태(initial)를 먼저 보내고, 이후 토픽에 발행되는 이벤트를 전달합니다.
+    클라이언트 연결이 끊기면 Starlette가 제너레이터를 취소하여 구독이 해제됩니다.
+    """
+    with event_broker.subscribe(*topics) as queue:
+        for topic, data in initial:
+            yield _format_sse(topic, data)
+
+        while True:
+            try:
+                topic, data = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield _format_sse(topic, data)
+
+
+@event.listens_for(Session, "after_commit")
+def _deliver_pending_events(session):
+    for topic, data in session.info.pop("pending_events", []):
+        event_broker.publish_local(topic, data)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session):
+    session.info.pop("pending_events", None)
@@ -0,0 +1,39 @@
+"""
+gunicorn 설정 (start.sh, railway.json, nixpacks.toml의 gunicorn이 현재 디렉토리에서 자동으로 읽음)
+
+워커 프로세스별 Prometheus 지표를 PROMETHEUS_MULTIPROC_DIR에 기록하도록 설정합니다.
+워커는 마스터에서 fork되므로 prometheus_client를 import하기 전에 환경변수를 설정해야 합니다.
+(이 파일에서는 prometheus_client를 최상단에서 import하지 않습니다.)
+
+워커 수는 WEB_CONCURRENCY(기본 4)로 정하며, 워커들도 같은 값을 읽어 DB 커넥션 예산을
+워커 수로 나눕니다. (database.py)
+"""
+import os
+import shutil
+import tempfile
+
+from dotenv import load_dotenv
+
+# 워커와 같은 값을 보도록 .env를 먼저 읽음 (이미 설정된 환경변수는 유지)
+load_dotenv()
+
+os.environ.setdefault("WEB_CONCURRENCY", "4")
+workers = int(os.environ["WEB_CONCURRENCY"])
+
+os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR",
+    os.path.join(os.getenv("SHARED_STATE_DIR", os.path.join(tempfile.gettempdir(), "vanta")), "metrics"),
+)
+
+
+def on_starting(server):
+    # 이전 실행의 지표 파일 정리 (카운터가 재시작 전 값에서 이어지지 않도록)
+    metrics_dir = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    # 종료된 워커의 처리 중 요청 수 / 커넥션 풀 gauge를 합산에서 제외
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
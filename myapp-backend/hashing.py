@@ -0,0 +1,130 @@
+"""
+비밀번호 해시 전용 워커 풀
+
+bcrypt 해시/검증은 호출당 수백 ms의 CPU를 사용합니다. async 핸들러 안에서 직접
+실행하면 같은 Uvicorn 워커의 다른 요청이 모두 멈추므로, 전용 스레드 풀에서 실행합니다.
+(bcrypt는 해시 계산 중 GIL을 해제하므로 스레드 수만큼 병렬로 처리됩니다.)
+
+대기 중인 작업이 BCRYPT_QUEUE_LIMIT를 넘으면 PasswordHasherBusy를 발생시켜
+요청을 즉시 거절합니다.
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+import config
+import metrics
+
+
+class PasswordHasherBusy(Exception):
+    """해시 워커 풀이 포화 상태일 때 발생"""
+
+
+class _HasherStats:
+    """해시 워커 풀 지표 (이벤트 루프 스레드에서만 갱신)"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+        self.run_seconds_total = 0.0
+        self.max_latency_seconds = 0.0
+
+
+_executor = ThreadPoolExecutor(
+    max_workers=config.BCRYPT_WORKERS,
+    thread_name_prefix="bcrypt",
+)
+_stats = _HasherStats()
+
+
+def _timed(func, enqueued_at: float, *args):
+    """워커 스레드에서 실행: (결과, 대기 시간, 실행 시간) 반환"""
+    started_at = time.perf_counter()
+    result = func(*args)
+    return result, started_at - enqueued_at, time.perf_counter() - started_at
+
+
+def _release() -> None:
+    _stats.in_flight -= 1
+
+
+def _release_from_worker(loop: asyncio.AbstractEventLoop) -> None:
+    """작업 완료 콜백 (워커 스레드에서 실행) - 이벤트 루프 스레드에서 in_flight 차감"""
+    try:
+        loop.call_soon_threadsafe(_release)
+    except RuntimeError:
+        # 이벤트 루프가 이미 종료됨
+        _release()
+
+
+async def _run(operation: str, func, *args):
+    if _stats.in_flight >= config.BCRYPT_WORKERS + config.BCRYPT_QUEUE_LIMIT:
+        _stats.rejected += 1
+        metrics.PASSWORD_HASH_REJECTED.inc()
+        raise PasswordHasherBusy(
+            f"bcrypt pool saturated (in_flight={_stats.in_flight}, "
+            f"workers={config.BCRYPT_WORKERS}, queue_limit={config.BCRYPT_QUEUE_LIMIT})"
+        )
+
+    _stats.in_flight += 1
+    loop = asyncio.get_running_loop()
+    job = _executor.submit(_timed, func, time.perf_counter(), *args)
+    # 요청이 취소되어도 워커 스레드의 작업은 계속 실행되므로 작업이 실제로 끝날 때 차감
+    job.add_done_callback(lambda _: _release_from_worker(loop))
+
+    result, waited, ran = await asyncio.wrap_future(job)
+
+    _stats.completed += 1
+    _stats.wait_seconds_total += waited
+    _stats.run_seconds_total += ran
+    _stats.max_latency_seconds = max(_stats.max_latency_seconds, waited + ran)
+    metrics.observe_password_hash(operation, waited, ran)
+    return result
+
+
+def _hash(password: str) -> str:
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+
+
+def _verify(password: str, hashed: str) -> bool:
+    return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+
+
+async def hash_password(password: str) -> str:
+    """
+    비밀번호를 bcrypt로 해시
+
+    Raises:
+        PasswordHasherBusy: 워커 풀 대기열이 가득 찬 경우
+    """
+    return await _run("hash", _hash, password)
+
+
+async def verify_password(password: str, hashed: str) -> bool:
+    """
+    비밀번호와 bcrypt 해시 비교
+
+    Raises:
+        PasswordHasherBusy: 워커 풀 대기열이 가득 찬 경우
+    """
+    return await _run("verify", _verify, password, hashed)
+
+
+def get_stats() -> dict:
+    """현재 워커 풀 상태 (대기열 길이, 누적 지연 시간 등)"""
+    completed = _stats.completed
+    return {
+        "workers": config.BCRYPT_WORKERS,
+        "queueLimit": config.BCRYPT_QUEUE_LIMIT,
+        "inFlight": _stats.in_flight,
+        "queueDepth": max(0, _stats.in_flight - config.BCRYPT_WORKERS),
+        "completed": completed,
+        "rejected": _stats.rejected,
+        "avgWaitSeconds": _stats.wait_seconds_total / completed if completed else 0.0,
+        "avgRunSeconds": _stats.run_seconds_total / completed if completed else 0.0,
+        "maxLatencySeconds": _stats.max_latency_seconds,
+    }
@@ -0,0 +1,117 @@
+"""
+초대코드 인덱스 (워커 프로세스 메모리)
+
+/auth/invitation/verify 요청의 대부분은 오타나 추측한 코드입니다. 워커 시작 시 모든 초대코드와
+활성화 여부를 메모리에 올려두고, 없는 코드나 비활성화된 코드는 DB 조회 없이 응답합니다.
+
+갱신:
+- Invitation 트리거(models.py)가 추가 / 변경 / 삭제를 pg_notify로 알리고,
+  이벤트 리스너(events.py)가 받아서 apply로 반영합니다.
+- 리스너가 재연결되는 동안 놓친 알림은 INVITATION_INDEX_REFRESH_SECONDS마다 전체를 다시 읽어 맞춥니다.
+
+인덱스에 활성 코드로 있는 경우에는 DB에서 다시 확인하므로, 관리자가 코드를 비활성화하면
+알림이 도착하기 전이라도 바로 거절됩니다. 인덱스를 아직 불러오지 못한 경우에는 항상 DB를 조회합니다.
+"""
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+import config
+import database
+import metrics
+import repository
+
+logger = logging.getLogger(__name__)
+
+TOPIC = "invitation"
+
+
+class InvitationIndex:
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._codes: Dict[str, bool] = {}
+        self._loaded = False
+        # 전체 조회 중에 도착한 알림 (조회 결과보다 나중 상태이므로 조회 후 다시 적용)
+        self._pending: Optional[List[dict]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def lookup(self, code: str) -> Optional[bool]:
+        """
+        초대코드 상태
+
+        Returns:
+            True(활성) / False(비활성) / None(없는 코드)
+        """
+        is_active = self._codes.get(code)
+        metrics.INVITATION_INDEX_LOOKUPS.labels(
+            "unknown" if is_active is None else "active" if is_active else "inactive"
+        ).inc()
+        return is_active
+
+    def apply(self, change: dict) -> None:
+        """트리거 알림 반영 - {"code": ..., "isActive": true / false / null(삭제)}"""
+        if self._pending is not None:
+            self._pending.append(change)
+
+        if change["isActive"] is None:
+            self._codes.pop(change["code"], None)
+        else:
+            self._codes[change["code"]] = change["isActive"]
+
+    async def load(self) -> None:
+        """모든 초대코드를 다시 읽어 인덱스 교체"""
+        self._pending = []
+        try:
+            async with database.AsyncSessionLocal() as db:
+                rows = await repository.get_invitation_states(db)
+            codes = {code: is_active for code, is_active in rows}
+            for change in self._pending:
+                if change["isActive"] is None:
+                    codes.pop(change["code"], None)
+                else:
+                    codes[change["code"]] = change["isActive"]
+        finally:
+            self._pending = None
+
+        self._codes = codes
+        self._loaded = True
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                await self.load()
+            except Exception as exc:
+                # 이전 인덱스를 계속 사용 (비활성화는 DB 확인으로 반영됨)
+                logger.warning(f"Invitation index refresh failed: {exc}")
+
+    async def start(self) -> None:
+        """인덱스를 불러오고 주기적 갱신 시작 (불러오지 못하면 DB 조회로 동작)"""
+        if not config.INVITATION_INDEX_ENABLED or self._task is not None:
+            return
+        try:
+            await self.load()
+            logger.info(f"Loaded {len(self._codes)} invitation codes")
+        except Exception as exc:
+            logger.warning(f"Invitation index load failed, verifying codes in the database: {exc}")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def clear(self) -> None:
+        self._codes = {}
+        self._loaded = False
+
+
+invitation_index = InvitationIndex(config.INVITATION_INDEX_REFRESH_SECONDS)
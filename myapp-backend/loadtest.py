@@ -0,0 +1,593 @@
+#!/usr/bin/env python3
+"""
+부하 테스트 (asyncio + httpx)
+
+로컬에서 실행한 서버와 로컬 PostgreSQL을 대상으로 실제 사용 패턴을 동시에 재현하고
+라우트별 RPS, 지연시간 백분위수(p50/p95/p99), 오류율을 JSON으로 출력합니다.
+
+시나리오:
+- signup:  초대코드 검증부터 비밀번호 저장까지 회원가입 6단계를 동시에 진행
+- login:   동시 로그인
+- enroll:  같은 파티에 동시 참가 신청
+- coupon:  승인된 유저의 쿠폰 조회 + 현장 쿠폰 사용 (한 유저가 두 번 동시에 누르는 경우 포함)
+- approve: 관리자가 승인 대기 목록 조회 후 동시에 승인
+
+테스트 데이터(초대코드, 유저, 파티, 참가 신청)는 --database-url의 DB에 직접 생성하고
+실행이 끝나면 (실패해도) 삭제합니다. .env의 DATABASE_URL(보통 운영 DB)은 사용하지 않으며,
+로컬이 아닌 호스트는 --i-know 없이는 거부합니다.
+access token은 서버와 같은 JWT_SECRET_KEY로 직접 발급합니다. (로그인 부하와 분리)
+
+사용법:
+    # gunicorn 서버(워커 4개)를 직접 띄워서 실행 (서버도 --database-url의 DB 사용)
+    python loadtest.py --database-url postgresql://postgres@localhost/vanta_load \
+        --start-server --workers 4 --users 200 --output results.json
+
+    # 이미 실행 중인 서버 대상 (서버와 같은 DB, 승인 시나리오는 ADMIN_USER_IDS에 포함된 유저 ID 필요)
+    python loadtest.py --database-url postgresql://postgres@localhost/vanta_load \
+        --base-url http://127.0.0.1:8000 --admin-user-id 1 --scenarios login enroll
+
+    # 두 실행 결과 비교
+    python loadtest.py --compare before.json after.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+from uuid import uuid4
+
+import bcrypt
+import httpx
+
+SCENARIOS = ("signup", "login", "enroll", "coupon", "approve")
+
+LOAD_PASSWORD = "load-test-password"
+
+LOCAL_HOSTS = {"", "localhost", "127.0.0.1", "::1"}
+
+
+def is_local_database(url: str) -> bool:
+    """로컬 PostgreSQL인지 확인 (localhost 또는 unix socket)"""
+    parts = urlsplit(url)
+    socket_dirs = parse_qs(parts.query).get("host", [])
+    if socket_dirs:
+        return all(host.startswith("/") or host in LOCAL_HOSTS for host in socket_dirs)
+    return (parts.hostname or "") in LOCAL_HOSTS
+
+
+# ====================================================================================
+# 지표 수집
+# ====================================================================================
+
+
+class RouteStats:
+    """라우트 하나의 응답 시간 및 결과 집계"""
+
+    __slots__ = ("latencies", "statuses", "errors", "not_ok")
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.statuses: Counter = Counter()
+        # 연결 오류 / 타임아웃 / 4xx / 5xx
+        self.errors = 0
+        # 200이지만 본문이 ok/valid=false 인 응답 (중복 신청, 이미 사용한 쿠폰 등)
+        self.not_ok = 0
+
+    def summary(self, duration: float) -> dict:
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        return {
+            "requests": count,
+            "rps": round(count / duration, 2) if duration else 0.0,
+            "errorRate": round(self.errors / count, 4) if count else 0.0,
+            "errors": self.errors,
+            "notOk": self.not_ok,
+            "statuses": dict(sorted(self.statuses.items())),
+            "latencyMs": {
+                "min": _ms(latencies[0]) if count else None,
+                "p50": _ms(_percentile(latencies, 50)),
+                "p95": _ms(_percentile(latencies, 95)),
+                "p99": _ms(_percentile(latencies, 99)),
+                "max": _ms(latencies[-1]) if count else None,
+                "mean": _ms(sum(latencies) / count) if count else None,
+            },
+        }
+
+
+def _percentile(sorted_values: List[float], percent: float) -> Optional[float]:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+class Recorder:
+    """요청을 보내고 라우트(경로 템플릿)별로 결과를 기록"""
+
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+        self.routes: Dict[str, RouteStats] = {}
+
+    async def request(self, method: str, route: str, url: str, **kwargs) -> Optional[dict]:
+        """
+        Args:
+            method: HTTP 메서드
+            route: 집계 키로 쓸 경로 템플릿 (예: "/coupon/{user_id}/{party_id}")
+            url: 실제 요청 경로
+
+        Returns:
+            JSON 응답 본문 (오류 시 None)
+        """
+        stats = self.routes.setdefault(f"{method} {route}", RouteStats())
+        started_at = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            stats.latencies.append(time.perf_counter() - started_at)
+            stats.errors += 1
+            stats.statuses["error"] += 1
+            return None
+        stats.latencies.append(time.perf_counter() - started_at)
+        stats.statuses[str(response.status_code)] += 1
+
+        if response.status_code >= 400:
+            stats.errors += 1
+            return None
+
+        body = response.json()
+        if isinstance(body, dict) and (body.get("ok") is False or body.get("valid") is False):
+            stats.not_ok += 1
+        return body
+
+
+# ====================================================================================
+# 테스트 데이터
+# ====================================================================================
+
+
+class LoadData:
+    """실행 하나에서 사용하는 시드 데이터"""
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self.invitation_code = f"LOAD-{run_id}"
+        self.invitation_id: Optional[int] = None
+        self.user_ids: List[int] = []
+        self.login_ids: List[str] = []
+        self.admin_id: Optional[int] = None
+        self.enroll_party_id: Optional[int] = None
+        self.coupon_party_id: Optional[int] = None
+        self.approve_party_id: Optional[int] = None
+        self.pending_enrollment_ids: List[int] = []
+
+
+async def seed(users: int) -> LoadData:
+    """DATABASE_URL의 DB에 시나리오용 데이터 생성"""
+    from sqlalchemy import insert
+
+    from database import AsyncSessionLocal, engine
+    from models import Enrollment, Invitation, Party, User
+    from occupancy import adjust_approved_count
+
+    data = LoadData(uuid4().hex[:8])
+    password_hash = bcrypt.hashpw(LOAD_PASSWORD.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                insert(Invitation).values(code=data.invitation_code, is_active=True).returning(Invitation.id)
+            )
+            invitation_id = data.invitation_id = result.scalar_one()
+
+            rows = [
+                {
+                    "userId": f"load-{data.run_id}-{i}",
+                    "name": f"부하테스트{i}",
+                    "password": password_hash,
+                    "birthday": "2000-01-01",
+                    "phone": f"load-{data.run_id}-{i}",
+                    "invitationId": invitation_id,
+                }
+                for i in range(users + 1)
+            ]
+            result = await db.execute(insert(User).values(rows).returning(User.id, User.userId))
+            created = result.all()
+            data.admin_id = created[0].id
+            data.user_ids = [row.id for row in created[1:]]
+            data.login_ids = [row.userId for row in created[1:]]
+
+            result = await db.execute(
+                insert(Party)
+                .values([{"name": f"Load test {data.run_id} ({kind})", "capacity": users} for kind in ("enroll", "coupon", "approve")])
+                .returning(Party.id)
+            )
+            data.enroll_party_id, data.coupon_party_id, data.approve_party_id = result.scalars().all()
+
+            await adjust_approved_count(db, data.coupon_party_id, len(data.user_ids))
+            await db.execute(
+                insert(Enrollment).values([
+                    {"userId": user_id, "partyId": data.coupon_party_id, "enrolled": True, "status": "approved", "couponUsed": False}
+                    for user_id in data.user_ids
+                ])
+            )
+
+            result = await db.execute(
+                insert(Enrollment).values([
+                    {"userId": user_id, "partyId": data.approve_party_id, "enrolled": True, "status": "pending", "couponUsed": False}
+                    for user_id in data.user_ids
+                ]).returning(Enrollment.id)
+            )
+            data.pending_enrollment_ids = list(result.scalars().all())
+
+            await db.commit()
+    finally:
+        await engine.dispose()
+
+    return data
+
+
+async def cleanup(data: LoadData) -> None:
+    """시드 데이터와 시나리오가 만든 행(회원가입 유저, 참가 신청) 삭제"""
+    from sqlalchemy import delete, or_, select, update
+
+    from database import AsyncSessionLocal, engine
+    from models import Enrollment, Invitation, Party, PartyStats, User
+
+    party_ids = [p for p in (data.enroll_party_id, data.coupon_party_id, data.approve_party_id) if p is not None]
+    # 시나리오의 회원가입 유저도 같은 초대코드로 가입함
+    run_users = select(User.id).where(User.invitationId == data.invitation_id).scalar_subquery()
+
+    try:
+        async with AsyncSessionLocal() as db:
+            try:
+                await db.execute(delete(Enrollment).where(
+                    or_(Enrollment.userId.in_(run_users), Enrollment.partyId.in_(party_ids))
+                ))
+                await db.execute(delete(PartyStats).where(PartyStats.partyId.in_(party_ids)))
+                await db.execute(delete(Party).where(Party.id.in_(party_ids)))
+                await db.execute(delete(User).where(User.invitationId == data.invitation_id))
+                await db.execute(delete(Invitation).where(Invitation.id == data.invitation_id))
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                # 삭제하지 못해도 초대코드로 가입할 수 없도록 비활성화
+                await db.execute(update(Invitation).where(Invitation.id == data.invitation_id).values(is_active=False))
+                await db.commit()
+                raise
+    finally:
+        await engine.dispose()
+
+
+def access_token(user_id: int) -> str:
+    from auth import create_access_token
+    return create_access_token(data={"user_id": user_id})
+
+
+def auth_headers(user_id: int) -> dict:
+    return {"Authorization": f"Bearer {access_token(user_id)}"}
+
+
+# ====================================================================================
+# 시나리오
+# ====================================================================================
+
+
+async def _gather_limited(concurrency: int, coroutines) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(coroutine):
+        async with semaphore:
+            await coroutine
+
+    await asyncio.gather(*[limited(coroutine) for coroutine in coroutines])
+
+
+async def scenario_signup(recorder: Recorder, data: LoadData, concurrency: int) -> None:
+    async def signup(i: int):
+        body = await recorder.request(
+            "POST", "/auth/invitation/verify", "/auth/invitation/verify",
+            json={"invitation_code": data.invitation_code},
+        )
+        if not body or not body.get("valid"):
+            return
+
+        session_id = body["sessionId"]
+        steps = [
+            ("/auth/register/name", {"name": f"가입테스트{i}"}),
+            ("/auth/register/birthday", {"birthday": "2000-01-01"}),
+            ("/auth/register/phone", {"phone": f"load-{data.run_id}-s{i}"}),
+            ("/auth/register/userid", {"user_id": f"load-{data.run_id}-s{i}"}),
+            ("/auth/register/password", {"password": LOAD_PASSWORD}),
+        ]
+        for path, payload in steps:
+            body = await recorder.request("PUT", path, path, json={"session_id": session_id, **payload})
+            if not body or not body.get("ok"):
+                return
+
+    await _gather_limited(concurrency, [signup(i) for i in range(len(data.user_ids))])
+
+
+async def scenario_login(recorder: Recorder, data: LoadData, concurrency: int) -> None:
+    async def login(login_id: str):
+        await recorder.request(
+            "POST", "/auth/login", "/auth/login", json={"user_id": login_id, "password": LOAD_PASSWORD}
+        )
+
+    await _gather_limited(concurrency, [login(login_id) for login_id in data.login_ids])
+
+
+async def scenario_enroll(recorder: Recorder, data: LoadData, concurrency: int) -> None:
+    async def enroll(user_id: int):
+        await recorder.request(
+            "POST", "/enroll", "/enroll",
+            json={"user_id": user_id, "party_id": data.enroll_party_id},
+            headers=auth_headers(user_id),
+        )
+
+    await _gather_limited(concurrency, [enroll(user_id) for user_id in data.user_ids])
+
+
+async def scenario_coupon(recorder: Recorder, data: LoadData, concurrency: int) -> None:
+    async def redeem(user_id: int):
+        headers = auth_headers(user_id)
+        party_id = data.coupon_party_id
+        await recorder.request(
+            "GET", "/coupon/{user_id}/{party_id}", f"/coupon/{user_id}/{party_id}", headers=headers
+        )
+        # 현장에서 버튼을 두 번 누르는 경우 (한 번만 redeemed)
+        await asyncio.gather(*[
+            recorder.request(
+                "PUT", "/coupon/use", "/coupon/use",
+                json={"user_id": user_id, "party_id": party_id}, headers=headers,
+            )
+            for _ in range(2)
+        ])
+
+    await _gather_limited(concurrency, [redeem(user_id) for user_id in data.user_ids])
+
+
+async def scenario_approve(recorder: Recorder, data: LoadData, concurrency: int) -> None:
+    headers = auth_headers(data.admin_id)
+    await recorder.request(
+        "GET", "/admin/enrollments/pending", "/admin/enrollments/pending", headers=headers
+    )
+
+    async def approve(enrollment_id: int):
+        await recorder.request(
+            "POST", "/admin/enrollments/approve", "/admin/enrollments/approve",
+            json={"enrollment_id": enrollment_id}, headers=headers,
+        )
+
+    await _gather_limited(concurrency, [approve(enrollment_id) for enrollment_id in data.pending_enrollment_ids])
+
+
+SCENARIO_FUNCTIONS = {
+    "signup": scenario_signup,
+    "login": scenario_login,
+    "enroll": scenario_enroll,
+    "coupon": scenario_coupon,
+    "approve": scenario_approve,
+}
+
+
+async def run_scenarios(base_url: str, data: LoadData, scenarios: List[str], concurrency: int, timeout: float) -> List[dict]:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    results = []
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+        for name in scenarios:
+            recorder = Recorder(client)
+            started_at = time.perf_counter()
+            await SCENARIO_FUNCTIONS[name](recorder, data, concurrency)
+            duration = time.perf_counter() - started_at
+
+            routes = {route: stats.summary(duration) for route, stats in recorder.routes.items()}
+            total = sum(route["requests"] for route in routes.values())
+            errors = sum(route["errors"] for route in routes.values())
+            results.append({
+                "scenario": name,
+                "durationSeconds": round(duration, 3),
+                "requests": total,
+                "rps": round(total / duration, 2) if duration else 0.0,
+                "errorRate": round(errors / total, 4) if total else 0.0,
+                "routes": routes,
+            })
+            print(f"  {name}: {total} requests in {duration:.2f}s", file=sys.stderr)
+    return results
+
+
+# ====================================================================================
+# 서버 실행
+# ====================================================================================
+
+
+def start_server(port: int, workers: int, admin_id: int) -> subprocess.Popen:
+    """start.sh와 같은 gunicorn 구성으로 로컬 서버 실행"""
+    env = dict(os.environ)
+    env["ADMIN_USER_IDS"] = ",".join(filter(None, [env.get("ADMIN_USER_IDS", ""), str(admin_id)]))
+    env.setdefault("REGISTER_SESSION_BACKEND", "shared")
+    # 가상 유저가 모두 127.0.0.1에서 접속하므로 IP별 요청 수 제한은 끔
+    env.setdefault("RATE_LIMIT_ENABLED", "false")
+    # 워커 수는 gunicorn.conf.py와 DB 커넥션 예산 계산이 같은 값을 읽도록 환경변수로 전달
+    env["WEB_CONCURRENCY"] = str(workers)
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "gunicorn", "main:app",
+            "-k", "uvicorn.workers.UvicornWorker",
+            "--bind", f"127.0.0.1:{port}",
+            "--log-level", "warning",
+        ],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+    )
+
+
+async def wait_until_ready(base_url: str, workers: int = 1, timeout: float = 30) -> None:
+    """
+    /ready가 연속으로 workers번 200을 반환할 때까지 대기
+
+    /health는 warm-up 전에도 200이므로 첫 측정 요청에 콜드 스타트가 섞이지 않도록 /ready를 확인합니다.
+    요청마다 연결을 새로 열어 여러 워커에 나눠 보냅니다. (어느 워커가 받을지는 보장되지 않음)
+    """
+    deadline = time.monotonic() + timeout
+    ready = 0
+    async with httpx.AsyncClient(base_url=base_url, headers={"Connection": "close"}) as client:
+        while ready < workers:
+            try:
+                ready = ready + 1 if (await client.get("/ready")).status_code == 200 else 0
+            except httpx.HTTPError:
+                ready = 0
+            if ready < workers:
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"Server at {base_url} did not become ready")
+                await asyncio.sleep(0.2)
+
+
+# ====================================================================================
+# 결과 출력 / 비교
+# ====================================================================================
+
+
+def print_table(results: List[dict]) -> None:
+    header = f"{'route':<42} {'reqs':>6} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'err%':>6}"
+    for result in results:
+        print(f"\n[{result['scenario']}] {result['rps']} req/s, {result['durationSeconds']}s", file=sys.stderr)
+        print(header, file=sys.stderr)
+        for route, stats in result["routes"].items():
+            latency = stats["latencyMs"]
+            print(
+                f"{route:<42} {stats['requests']:>6} {stats['rps']:>8} "
+                f"{latency['p50']:>8} {latency['p95']:>8} {latency['p99']:>8} {stats['errorRate'] * 100:>6.1f}",
+                file=sys.stderr,
+            )
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """두 결과 파일의 라우트별 RPS / p95 / p99 변화 출력"""
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+
+    def by_route(report):
+        return {
+            (result["scenario"], route): stats
+            for result in report["scenarios"]
+            for route, stats in result["routes"].items()
+        }
+
+    old, new = by_route(before), by_route(after)
+    print(f"{'scenario / route':<54} {'rps':>18} {'p95 ms':>18} {'p99 ms':>18}")
+    for key in sorted(old.keys() & new.keys()):
+        a, b = old[key], new[key]
+        print(
+            f"{key[0] + ' ' + key[1]:<54} "
+            f"{_change(a['rps'], b['rps']):>18} "
+            f"{_change(a['latencyMs']['p95'], b['latencyMs']['p95']):>18} "
+            f"{_change(a['latencyMs']['p99'], b['latencyMs']['p99']):>18}"
+        )
+
+
+def _change(before: Optional[float], after: Optional[float]) -> str:
+    if not before or after is None:
+        return f"{before} -> {after}"
+    return f"{before} -> {after} ({(after - before) / before * 100:+.0f}%)"
+
+
+# ====================================================================================
+# 실행
+# ====================================================================================
+
+
+async def main(args) -> dict:
+    print(f"Seeding {args.users} users...", file=sys.stderr)
+    data = await seed(args.users)
+
+    server = None
+    base_url = args.base_url
+    try:
+        if args.start_server:
+            base_url = f"http://127.0.0.1:{args.port}"
+            server = start_server(args.port, args.workers, data.admin_id)
+        elif args.admin_user_id is not None:
+            data.admin_id = args.admin_user_id
+
+        await wait_until_ready(base_url, args.workers if args.start_server else 1)
+        print(f"Running {', '.join(args.scenarios)} against {base_url}", file=sys.stderr)
+        results = await run_scenarios(base_url, data, args.scenarios, args.concurrency or args.users, args.timeout)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+        print("Removing seeded data...", file=sys.stderr)
+        await cleanup(data)
+
+    return {
+        "startedAt": datetime.now(timezone.utc).isoformat(),
+        "baseUrl": base_url,
+        "runId": data.run_id,
+        "config": {
+            "users": args.users,
+            "concurrency": args.concurrency or args.users,
+            "workers": args.workers if args.start_server else None,
+        },
+        "scenarios": results,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Vanta API load test")
+    parser.add_argument("--database-url", help="테스트 데이터를 만들 DB (필수, .env의 DATABASE_URL은 사용하지 않음)")
+    parser.add_argument("--i-know", action="store_true", help="로컬이 아닌 DB 호스트 허용")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="대상 서버 (--start-server가 없을 때)")
+    parser.add_argument("--start-server", action="store_true", help="gunicorn 서버를 직접 실행")
+    parser.add_argument("--port", type=int, default=8100, help="--start-server 사용 시 포트")
+    parser.add_argument("--workers", type=int, default=4, help="--start-server 사용 시 gunicorn 워커 수")
+    parser.add_argument("--admin-user-id", type=int, help="실행 중인 서버의 ADMIN_USER_IDS에 포함된 유저 ID")
+    parser.add_argument("--users", type=int, default=100, help="시나리오별 가상 유저 수")
+    parser.add_argument("--concurrency", type=int, help="동시에 진행하는 가상 유저 수 (기본값: --users)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃(초)")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--output", help="JSON 결과 파일 (없으면 stdout)")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="두 결과 파일 비교")
+    args = parser.parse_args(argv)
+
+    if not args.compare:
+        if not args.database_url:
+            parser.error("--database-url is required (the .env DATABASE_URL is never used for seeding)")
+        if not is_local_database(args.database_url) and not args.i_know:
+            parser.error(f"refusing to seed a non-local database ({urlsplit(args.database_url).hostname}); pass --i-know")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        sys.exit(0)
+
+    # database.py가 import 시 읽기 전에 설정 (load_dotenv는 이미 있는 환경변수를 덮어쓰지 않음,
+    # --start-server로 띄운 서버도 이 값을 물려받음)
+    os.environ["DATABASE_URL"] = args.database_url
+
+    report = asyncio.run(main(args))
+    print_table(report["scenarios"])
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+        print(f"\nResults written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
@@ -1,17 +1,37 @@
-from fastapi import FastAPI, Depends, Request, status, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Depends, Query, Request, status, HTTPException
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, ValidationError
-from uuid import uuid4
-import bcrypt
+from typing import List, Literal, Optional, Tuple
+from contextlib import asynccontextmanager
 import logging
+import math
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 import config
-from database import get_db
-from models import Invitation, RegisterSession, User, Enrollment
-from auth import get_current_user, get_current_admin_user
+from database import QueryStatsMiddleware, get_db, get_read_db, pool_monitor, replica_router
+from models import User, Enrollment
+from auth import get_current_user, get_current_admin_user, get_token_user_id
+from user_cache import CachedUser
+from pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page, order_by_keyset, split_page
+import schemas
+from schemas import listing_response
+from export import stream_export
+from register_sessions import register_session_store
+import response_cache
+import metrics
+import repository
+from occupancy import get_occupancy, reserve_spots, adjust_approved_count
+from events import (
+    event_broker, enrollment_topic, party_topic, publish_status_changes, spots_payload, stream_events
+)
+from hashing import PasswordHasherBusy, hash_password, verify_password, get_stats as get_hashing_stats
+import rate_limit
+from rate_limit import RateLimited, client_ip
+from invitation_index import invitation_index
+from warmup import readiness
 
 # 로깅 설정
 logging.basicConfig(
@@ -20,7 +40,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 다른 워커에서 발생한 실시간 이벤트 수신 (LISTEN)
+    await event_broker.start()
+    # 유휴 커넥션 생존 확인 (pool_pre_ping 대체)
+    await pool_monitor.start()
+    # 읽기 전용 복제본 지연 확인 (DATABASE_REPLICA_URL 설정 시)
+    await replica_router.start()
+    # 풀 커넥션 / 자주 실행되는 조회 / 초대코드 인덱스 준비 후 /ready 응답
+    await readiness.start()
+    try:
+        yield
+    finally:
+        await readiness.stop()
+        await replica_router.stop()
+        await pool_monitor.stop()
+        await event_broker.stop()
+
+
+# 응답은 orjson으로 직렬화 (라우트별 응답 형식은 schemas.py)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# 요청별 SQL 실행 횟수 / DB 시간, 느린 쿼리 로그, N+1 감지
+app.add_middleware(QueryStatsMiddleware)
+# 라우트별 처리 시간 / 처리 중 요청 수 (/metrics)
+app.add_middleware(metrics.MetricsMiddleware)
 
 # ====================================================================================
 # CORS 설정
@@ -65,6 +111,26 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
         content={"ok": False, "message": "데이터베이스 오류가 발생했습니다."}
     )
 
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    """비밀번호 해시 워커 풀 포화 시 요청 거절"""
+    logger.warning(f"Password hasher busy: {exc}")
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "1"},
+        content={"ok": False, "message": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."}
+    )
+
+@app.exception_handler(RateLimited)
+async def rate_limited_handler(request: Request, exc: RateLimited):
+    """요청 수 제한 초과 (해시 / DB 작업 전에 거절)"""
+    logger.warning(f"Rate limited ({exc.limit.name}) from {client_ip(request)}")
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+        content={"ok": False, "message": "요청이 너무 많습니다. 잠시 후 다시 시도해주세요."}
+    )
+
 @app.exception_handler(ValueError)
 async def value_error_handler(request: Request, exc: ValueError):
     """ValueError 처리"""
@@ -78,10 +144,31 @@ async def value_error_handler(request: Request, exc: ValueError):
 # 헬스 체크 API
 # ====================================================================================
 
-@app.get("/health")
-async def health_check():
+@app.get("/health", response_model=schemas.HealthResponse)
+async def health_check(request: Request):
     """서버 상태 확인"""
-    return {"status": "ok", "service": "vanta-backend"}
+    async def build():
+        return {"status": "ok", "service": "vanta-backend"}
+
+    return await response_cache.cached_json(request, "health", config.HEALTH_CACHE_TTL_SECONDS, build)
+
+
+@app.get("/ready", response_model=schemas.ReadyResponse)
+async def ready_check():
+    """트래픽을 받을 준비 확인 (워커 시작 시 warm-up이 끝나기 전에는 503)"""
+    if not readiness.ready:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=readiness.status())
+    return readiness.status()
+
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics(request: Request):
+    """Prometheus 지표 (gunicorn 워커 전체 합산, METRICS_TOKEN 설정 시 Bearer 토큰 필요)"""
+    if config.METRICS_TOKEN and request.headers.get("authorization") != f"Bearer {config.METRICS_TOKEN}":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="인증이 필요합니다.")
+
+    body, content_type = metrics.render()
+    return Response(content=body, media_type=content_type)
 
 # ====================================================================================
 # 초대코드 검증 API
@@ -92,27 +179,45 @@ class InvitationReq(BaseModel):
     invitation_code: str
 
 
-@app.post("/auth/invitation/verify")
-async def verify_invitation(req: InvitationReq, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Invitation).where(Invitation.code == req.invitation_code)
-    )
-    invitation = result.scalar_one_or_none()
+async def check_invitation(db: AsyncSession, code: str) -> Tuple[Optional[int], Optional[str]]:
+    """
+    초대코드 확인
+
+    없는 코드 / 비활성화된 코드는 초대코드 인덱스만으로 응답하고, 활성 코드는 DB에서 다시 확인합니다.
+
+    Returns:
+        (Invitation id, None) 또는 (None, 실패 메시지)
+    """
+    if invitation_index.loaded:
+        is_active = invitation_index.lookup(code)
+        if is_active is None:
+            return None, "초대코드가 유효하지 않습니다."
+        if not is_active:
+            return None, "비활성화된 초대코드입니다."
+
+    invitation = await repository.get_invitation_by_code(db, code)
 
     if not invitation:
-        return {"valid": False, "message": "초대코드가 유효하지 않습니다."}
+        return None, "초대코드가 유효하지 않습니다."
 
     if not invitation.is_active:
-        return {"valid": False, "message": "비활성화된 초대코드입니다."}
+        return None, "비활성화된 초대코드입니다."
 
-    session_id = uuid4().hex
+    return invitation.id, None
 
-    new_session = RegisterSession(
-        sessionId=session_id,
-        invitationId=invitation.id,
-    )
-    db.add(new_session)
-    await db.commit()
+
+@app.post("/auth/invitation/verify", response_model=schemas.InvitationResponse)
+async def verify_invitation(req: InvitationReq, request: Request, db: AsyncSession = Depends(get_db)):
+    # 같은 IP / 초대코드로 요청이 몰리면 DB 조회 전에 거절
+    await rate_limit.enforce(rate_limit.INVITATION_PER_IP, client_ip(request))
+    await rate_limit.enforce(rate_limit.INVITATION_PER_CODE, req.invitation_code)
+
+    invitation_id, message = await check_invitation(db, req.invitation_code)
+    if invitation_id is None:
+        return {"valid": False, "message": message}
+
+    # 회원가입 세션은 세션 저장소에 보관 (DB는 마지막 단계에서만 사용)
+    session_id = await register_session_store.create(invitation_id)
 
     return {"valid": True, "sessionId": session_id}
 
@@ -127,22 +232,20 @@ class LoginReq(BaseModel):
     password: str
 
 
-@app.post("/auth/login")
-async def login(req: LoginReq, db: AsyncSession = Depends(get_db)):
-    # userId로 유저 찾기
-    result = await db.execute(
-        select(User).where(User.userId == req.user_id)
-    )
-    user = result.scalar_one_or_none()
+@app.post("/auth/login", response_model=schemas.LoginResponse)
+async def login(req: LoginReq, request: Request, db: AsyncSession = Depends(get_db)):
+    # 같은 IP / 아이디로 시도가 몰리면 bcrypt 검증과 DB 조회 전에 거절
+    await rate_limit.enforce(rate_limit.LOGIN_PER_IP, client_ip(request))
+    await rate_limit.enforce(rate_limit.LOGIN_PER_USER, req.user_id)
+
+    # userId로 유저 찾기 (id, name, 비밀번호 해시만 조회)
+    user = await repository.get_login_user(db, req.user_id)
 
     if not user:
         return {"ok": False, "message": "아이디 또는 비밀번호가 일치하지 않습니다."}
 
-    # 비밀번호 검증
-    password_match = bcrypt.checkpw(
-        req.password.encode("utf-8"),
-        user.password.encode("utf-8")
-    )
+    # 비밀번호 검증 (전용 워커 풀에서 실행)
+    password_match = await verify_password(req.password, user.password)
 
     if not password_match:
         return {"ok": False, "message": "아이디 또는 비밀번호가 일치하지 않습니다."}
@@ -171,19 +274,11 @@ class NameReq(BaseModel):
     name: str
 
 
-@app.put("/auth/register/name")
-async def save_name(req: NameReq, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(RegisterSession).where(RegisterSession.sessionId == req.session_id)
-    )
-    session = result.scalar_one_or_none()
-
-    if not session:
+@app.put("/auth/register/name", response_model=schemas.RegisterStepResponse)
+async def save_name(req: NameReq):
+    if not await register_session_store.update(req.session_id, name=req.name):
         return {"ok": False, "message": "세션이 만료되었습니다."}
 
-    session.name = req.name
-    await db.commit()
-
     return {"ok": True}
 
 
@@ -197,19 +292,11 @@ class BirthReq(BaseModel):
     birthday: str
 
 
-@app.put("/auth/register/birthday")
-async def save_birthday(req: BirthReq, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(RegisterSession).where(RegisterSession.sessionId == req.session_id)
-    )
-    session = result.scalar_one_or_none()
-
-    if not session:
+@app.put("/auth/register/birthday", response_model=schemas.RegisterStepResponse)
+async def save_birthday(req: BirthReq):
+    if not await register_session_store.update(req.session_id, birthday=req.birthday):
         return {"ok": False, "message": "세션이 만료되었습니다."}
 
-    session.birthday = req.birthday
-    await db.commit()
-
     return {"ok": True}
 
 
@@ -223,12 +310,9 @@ class PhoneReq(BaseModel):
     phone: str
 
 
-@app.put("/auth/register/phone")
+@app.put("/auth/register/phone", response_model=schemas.RegisterStepResponse)
 async def save_phone(req: PhoneReq, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(RegisterSession).where(RegisterSession.sessionId == req.session_id)
-    )
-    session = result.scalar_one_or_none()
+    session = await register_session_store.get(req.session_id)
 
     if not session:
         return {"ok": False, "message": "세션이 만료되었습니다."}
@@ -237,16 +321,11 @@ async def save_phone(req: PhoneReq, db: AsyncSession = Depends(get_db)):
         return {"ok": False, "message": "이전 단계가 완료되지 않았습니다."}
 
     # 이미 사용 중인 전화번호인지 확인
-    result = await db.execute(
-        select(User).where(User.phone == req.phone)
-    )
-    existing_user = result.scalar_one_or_none()
-
-    if existing_user:
+    if await repository.phone_taken(db, req.phone):
         return {"ok": False, "message": "이미 사용 중인 전화번호입니다."}
 
-    session.phone = req.phone
-    await db.commit()
+    if not await register_session_store.update(req.session_id, phone=req.phone):
+        return {"ok": False, "message": "세션이 만료되었습니다."}
 
     return {"ok": True}
 
@@ -261,12 +340,9 @@ class UserIdReq(BaseModel):
     user_id: str
 
 
-@app.put("/auth/register/userid")
+@app.put("/auth/register/userid", response_model=schemas.RegisterStepResponse)
 async def save_user_id(req: UserIdReq, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(RegisterSession).where(RegisterSession.sessionId == req.session_id)
-    )
-    session = result.scalar_one_or_none()
+    session = await register_session_store.get(req.session_id)
 
     if not session:
         return {"ok": False, "message": "세션이 만료되었습니다."}
@@ -275,16 +351,11 @@ async def save_user_id(req: UserIdReq, db: AsyncSession = Depends(get_db)):
         return {"ok": False, "message": "이전 단계가 완료되지 않았습니다."}
 
     # 이미 사용 중인 userId인지 확인
-    result = await db.execute(
-        select(User).where(User.userId == req.user_id)
-    )
-    existing_user = result.scalar_one_or_none()
-
-    if existing_user:
+    if await repository.user_id_taken(db, req.user_id):
         return {"ok": False, "message": "이미 사용 중인 ID입니다."}
 
-    session.userId = req.user_id
-    await db.commit()
+    if not await register_session_store.update(req.session_id, userId=req.user_id):
+        return {"ok": False, "message": "세션이 만료되었습니다."}
 
     return {"ok": True}
 
@@ -299,12 +370,9 @@ class PasswordReq(BaseModel):
     password: str
 
 
-@app.put("/auth/register/password")
+@app.put("/auth/register/password", response_model=schemas.RegisterResponse)
 async def save_password(req: PasswordReq, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(RegisterSession).where(RegisterSession.sessionId == req.session_id)
-    )
-    session = result.scalar_one_or_none()
+    session = await register_session_store.get(req.session_id)
 
     if not session:
         return {"ok": False, "message": "세션이 만료되었습니다."}
@@ -312,12 +380,12 @@ async def save_password(req: PasswordReq, db: AsyncSession = Depends(get_db)):
     if not session.name or not session.birthday or not session.phone or not session.userId:
         return {"ok": False, "message": "이전 단계가 완료되지 않았습니다."}
 
-    # 비밀번호 해시 처리
-    salt = bcrypt.gensalt()
-    hashed_password = bcrypt.hashpw(req.password.encode("utf-8"), salt).decode("utf-8")
+    # 비밀번호 해시 처리 (전용 워커 풀에서 실행)
+    hashed_password = await hash_password(req.password)
 
     # 최종 User 생성
-    new_user = User(
+    new_user_id, message = await insert_user(
+        db,
         userId=session.userId,
         name=session.name,
         password=hashed_password,
@@ -325,22 +393,110 @@ async def save_password(req: PasswordReq, db: AsyncSession = Depends(get_db)):
         phone=session.phone,
         invitationId=session.invitationId,
     )
-    db.add(new_user)
-    await db.commit()
-    await db.refresh(new_user)
+    if new_user_id is None:
+        return {"ok": False, "message": message}
+
+    await register_session_store.delete(req.session_id)
+
+    return register_success(new_user_id)
+
+
+# ====================================================================================
+# 한 번에 회원가입 (초대코드 검증 ~ User 생성)
+# ====================================================================================
+
+# 같은 전화번호 가입을 직렬화하는 advisory lock (두 int4 키 - 마이그레이션 잠금과 겹치지 않음)
+PHONE_LOCK_NAMESPACE = 7_340_023
+
+
+async def insert_user(db: AsyncSession, **fields) -> Tuple[Optional[int], Optional[str]]:
+    """
+    User 생성 (트랜잭션 하나)
+
+    전화번호는 유니크 제약이 없으므로 같은 번호의 가입을 advisory lock으로 직렬화하고 다시 확인합니다.
+    userId는 유니크 인덱스 위반을 잡아 중복 메시지로 응답합니다. (앞 단계의 확인 후 동시에 가입한 경우)
 
-    # JWT 토큰 생성 (회원가입 완료 시 자동 로그인)
+    Returns:
+        (새 User id, None) 또는 (None, 실패 메시지)
+    """
+    await db.execute(select(func.pg_advisory_xact_lock(PHONE_LOCK_NAMESPACE, func.hashtext(fields["phone"]))))
+    if await repository.phone_taken(db, fields["phone"]):
+        await db.rollback()
+        return None, "이미 사용 중인 전화번호입니다."
+
+    try:
+        result = await db.execute(insert(User).values(**fields).returning(User.id))
+        new_user_id = result.scalar_one()
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        return None, "이미 사용 중인 ID입니다."
+
+    return new_user_id, None
+
+
+def register_success(user_id: int) -> dict:
+    """회원가입 완료 응답 (자동 로그인용 JWT 포함)"""
     from auth import create_access_token
-    access_token = create_access_token(data={"user_id": new_user.id})
+    access_token = create_access_token(data={"user_id": user_id})
 
     return {
         "ok": True,
-        "userId": new_user.id,
+        "userId": user_id,
         "accessToken": access_token,
         "tokenType": "bearer"
     }
 
 
+class RegisterReq(BaseModel):
+    invitation_code: str
+    name: str
+    birthday: str
+    phone: str
+    user_id: str
+    password: str
+
+
+@app.post("/auth/register", response_model=schemas.RegisterResponse)
+async def register(req: RegisterReq, request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    단계별 API(초대코드 검증 → 이름 → 생년월일 → 휴대폰 → 아이디 → 비밀번호)를 요청 한 번으로 처리
+
+    회원가입 세션을 사용하지 않으며, 중복 확인 후 비밀번호를 해시하고 User를 한 트랜잭션에서 생성합니다.
+    """
+    # 초대코드 검증과 같은 요청 수 제한 (초대코드 추측 방지)
+    await rate_limit.enforce(rate_limit.INVITATION_PER_IP, client_ip(request))
+    await rate_limit.enforce(rate_limit.INVITATION_PER_CODE, req.invitation_code)
+
+    invitation_id, message = await check_invitation(db, req.invitation_code)
+    if invitation_id is None:
+        return {"ok": False, "message": message}
+
+    if await repository.phone_taken(db, req.phone):
+        return {"ok": False, "message": "이미 사용 중인 전화번호입니다."}
+
+    if await repository.user_id_taken(db, req.user_id):
+        return {"ok": False, "message": "이미 사용 중인 ID입니다."}
+
+    # bcrypt 해시 동안 커넥션을 붙잡지 않도록 조회 트랜잭션 종료
+    await db.rollback()
+    hashed_password = await hash_password(req.password)
+
+    new_user_id, message = await insert_user(
+        db,
+        userId=req.user_id,
+        name=req.name,
+        password=hashed_password,
+        birthday=req.birthday,
+        phone=req.phone,
+        invitationId=invitation_id,
+    )
+    if new_user_id is None:
+        return {"ok": False, "message": message}
+
+    return register_success(new_user_id)
+
+
 # ====================================================================================
 # 파티 참가 (Enroll)
 # ====================================================================================
@@ -351,10 +507,10 @@ class EnrollReq(BaseModel):
     party_id: int
 
 
-@app.post("/enroll")
+@app.post("/enroll", response_model=schemas.EnrollResponse)
 async def enroll_party(
     req: EnrollReq,
-    current_user: User = Depends(get_current_user),
+    current_user: CachedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     # 권한 확인: 자신만 파티에 등록 가능
@@ -364,42 +520,29 @@ async def enroll_party(
             detail="권한이 없습니다."
         )
 
-    # 유저 존재 확인
-    result = await db.execute(select(User).where(User.id == req.user_id))
-    user = result.scalar_one_or_none()
-
-    if not user:
-        return {"ok": False, "message": "유저를 찾을 수 없습니다."}
-
-    # 이미 참가했는지 확인 (중복 레코드가 있을 경우 가장 최근 것을 사용)
+    # 새로운 참가 기록 생성 (승인 대기 상태)
+    # (userId, partyId) 유니크 제약으로 동시 요청이 와도 한 행만 생성됨
     result = await db.execute(
-        select(Enrollment).where(
-            Enrollment.userId == req.user_id,
-            Enrollment.partyId == req.party_id
-        ).order_by(Enrollment.createdAt.desc())
+        insert(Enrollment)
+        .values(userId=req.user_id, partyId=req.party_id, enrolled=True, status="pending")
+        .on_conflict_do_nothing(index_elements=[Enrollment.userId, Enrollment.partyId])
+        .returning(Enrollment.id)
     )
-    existing = result.scalars().first()
+    new_enrollment_id = result.scalar_one_or_none()
+    await db.commit()
 
-    if existing:
-        if existing.status == "pending":
-            return {"ok": True, "message": "참가 신청이 승인 대기 중입니다.", "enrollment_id": existing.id, "status": "pending"}
-        elif existing.status == "approved":
-            return {"ok": True, "message": "이미 참가한 파티입니다.", "enrollment_id": existing.id, "status": "approved"}
-        elif existing.status == "rejected":
-            return {"ok": False, "message": "참가 신청이 거절되었습니다.", "enrollment_id": existing.id, "status": "rejected"}
+    if new_enrollment_id is not None:
+        return {"ok": True, "message": "파티 참가 신청이 완료되었습니다. 운영진의 승인을 기다려주세요.", "enrollment_id": new_enrollment_id, "status": "pending"}
 
-    # 새로운 참가 기록 생성 (승인 대기 상태)
-    new_enrollment = Enrollment(
-        userId=req.user_id,
-        partyId=req.party_id,
-        enrolled=True,
-        status="pending"
-    )
-    db.add(new_enrollment)
-    await db.commit()
-    await db.refresh(new_enrollment)
+    # 이미 참가 신청한 경우 기존 상태 반환
+    existing = await repository.get_enrollment(db, req.user_id, req.party_id)
 
-    return {"ok": True, "message": "파티 참가 신청이 완료되었습니다. 운영진의 승인을 기다려주세요.", "enrollment_id": new_enrollment.id, "status": "pending"}
+    if existing.status == "approved":
+        return {"ok": True, "message": "이미 참가한 파티입니다.", "enrollment_id": existing.id, "status": "approved"}
+    elif existing.status == "rejected":
+        return {"ok": False, "message": "참가 신청이 거절되었습니다.", "enrollment_id": existing.id, "status": "rejected"}
+
+    return {"ok": True, "message": "참가 신청이 승인 대기 중입니다.", "enrollment_id": existing.id, "status": existing.status}
 
 
 # ====================================================================================
@@ -407,15 +550,9 @@ async def enroll_party(
 # ====================================================================================
 
 
-@app.get("/enrollment/check/{user_id}/{party_id}")
-async def check_enrollment(user_id: int, party_id: int, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Enrollment).where(
-            Enrollment.userId == user_id,
-            Enrollment.partyId == party_id
-        ).order_by(Enrollment.createdAt.desc())
-    )
-    enrollment = result.scalars().first()
+@app.get("/enrollment/check/{user_id}/{party_id}", response_model=schemas.EnrollmentCheckResponse)
+async def check_enrollment(user_id: int, party_id: int, db: AsyncSession = Depends(get_read_db)):
+    enrollment = await repository.get_enrollment(db, user_id, party_id)
 
     return {"enrolled": enrollment is not None}
 
@@ -425,34 +562,64 @@ async def check_enrollment(user_id: int, party_id: int, db: AsyncSession = Depen
 # ====================================================================================
 
 
-@app.get("/party/{party_id}/info")
-async def get_party_info(party_id: int, db: AsyncSession = Depends(get_db)):
-    """파티 정보와 남은 자리 수를 조회"""
-    # 승인된 enrollment 수 카운트
-    result = await db.execute(
-        select(Enrollment).where(
-            Enrollment.partyId == party_id,
-            Enrollment.status == "approved"
-        )
-    )
-    approved_enrollments = result.scalars().all()
-    enrolled_count = len(approved_enrollments)
+@app.get("/party/{party_id}/info", response_model=schemas.PartyInfoResponse)
+async def get_party_info(party_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    파티 정보와 남은 자리 수를 조회 (응답 캐시, 승인/거절 이벤트 발생 시 모든 워커에서 무효화)
+
+    무효화 직후 다시 만드는 캐시 항목이 커밋 이전 값이 되지 않도록 복제본이 아닌 primary에서 읽습니다.
+    """
+    async def build():
+        # 정원(Party)과 승인 인원 카운터(PartyStats)를 한 번에 조회
+        total_spots, enrolled_count = await get_occupancy(db, party_id)
+        spots_left = max(0, total_spots - enrolled_count)
+
+        return {
+            "ok": True,
+            "partyId": party_id,
+            "totalSpots": total_spots,
+            "enrolledCount": enrolled_count,
+            "spotsLeft": spots_left
+        }
 
-    # 파티별 총 정원 (하드코딩 - 추후 Party 모델 추가 시 DB에서 가져오기)
-    party_capacities = {
-        1: 50,  # After-Christmas Party
-    }
+    return await response_cache.cached_json(
+        request, response_cache.party_info_key(party_id), config.PARTY_INFO_CACHE_TTL_SECONDS, build
+    )
 
-    total_spots = party_capacities.get(party_id, 50)
-    spots_left = max(0, total_spots - enrolled_count)
 
-    return {
-        "ok": True,
-        "partyId": party_id,
-        "totalSpots": total_spots,
-        "enrolledCount": enrolled_count,
-        "spotsLeft": spots_left
-    }
+@app.get("/party/{party_id}/events")
+async def stream_party_events(party_id: int, token: Optional[str] = None, db: AsyncSession = Depends(get_db)):
+    """
+    남은 자리 수와 본인 참가 신청 상태 실시간 스트림 (Server-Sent Events)
+
+    연결 직후 현재 상태를 보내고, 이후 승인/거절될 때마다 이벤트를 보냅니다.
+    - event: spots   {"partyId", "totalSpots", "enrolledCount", "spotsLeft"}
+    - event: status  {"enrollmentId", "partyId", "status"} (token을 보낸 경우)
+
+    EventSource는 헤더를 보낼 수 없으므로 access token은 token 쿼리 파라미터로 받습니다.
+    스트림이 열려 있는 동안에는 DB 커넥션을 사용하지 않습니다.
+    """
+    # 스트림을 열기 전에 토큰부터 확인 (유효하지 않으면 401)
+    user_id = get_token_user_id(token) if token else None
+
+    total_spots, enrolled_count = await get_occupancy(db, party_id)
+    topics = [party_topic(party_id)]
+    initial = [(topics[0], spots_payload(party_id, total_spots, enrolled_count))]
+
+    if user_id is not None:
+        enrollment = await repository.get_enrollment(db, user_id, party_id)
+        topics.append(enrollment_topic(user_id, party_id))
+        initial.append((topics[1], {
+            "enrollmentId": enrollment.id if enrollment else None,
+            "partyId": party_id,
+            "status": enrollment.status if enrollment else None,
+        }))
+
+    return StreamingResponse(
+        stream_events(topics, initial),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 # ====================================================================================
@@ -460,71 +627,73 @@ async def get_party_info(party_id: int, db: AsyncSession = Depends(get_db)):
 # ====================================================================================
 
 
-@app.get("/enrollments")
+# 관리자 목록에서 직렬화하는 컬럼만 조회
+# (schemas.ENROLLMENT_ITEM_FIELDS + ENROLLMENT_USER_FIELDS 순서, 행을 그대로 응답으로 직렬화)
+ENROLLMENT_LIST_COLUMNS = (
+    Enrollment.id,
+    Enrollment.partyId,
+    Enrollment.enrolled,
+    Enrollment.createdAt,
+    User.id.label("user_id"),
+    User.name,
+    User.birthday,
+    User.phone,
+)
+
+
+# 목록 API 공통 쿼리 파라미터
+# - cursor/limit: (createdAt, id) 기준 keyset 페이지네이션 (응답의 nextCursor를 다음 요청에 전달)
+#   limit 기본값 DEFAULT_PAGE_SIZE(100), 최대 MAX_PAGE_SIZE(500). 응답의 count는 이 페이지의 항목 수
+# - format: csv 또는 ndjson이면 페이지 없이 전체 목록을 스트리밍으로 내보냄
+ExportFormat = Optional[Literal["csv", "ndjson"]]
+
+
+@app.get("/enrollments", response_model=schemas.EnrollmentListResponse)
 async def get_all_enrollments(
-    admin_user: User = Depends(get_current_admin_user),
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    export_format: ExportFormat = Query(None, alias="format"),
+    admin_user: CachedUser = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """모든 enrollment 정보를 User 정보와 함께 조회 (관리자 전용)"""
-    result = await db.execute(
-        select(Enrollment).join(User)
-    )
-    enrollments = result.scalars().all()
+    # User 정보는 JOIN으로 한 번에 조회 (행마다 추가 쿼리 없음)
+    stmt = select(*ENROLLMENT_LIST_COLUMNS).join(User, Enrollment.userId == User.id)
 
-    result_list = []
-    for enrollment in enrollments:
-        # Load user relationship
-        await db.refresh(enrollment, ["user"])
-        result_list.append(
-            {
-                "id": enrollment.id,
-                "partyId": enrollment.partyId,
-                "enrolled": enrollment.enrolled,
-                "createdAt": enrollment.createdAt.isoformat(),
-                "user": {
-                    "id": enrollment.user.id,
-                    "name": enrollment.user.name,
-                    "birthday": enrollment.user.birthday,
-                    "phone": enrollment.user.phone,
-                },
-            }
-        )
+    if export_format:
+        return stream_export(order_by_keyset(stmt), export_format, "enrollments")
+
+    result = await db.execute(keyset_page(stmt, cursor, limit))
+    rows, next_cursor = split_page(result.all(), limit)
 
-    return {"enrollments": result_list, "total": len(result_list)}
+    return listing_response(rows, schemas.ENROLLMENT_ITEM_FIELDS, schemas.ENROLLMENT_USER_FIELDS, next_cursor)
 
 
-@app.get("/enrollments/party/{party_id}")
+@app.get("/enrollments/party/{party_id}", response_model=schemas.PartyEnrollmentListResponse)
 async def get_party_enrollments(
     party_id: int,
-    admin_user: User = Depends(get_current_admin_user),
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    export_format: ExportFormat = Query(None, alias="format"),
+    admin_user: CachedUser = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """특정 파티의 enrollment 정보를 User 정보와 함께 조회 (관리자 전용)"""
-    result = await db.execute(
-        select(Enrollment).where(Enrollment.partyId == party_id).join(User)
+    stmt = (
+        select(*ENROLLMENT_LIST_COLUMNS)
+        .join(User, Enrollment.userId == User.id)
+        .where(Enrollment.partyId == party_id)
     )
-    enrollments = result.scalars().all()
 
-    result_list = []
-    for enrollment in enrollments:
-        # Load user relationship
-        await db.refresh(enrollment, ["user"])
-        result_list.append(
-            {
-                "id": enrollment.id,
-                "partyId": enrollment.partyId,
-                "enrolled": enrollment.enrolled,
-                "createdAt": enrollment.createdAt.isoformat(),
-                "user": {
-                    "id": enrollment.user.id,
-                    "name": enrollment.user.name,
-                    "birthday": enrollment.user.birthday,
-                    "phone": enrollment.user.phone,
-                },
-            }
-        )
+    if export_format:
+        return stream_export(order_by_keyset(stmt), export_format, f"enrollments-party-{party_id}")
 
-    return {"partyId": party_id, "enrollments": result_list, "total": len(result_list)}
+    result = await db.execute(keyset_page(stmt, cursor, limit))
+    rows, next_cursor = split_page(result.all(), limit)
+
+    return listing_response(
+        rows, schemas.ENROLLMENT_ITEM_FIELDS, schemas.ENROLLMENT_USER_FIELDS, next_cursor, partyId=party_id
+    )
 
 
 # ====================================================================================
@@ -532,56 +701,54 @@ async def get_party_enrollments(
 # ====================================================================================
 
 
-@app.get("/admin/enrollments/pending")
+@app.get("/admin/enrollments/pending", response_model=schemas.PendingEnrollmentListResponse)
 async def get_pending_enrollments(
-    admin_user: User = Depends(get_current_admin_user),
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    export_format: ExportFormat = Query(None, alias="format"),
+    admin_user: CachedUser = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """승인 대기 중인 enrollment 목록 조회 (관리자 전용)"""
-    result = await db.execute(
-        select(Enrollment)
+    """승인 대기 중인 enrollment 목록 조회 (관리자 전용, 최신순)"""
+    stmt = (
+        select(
+            Enrollment.id,
+            Enrollment.partyId,
+            Enrollment.status,
+            Enrollment.createdAt,
+            User.id.label("user_id"),
+            User.userId,
+            User.name,
+            User.birthday,
+            User.phone,
+        )
+        .join(User, Enrollment.userId == User.id)
         .where(Enrollment.status == "pending")
-        .join(User)
-        .order_by(Enrollment.createdAt.desc())
     )
-    enrollments = result.scalars().all()
 
-    result_list = []
-    for enrollment in enrollments:
-        # Load user relationship
-        await db.refresh(enrollment, ["user"])
-        result_list.append(
-            {
-                "id": enrollment.id,
-                "partyId": enrollment.partyId,
-                "status": enrollment.status,
-                "createdAt": enrollment.createdAt.isoformat(),
-                "user": {
-                    "id": enrollment.user.id,
-                    "userId": enrollment.user.userId,
-                    "name": enrollment.user.name,
-                    "birthday": enrollment.user.birthday,
-                    "phone": enrollment.user.phone,
-                },
-            }
-        )
+    if export_format:
+        return stream_export(order_by_keyset(stmt, descending=True), export_format, "enrollments-pending")
 
-    return {"ok": True, "enrollments": result_list, "total": len(result_list)}
+    result = await db.execute(keyset_page(stmt, cursor, limit, descending=True))
+    rows, next_cursor = split_page(result.all(), limit)
+
+    return listing_response(rows, schemas.PENDING_ITEM_FIELDS, schemas.PENDING_USER_FIELDS, next_cursor, ok=True)
 
 
 class EnrollmentApprovalReq(BaseModel):
     enrollment_id: int
 
 
-@app.post("/admin/enrollments/approve")
+@app.post("/admin/enrollments/approve", response_model=schemas.EnrollmentDecisionResponse)
 async def approve_enrollment(
     req: EnrollmentApprovalReq,
-    admin_user: User = Depends(get_current_admin_user),
+    admin_user: CachedUser = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Enrollment 승인 (관리자 전용)"""
+    """Enrollment 승인 (관리자 전용, 정원 초과 시 거부)"""
+    # 동시 승인 시 카운터가 중복 증가하지 않도록 행 잠금
     result = await db.execute(
-        select(Enrollment).where(Enrollment.id == req.enrollment_id)
+        select(Enrollment).where(Enrollment.id == req.enrollment_id).with_for_update()
     )
     enrollment = result.scalar_one_or_none()
 
@@ -591,23 +758,28 @@ async def approve_enrollment(
     if enrollment.status == "approved":
         return {"ok": True, "message": "이미 승인된 enrollment입니다."}
 
-    # 승인 처리
+    # 정원 확인 후 승인 처리 (카운터 행 잠금으로 동시 승인 시에도 정원 초과 방지)
+    if not await reserve_spots(db, enrollment.partyId, 1):
+        await db.rollback()
+        return {"ok": False, "message": "정원이 가득 차서 승인할 수 없습니다."}
+
     enrollment.status = "approved"
+    await publish_status_changes(db, [(enrollment.userId, enrollment.partyId, enrollment.id, "approved")])
     await db.commit()
     await db.refresh(enrollment)
 
     return {"ok": True, "message": "Enrollment가 승인되었습니다.", "enrollment_id": enrollment.id}
 
 
-@app.post("/admin/enrollments/reject")
+@app.post("/admin/enrollments/reject", response_model=schemas.EnrollmentDecisionResponse)
 async def reject_enrollment(
     req: EnrollmentApprovalReq,
-    admin_user: User = Depends(get_current_admin_user),
+    admin_user: CachedUser = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Enrollment 거절 (관리자 전용)"""
     result = await db.execute(
-        select(Enrollment).where(Enrollment.id == req.enrollment_id)
+        select(Enrollment).where(Enrollment.id == req.enrollment_id).with_for_update()
     )
     enrollment = result.scalar_one_or_none()
 
@@ -617,25 +789,124 @@ async def reject_enrollment(
     if enrollment.status == "rejected":
         return {"ok": True, "message": "이미 거절된 enrollment입니다."}
 
-    # 거절 처리
+    # 거절 처리 (승인 상태였다면 승인 인원 차감)
+    if enrollment.status == "approved":
+        await adjust_approved_count(db, enrollment.partyId, -1)
     enrollment.status = "rejected"
+    await publish_status_changes(db, [(enrollment.userId, enrollment.partyId, enrollment.id, "rejected")])
     await db.commit()
     await db.refresh(enrollment)
 
     return {"ok": True, "message": "Enrollment가 거절되었습니다.", "enrollment_id": enrollment.id}
 
 
+class BulkEnrollmentStatusReq(BaseModel):
+    enrollment_ids: List[int]
+    status: Literal["approved", "rejected"]
+
+
+@app.post("/admin/enrollments/bulk", response_model=schemas.BulkUpdateResponse)
+async def bulk_update_enrollments(
+    req: BulkEnrollmentStatusReq,
+    admin_user: CachedUser = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    여러 Enrollment를 한 번에 승인/거절 (관리자 전용)
+
+    건수와 관계없이 조회(잠금) 1회 + UPDATE 1회 + 파티별 카운터 갱신으로 처리합니다.
+    결과는 요청한 id마다 updated / unchanged / not_found / capacity_exceeded 중 하나로 반환합니다.
+    승인 시 정원이 부족하면 요청 순서대로 남은 자리만큼만 승인합니다.
+    """
+    enrollment_ids = list(dict.fromkeys(req.enrollment_ids))
+
+    if not enrollment_ids:
+        return {"ok": False, "message": "처리할 enrollment가 없습니다."}
+
+    if len(enrollment_ids) > config.BULK_ENROLLMENT_MAX:
+        return {"ok": False, "message": f"한 번에 최대 {config.BULK_ENROLLMENT_MAX}건까지 처리할 수 있습니다."}
+
+    # 대상 행 잠금 (id 순서로 잠가 동시 일괄 처리 간 교착 방지)
+    result = await db.execute(
+        select(Enrollment.id, Enrollment.userId, Enrollment.partyId, Enrollment.status)
+        .where(Enrollment.id.in_(enrollment_ids))
+        .order_by(Enrollment.id)
+        .with_for_update()
+    )
+    current = {row.id: row for row in result}
+
+    candidates = [id for id in enrollment_ids if id in current and current[id].status != req.status]
+    by_party = {}
+    for id in candidates:
+        by_party.setdefault(current[id].partyId, []).append(id)
+
+    changed_ids = []
+    over_capacity = set()
+    for party_id in sorted(by_party):
+        ids = by_party[party_id]
+        if req.status == "approved":
+            # 남은 자리만큼만 승인
+            granted = await reserve_spots(db, party_id, len(ids))
+            changed_ids.extend(ids[:granted])
+            over_capacity.update(ids[granted:])
+        else:
+            # 승인 상태였던 건만큼 승인 인원 차감
+            was_approved = sum(1 for id in ids if current[id].status == "approved")
+            if was_approved:
+                await adjust_approved_count(db, party_id, -was_approved)
+            changed_ids.extend(ids)
+
+    if changed_ids:
+        await db.execute(
+            update(Enrollment)
+            .where(Enrollment.id.in_(changed_ids))
+            .values(status=req.status)
+        )
+        await publish_status_changes(
+            db, [(current[id].userId, current[id].partyId, id, req.status) for id in changed_ids]
+        )
+
+    await db.commit()
+
+    changed = set(changed_ids)
+
+    def outcome(id: int) -> str:
+        if id not in current:
+            return "not_found"
+        if id in changed:
+            return "updated"
+        if id in over_capacity:
+            return "capacity_exceeded"
+        return "unchanged"
+
+    results = [{"enrollment_id": id, "outcome": outcome(id)} for id in enrollment_ids]
+
+    return {"ok": True, "status": req.status, "updated": len(changed_ids), "results": results}
+
+
+@app.get("/admin/db/pool", response_model=schemas.PoolStatusResponse)
+async def get_db_pool_status(admin_user: CachedUser = Depends(get_current_admin_user)):
+    """DB 커넥션 풀 상태 및 생존 확인 결과 조회 (관리자 전용, 요청을 처리한 워커 기준)"""
+    return {"ok": True, **pool_monitor.status(), "replica": replica_router.status()}
+
+
+@app.get("/admin/hashing/stats", response_model=schemas.HashingStatsResponse)
+async def get_hashing_pool_stats(admin_user: CachedUser = Depends(get_current_admin_user)):
+    """비밀번호 해시 워커 풀 상태 조회 (관리자 전용)"""
+    return {"ok": True, "hashing": get_hashing_stats()}
+
+
 # ====================================================================================
 # 쿠폰 조회
 # ====================================================================================
 
 
-@app.get("/coupon/{user_id}/{party_id}")
+@app.get("/coupon/{user_id}/{party_id}", response_model=schemas.CouponLookupResponse)
 async def get_coupon(
     user_id: int,
     party_id: int,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: CachedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """특정 유저의 특정 파티 쿠폰 상태 조회"""
     # 권한 확인: 자신의 쿠폰만 조회 가능
@@ -645,13 +916,7 @@ async def get_coupon(
             detail="권한이 없습니다."
         )
 
-    result = await db.execute(
-        select(Enrollment).where(
-            Enrollment.userId == user_id,
-            Enrollment.partyId == party_id
-        ).order_by(Enrollment.createdAt.desc())
-    )
-    enrollment = result.scalars().first()
+    enrollment = await repository.get_enrollment(db, user_id, party_id)
 
     if not enrollment:
         return {"ok": False, "message": "쿠폰을 찾을 수 없습니다."}
@@ -681,10 +946,10 @@ class UseCouponReq(BaseModel):
     party_id: int
 
 
-@app.put("/coupon/use")
+@app.put("/coupon/use", response_model=schemas.CouponUseResult)
 async def use_coupon(
     req: UseCouponReq,
-    current_user: User = Depends(get_current_user),
+    current_user: CachedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """쿠폰 사용 처리"""
@@ -695,25 +960,34 @@ async def use_coupon(
             detail="권한이 없습니다."
         )
 
+    # 쿠폰 사용 처리 (조건부 UPDATE 한 번으로 처리하여 동시 요청 중 하나만 성공)
     result = await db.execute(
-        select(Enrollment).where(
+        update(Enrollment)
+        .where(
             Enrollment.userId == req.user_id,
-            Enrollment.partyId == req.party_id
+            Enrollment.partyId == req.party_id,
+            Enrollment.couponUsed.is_(False),
+            Enrollment.status == "approved"
         )
+        .values(couponUsed=True)
+        .returning(Enrollment.id)
     )
-    enrollment = result.scalar_one_or_none()
+    redeemed_id = result.scalar_one_or_none()
+    await db.commit()
 
-    if not enrollment:
-        return {"ok": False, "message": "쿠폰을 찾을 수 없습니다."}
+    if redeemed_id is not None:
+        return {"ok": True, "code": "redeemed", "message": "쿠폰이 사용되었습니다."}
 
-    if enrollment.couponUsed:
-        return {"ok": False, "message": "이미 사용된 쿠폰입니다."}
+    # 사용할 수 없는 이유 확인
+    enrollment = await repository.get_enrollment(db, req.user_id, req.party_id)
 
-    # 쿠폰 사용 처리
-    enrollment.couponUsed = True
-    await db.commit()
+    if enrollment is None:
+        return {"ok": False, "code": "not_found", "message": "쿠폰을 찾을 수 없습니다."}
 
-    return {"ok": True, "message": "쿠폰이 사용되었습니다."}
+    if enrollment.status != "approved":
+        return {"ok": False, "code": "not_approved", "message": "승인되지 않은 참가 신청입니다.", "status": enrollment.status}
+
+    return {"ok": False, "code": "already_used", "message": "이미 사용된 쿠폰입니다."}
 
 
 # ====================================================================================
@@ -721,11 +995,11 @@ async def use_coupon(
 # ====================================================================================
 
 
-@app.get("/profile/{user_id}")
+@app.get("/profile/{user_id}", response_model=schemas.ProfileResponse)
 async def get_user_profile(
     user_id: int,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: CachedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """유저의 전체 프로필 정보 조회 (개인정보 + 참가한 파티 + 쿠폰 상태)"""
     # 권한 확인: 자신의 프로필만 조회 가능
@@ -735,14 +1009,8 @@ async def get_user_profile(
             detail="권한이 없습니다."
         )
 
-    # 유저 기본 정보 조회
-    result = await db.execute(
-        select(User).where(User.id == user_id)
-    )
-    user = result.scalar_one_or_none()
-
-    if not user:
-        return {"ok": False, "message": "유저를 찾을 수 없습니다."}
+    # 유저 기본 정보 (인증 단계에서 조회한 정보 사용)
+    user = current_user
 
     # 유저의 모든 Enrollment 조회
     result = await db.execute(
@@ -758,7 +1026,7 @@ async def get_user_profile(
     for enrollment in enrollments:
         enrolled_parties.append({
             "partyId": enrollment.partyId,
-            "enrolledAt": enrollment.createdAt.isoformat(),
+            "enrolledAt": enrollment.createdAt,
             "couponUsed": enrollment.couponUsed,
             "status": enrollment.status  # 승인 상태 추가
         })
@@ -791,16 +1059,18 @@ async def get_user_profile(
 # ====================================================================================
 
 
-@app.get("/payment/info")
-async def get_payment_info():
+@app.get("/payment/info", response_model=schemas.PaymentInfoResponse)
+async def get_payment_info(request: Request):
     """결제 정보 조회 (환경변수에서 읽음)"""
-    import config
-    return {
-        "ok": True,
-        "payment": {
-            "bankName": config.BANK_NAME,
-            "accountNumber": config.BANK_ACCOUNT_NUMBER,
-            "accountHolder": config.BANK_ACCOUNT_HOLDER,
-            "amount": config.PAYMENT_AMOUNT
+    async def build():
+        return {
+            "ok": True,
+            "payment": {
+                "bankName": config.BANK_NAME,
+                "accountNumber": config.BANK_ACCOUNT_NUMBER,
+                "accountHolder": config.BANK_ACCOUNT_HOLDER,
+                "amount": config.PAYMENT_AMOUNT
+            }
         }
-    }
+
+    return await response_cache.cached_json(request, "payment:info", config.PAYMENT_INFO_CACHE_TTL_SECONDS, build)
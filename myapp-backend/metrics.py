@@ -0,0 +1,210 @@
+"""
+Prometheus 지표 (/metrics)
+
+- 라우트별 요청 처리 시간 히스토그램, 처리 중인 요청 수
+- DB 커넥션 풀 상태 (사용 중, overflow, 커넥션 대기 시간)
+- 요청당 SQL 실행 횟수 / DB 시간 (database.QueryStatsMiddleware)
+- bcrypt 해시/검증 시간, 대기 시간, 거절 수
+
+gunicorn으로 여러 워커를 실행할 때는 PROMETHEUS_MULTIPROC_DIR에 워커별 지표 파일을 기록하고
+/metrics 요청을 받은 워커가 모든 워커의 파일을 합산합니다. (gunicorn.conf.py에서 설정)
+환경변수가 없으면 (uvicorn 단일 프로세스, 테스트) 프로세스 내 레지스트리를 그대로 사용합니다.
+
+PROMETHEUS_MULTIPROC_DIR은 prometheus_client를 import하기 전에 설정되어 있어야 합니다.
+"""
+import os
+import time
+from typing import Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+)
+from prometheus_client import multiprocess
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.routing import Match
+
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being handled",
+    ["method", "route"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Configured connection pool size", multiprocess_mode="livesum"
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections", "Connections currently checked out", multiprocess_mode="livesum"
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections", "Connections opened beyond pool_size", multiprocess_mode="livesum"
+)
+DB_LIVENESS_OK = Gauge(
+    "db_liveness_ok", "1 if the last background liveness check succeeded", multiprocess_mode="livemin"
+)
+DB_REPLICA_LAG = Gauge(
+    "db_replica_lag_seconds",
+    "Upper bound on how stale the read replica may be (+Inf until it has caught up once)",
+    multiprocess_mode="livemax",
+)
+DB_READ_SESSIONS = Counter(
+    "db_read_sessions_total", "Read-only sessions opened, by the database they were routed to", ["target"]
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection (including new connects)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+DB_STATEMENTS_PER_REQUEST = Histogram(
+    "db_statements_per_request",
+    "SQL statements executed per HTTP request",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "db_time_per_request_seconds",
+    "Total SQL execution time per HTTP request",
+    ["route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "bcrypt hash/verify run time on the hasher pool",
+    ["operation"],
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0, 5.0),
+)
+PASSWORD_HASH_QUEUE_WAIT = Histogram(
+    "password_hash_queue_wait_seconds",
+    "Time bcrypt jobs waited for a hasher thread",
+    ["operation"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total", "bcrypt jobs rejected because the hasher queue was full"
+)
+
+RATE_LIMITED = Counter(
+    "rate_limited_requests_total", "Requests rejected by a rate limit before any hashing or DB work", ["limit"]
+)
+
+INVITATION_INDEX_LOOKUPS = Counter(
+    "invitation_index_lookups_total",
+    "Invitation codes looked up in the in-process index (unknown / inactive are answered without the DB)",
+    ["result"],
+)
+
+
+# ====================================================================================
+# HTTP 요청
+# ====================================================================================
+
+
+def _route_template(scope) -> str:
+    """요청 경로에 해당하는 라우트 템플릿 (레이블 수가 경로 값만큼 늘지 않도록)"""
+    for route in scope["app"].router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    """라우트별 처리 시간 / 처리 중 요청 수 기록 (ASGI 미들웨어)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = _route_template(scope)
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method, route)
+        in_progress.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_progress.dec()
+            REQUEST_LATENCY.labels(method, route, str(status_code)).observe(time.perf_counter() - started_at)
+
+
+# ====================================================================================
+# DB 커넥션 풀
+# ====================================================================================
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """커넥션 대기 시간과 풀 상태를 기록하는 커넥션 풀 (engine의 poolclass로 사용)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        DB_POOL_SIZE.set(self.size())
+
+    def _report(self) -> None:
+        DB_POOL_CHECKED_OUT.set(self.checkedout())
+        DB_POOL_OVERFLOW.set(max(0, self.overflow()))
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started_at)
+            self._report()
+
+    def _do_return_conn(self, record):
+        try:
+            super()._do_return_conn(record)
+        finally:
+            self._report()
+
+
+def observe_request_queries(route: str, statements: int, seconds: float) -> None:
+    DB_STATEMENTS_PER_REQUEST.labels(route).observe(statements)
+    DB_TIME_PER_REQUEST.labels(route).observe(seconds)
+
+
+# ====================================================================================
+# bcrypt
+# ====================================================================================
+
+
+def observe_password_hash(operation: str, waited: float, ran: float) -> None:
+    PASSWORD_HASH_QUEUE_WAIT.labels(operation).observe(waited)
+    PASSWORD_HASH_DURATION.labels(operation).observe(ran)
+
+
+# ====================================================================================
+# 출력
+# ====================================================================================
+
+
+def render() -> Tuple[bytes, str]:
+    """Prometheus text format 본문과 Content-Type 반환 (멀티프로세스면 모든 워커 합산)"""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
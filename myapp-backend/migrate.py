@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+버전 관리 마이그레이션 실행기
+
+migrations/ 디렉토리의 NNNN_name.py 파일을 번호 순서대로 적용하고, 적용한 버전을
+"SchemaMigration" 테이블에 기록합니다. 이미 기록된 버전은 건너뜁니다.
+
+서비스 중인 DB에 그대로 실행할 수 있도록
+
+- 각 문장은 lock_timeout을 건 짧은 트랜잭션에서 실행하고, 락을 얻지 못하면 잠시 후 재시도합니다.
+  (ALTER TABLE이 긴 트랜잭션 뒤에서 락을 기다리는 동안 그 뒤의 모든 요청이 막히는 상황 방지)
+- 인덱스는 CREATE INDEX CONCURRENTLY로 만듭니다. (생성 중에도 읽기 / 쓰기 가능)
+- 대량 UPDATE는 id 구간별 배치로 나눠 배치마다 커밋합니다.
+- NOT NULL은 CHECK ... NOT VALID → VALIDATE → SET NOT NULL 순서로 걸어 전체 스캔 중 쓰기를 막지 않습니다.
+
+한 버전은 여러 트랜잭션으로 나뉘어 실행되므로 중간에 실패할 수 있습니다. 실패한 버전은 기록되지
+않고 다음 실행 때 처음부터 다시 적용되므로, 각 단계는 IF NOT EXISTS 등으로 다시 실행해도
+안전하게 작성합니다. 같은 이유로 예전 스크립트(create_tables.py, add_*_migration.py)로 이미
+변경된 DB에서도 처음 실행 시 모든 버전이 변경 없이 적용 처리됩니다.
+
+pgBouncer(transaction mode)를 거치면 세션 설정과 advisory lock이 유지되지 않으므로
+DATABASE_DIRECT_URL이 설정되어 있으면 그 주소로 직접 연결합니다.
+
+사용법:
+    python migrate.py                 # 적용되지 않은 마이그레이션 실행
+    python migrate.py --status        # 버전별 적용 여부 출력
+    python migrate.py --target 0003   # 0003까지만 적용
+
+새 마이그레이션은 migrations/에 다음 번호의 파일을 만들고 async def upgrade(m: Migrator)를
+정의합니다. (models.py와 prisma/schema.prisma도 같이 수정)
+"""
+import argparse
+import asyncio
+import importlib
+import re
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+import config
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+VERSION_TABLE = "SchemaMigration"
+
+# 동시에 두 곳에서 실행되지 않도록 잡는 advisory lock 키 (임의의 고정값)
+MIGRATION_LOCK_KEY = 7_340_019
+
+LOCK_NOT_AVAILABLE = "55P03"
+
+_FILENAME = re.compile(r"^(\d{4})_(\w+)\.py$")
+
+
+class Migrator:
+    """마이그레이션 파일의 upgrade(m)에 전달되는 실행 도구"""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        lock_timeout_ms: int = 3000,
+        retries: int = 5,
+        retry_delay: float = 2.0,
+        batch_size: int = 1000,
+        batch_pause: float = 0.05,
+    ):
+        self.engine = engine
+        self.lock_timeout_ms = lock_timeout_ms
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.batch_size = batch_size
+        self.batch_pause = batch_pause
+
+    async def _run(self, sql: str, params: Optional[dict], handle):
+        for attempt in range(1, self.retries + 1):
+            try:
+                async with self.engine.begin() as conn:
+                    await conn.execute(text(f"SET LOCAL lock_timeout = '{self.lock_timeout_ms}ms'"))
+                    result = await conn.execute(text(sql), params or {})
+                    return handle(result)
+            except DBAPIError as e:
+                if getattr(e.orig, "sqlstate", None) != LOCK_NOT_AVAILABLE or attempt == self.retries:
+                    raise
+                print(f"  … lock not available, retrying ({attempt}/{self.retries})")
+                await asyncio.sleep(self.retry_delay * attempt)
+
+    async def execute(self, sql: str, params: Optional[dict] = None) -> int:
+        """lock_timeout을 건 트랜잭션 하나에서 실행 (락 대기 시간 초과 시 재시도) - 변경된 행 수 반환"""
+        return await self._run(sql, params, lambda result: result.rowcount)
+
+    async def scalar(self, sql: str, params: Optional[dict] = None) -> Any:
+        return await self._run(sql, params, lambda result: result.scalar())
+
+    async def fetch(self, sql: str, params: Optional[dict] = None) -> List[Any]:
+        """execute와 같지만 결과 행 목록 반환 (RETURNING 등)"""
+        return await self._run(sql, params, lambda result: result.all())
+
+    async def table_exists(self, table: str) -> bool:
+        return await self.scalar("SELECT to_regclass(:name) IS NOT NULL", {"name": f'"{table}"'})
+
+    async def column_exists(self, table: str, column: str) -> bool:
+        return await self.scalar('''
+            SELECT EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema() AND table_name = :table AND column_name = :column
+            )
+        ''', {"table": table, "column": column})
+
+    async def index_valid(self, name: str) -> Optional[bool]:
+        """인덱스 상태 - 없으면 None, 생성이 중단되어 INVALID이면 False"""
+        return await self.scalar('''
+            SELECT i.indisvalid FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = :name AND c.relnamespace = current_schema()::regnamespace
+        ''', {"name": name})
+
+    async def create_index(self, name: str, definition: str, unique: bool = False) -> None:
+        """
+        CREATE INDEX CONCURRENTLY (definition 예: '"Enrollment" ("partyId", status)')
+
+        CONCURRENTLY는 트랜잭션 밖에서만 실행할 수 있으므로 autocommit 커넥션을 사용합니다.
+        쓰기를 막는 락을 잡지 않으므로 lock_timeout 없이 앞선 트랜잭션이 끝나기를 기다립니다.
+        """
+        valid = await self.index_valid(name)
+        if valid:
+            print(f"  ✓ Index {name} already exists")
+            return
+
+        async with self.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text("SET lock_timeout = 0"))
+            if valid is False:
+                await conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+                print(f"  ✓ Dropped invalid index {name}")
+            unique_sql = "UNIQUE " if unique else ""
+            await conn.execute(text(f'CREATE {unique_sql}INDEX CONCURRENTLY IF NOT EXISTS "{name}" ON {definition}'))
+        print(f"  ✓ Index {name} ready")
+
+    async def backfill(self, table: str, assignments: str, where: str, params: Optional[dict] = None) -> int:
+        """
+        UPDATE를 id 구간(batch_size)별로 나눠 실행 - 배치마다 커밋하므로 행 락을 오래 잡지 않음
+
+        where는 아직 갱신되지 않은 행만 고르도록 작성해야 중단 후 다시 실행해도 안전합니다.
+        """
+        bounds = await self._run(f'SELECT MIN(id), MAX(id) FROM "{table}"', None, lambda result: result.one())
+        if bounds[0] is None:
+            return 0
+
+        total = 0
+        for start in range(bounds[0], bounds[1] + 1, self.batch_size):
+            total += await self.execute(
+                f'UPDATE "{table}" SET {assignments} WHERE id >= :_start AND id < :_end AND ({where})',
+                {**(params or {}), "_start": start, "_end": start + self.batch_size},
+            )
+            if self.batch_pause:
+                await asyncio.sleep(self.batch_pause)
+        print(f"  ✓ Backfilled {total} {table} rows")
+        return total
+
+    async def set_not_null(self, table: str, column: str) -> None:
+        """
+        쓰기를 막지 않고 NOT NULL 적용
+
+        ALTER COLUMN SET NOT NULL은 ACCESS EXCLUSIVE 락을 잡은 채 전체 행을 검사합니다.
+        먼저 NOT VALID CHECK 제약을 추가하고 VALIDATE(쓰기 허용)로 검사해 두면
+        SET NOT NULL은 검사를 생략합니다. (PostgreSQL 12+)
+        """
+        nullable = await self.scalar('''
+            SELECT is_nullable = 'YES' FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = :table AND column_name = :column
+        ''', {"table": table, "column": column})
+        if not nullable:
+            return
+
+        check = f"{table}_{column}_not_null"
+        await self.execute(f'ALTER TABLE "{table}" DROP CONSTRAINT IF EXISTS "{check}"')
+        await self.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{check}" CHECK ("{column}" IS NOT NULL) NOT VALID')
+        await self.execute(f'ALTER TABLE "{table}" VALIDATE CONSTRAINT "{check}"')
+        await self.execute(f'ALTER TABLE "{table}" ALTER COLUMN "{column}" SET NOT NULL')
+        await self.execute(f'ALTER TABLE "{table}" DROP CONSTRAINT "{check}"')
+        print(f"  ✓ {table}.{column} set NOT NULL")
+
+
+def discover() -> List[Tuple[str, str, Any]]:
+    """[(버전, 이름, 모듈)] - 버전 순서"""
+    migrations = []
+    for path in sorted(MIGRATIONS_DIR.glob("*.py")):
+        match = _FILENAME.match(path.name)
+        if match:
+            module = importlib.import_module(f"migrations.{path.stem}")
+            migrations.append((match.group(1), match.group(2), module))
+    return migrations
+
+
+async def applied_versions(m: Migrator) -> set:
+    if not await m.table_exists(VERSION_TABLE):
+        return set()
+    async with m.engine.connect() as conn:
+        result = await conn.execute(text(f'SELECT version FROM "{VERSION_TABLE}"'))
+        return {row[0] for row in result}
+
+
+async def run_migrations(m: Migrator, target: Optional[str] = None) -> List[str]:
+    """적용되지 않은 마이그레이션을 순서대로 적용하고 적용한 버전 목록 반환"""
+    applied = []
+    # advisory lock은 autocommit 커넥션에서 잡음
+    # (열린 트랜잭션이 있으면 CREATE INDEX CONCURRENTLY가 그 트랜잭션이 끝나기를 기다림)
+    async with m.engine.connect() as lock_conn:
+        lock_conn = await lock_conn.execution_options(isolation_level="AUTOCOMMIT")
+        await lock_conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        try:
+            await m.execute(f'''
+                CREATE TABLE IF NOT EXISTS "{VERSION_TABLE}" (
+                    version VARCHAR PRIMARY KEY,
+                    name VARCHAR NOT NULL,
+                    "appliedAt" TIMESTAMP NOT NULL DEFAULT now()
+                )
+            ''')
+            done = await applied_versions(m)
+            for version, name, module in discover():
+                if target and version > target:
+                    break
+                if version in done:
+                    continue
+                print(f"→ {version} {name}")
+                await module.upgrade(m)
+                await m.execute(
+                    f'INSERT INTO "{VERSION_TABLE}" (version, name) VALUES (:version, :name)',
+                    {"version": version, "name": name},
+                )
+                applied.append(version)
+        finally:
+            await lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+    return applied
+
+
+def database_url() -> str:
+    import database
+    url = config.DATABASE_DIRECT_URL or database.DATABASE_URL
+    if url.startswith("postgresql://"):
+        url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+
+def create_engine() -> AsyncEngine:
+    # 단계마다 새 커넥션 (트랜잭션 상태나 세션 설정이 다음 단계로 이어지지 않도록)
+    return create_async_engine(database_url(), poolclass=NullPool)
+
+
+async def main(args) -> None:
+    engine = create_engine()
+    m = Migrator(engine, lock_timeout_ms=args.lock_timeout_ms, retries=args.retries, batch_size=args.batch_size)
+    try:
+        if args.status:
+            done = await applied_versions(m)
+            for version, name, module in discover():
+                print(f"[{'x' if version in done else ' '}] {version} {name}")
+            return
+
+        print("Starting migrations")
+        applied = await run_migrations(m, target=args.target)
+        if applied:
+            print(f"Applied {len(applied)} migration(s): {', '.join(applied)}")
+        else:
+            print("Database is up to date")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply versioned schema migrations")
+    parser.add_argument("--status", action="store_true", help="버전별 적용 여부만 출력")
+    parser.add_argument("--target", help="이 버전까지만 적용 (예: 0003)")
+    parser.add_argument("--lock-timeout-ms", type=int, default=3000, help="문장별 락 대기 한도")
+    parser.add_argument("--retries", type=int, default=5, help="락 대기 시간 초과 시 재시도 횟수")
+    parser.add_argument("--batch-size", type=int, default=1000, help="backfill 배치당 id 구간 크기")
+    asyncio.run(main(parser.parse_args()))
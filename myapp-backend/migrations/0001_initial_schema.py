@@ -0,0 +1,46 @@
+"""
+초기 테이블 (prisma/migrations의 init ~ add_enrollment_relations 적용 후 상태)
+"""
+
+
+async def upgrade(m):
+    await m.execute('''
+        CREATE TABLE IF NOT EXISTS "Invitation" (
+            "id" SERIAL PRIMARY KEY,
+            "code" TEXT NOT NULL,
+            "is_active" BOOLEAN NOT NULL DEFAULT true
+        )
+    ''')
+    await m.execute('''
+        CREATE TABLE IF NOT EXISTS "RegisterSession" (
+            "sessionId" TEXT PRIMARY KEY,
+            "invitationId" INTEGER NOT NULL,
+            "name" TEXT,
+            "password" TEXT,
+            "birthday" TEXT,
+            "phone" TEXT
+        )
+    ''')
+    await m.execute('''
+        CREATE TABLE IF NOT EXISTS "User" (
+            "id" SERIAL PRIMARY KEY,
+            "name" TEXT NOT NULL,
+            "password" TEXT NOT NULL,
+            "birthday" TEXT NOT NULL,
+            "phone" TEXT NOT NULL,
+            "invitationId" INTEGER NOT NULL
+        )
+    ''')
+    await m.execute('''
+        CREATE TABLE IF NOT EXISTS "Enrollment" (
+            "id" SERIAL PRIMARY KEY,
+            "userId" INTEGER NOT NULL
+                CONSTRAINT "Enrollment_userId_fkey" REFERENCES "User"("id") ON DELETE RESTRICT ON UPDATE CASCADE,
+            "partyId" INTEGER NOT NULL,
+            "enrolled" BOOLEAN NOT NULL DEFAULT true,
+            "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    print("  ✓ Base tables ready")
+
+    await m.create_index("Invitation_code_key", '"Invitation" ("code")', unique=True)
@@ -0,0 +1,24 @@
+"""
+Enrollment.status 추가 (기존 add_status_column.py / migrate_add_status.py)
+
+기존 스크립트는 DEFAULT가 있는 컬럼을 추가한 뒤 전체 UPDATE를 한 트랜잭션에서 실행하여
+끝날 때까지 Enrollment 쓰기를 막았습니다. 여기서는
+
+1. 기본값 없이 NULL 허용 컬럼으로 추가 (메타데이터만 변경)
+2. 새 행의 기본값을 'pending'으로 설정 (기존 행은 NULL 유지 = 아직 채우지 않은 행)
+3. NULL인 행만 배치로 채움 (기존 참가자는 승인 상태로 간주)
+4. NOT NULL 적용
+
+순서로 실행하므로 중간에 중단되어도 다시 실행하면 남은 행만 채웁니다.
+"""
+
+
+async def upgrade(m):
+    await m.execute('ALTER TABLE "Enrollment" ADD COLUMN IF NOT EXISTS status VARCHAR')
+    await m.execute('ALTER TABLE "Enrollment" ALTER COLUMN status SET DEFAULT \'pending\'')
+    await m.backfill(
+        "Enrollment",
+        "status = CASE WHEN enrolled THEN 'approved' ELSE 'pending' END",
+        "status IS NULL",
+    )
+    await m.set_not_null("Enrollment", "status")
@@ -0,0 +1,10 @@
+"""
+Enrollment.couponUsed 추가 (기존 add_coupon_migration.py)
+
+상수 기본값이 있는 컬럼 추가는 테이블을 다시 쓰지 않으므로 (PostgreSQL 11+) 한 번에 추가합니다.
+"""
+
+
+async def upgrade(m):
+    await m.execute('ALTER TABLE "Enrollment" ADD COLUMN IF NOT EXISTS "couponUsed" BOOLEAN NOT NULL DEFAULT FALSE')
+    print("  ✓ Enrollment.couponUsed ready")
@@ -0,0 +1,14 @@
+"""
+로그인 아이디 User.userId / RegisterSession.userId 추가 (기존 add_userid_migration.py)
+
+ADD COLUMN ... UNIQUE는 테이블 락을 잡은 채 인덱스를 만들므로, 컬럼만 추가하고
+고유 인덱스는 CONCURRENTLY로 따로 만듭니다. (기존 스크립트와 같이 NULL은 허용)
+"""
+
+
+async def upgrade(m):
+    await m.execute('ALTER TABLE "RegisterSession" ADD COLUMN IF NOT EXISTS "userId" VARCHAR')
+    await m.execute('ALTER TABLE "User" ADD COLUMN IF NOT EXISTS "userId" VARCHAR')
+    print("  ✓ userId columns ready")
+
+    await m.create_index("User_userId_key", '"User" ("userId")', unique=True)
@@ -0,0 +1,28 @@
+"""
+Party 테이블 (파티별 정원) 추가
+
+main.py에 하드코딩되어 있던 정원(50)으로 파티 1을 만듭니다. (이미 있으면 그대로 둠)
+"""
+
+
+async def upgrade(m):
+    await m.execute('''
+        CREATE TABLE IF NOT EXISTS "Party" (
+            "id" SERIAL PRIMARY KEY,
+            "name" TEXT NOT NULL,
+            "capacity" INTEGER NOT NULL
+        )
+    ''')
+    print("  ✓ Party table ready")
+
+    # 기존에 main.py에 하드코딩되어 있던 정원
+    inserted = await m.execute('''
+        INSERT INTO "Party" ("id", "name", "capacity")
+        VALUES (1, 'After-Christmas Party', 50)
+        ON CONFLICT ("id") DO NOTHING
+    ''')
+    if inserted:
+        await m.execute('''
+            SELECT setval(pg_get_serial_sequence('"Party"', 'id'), (SELECT MAX("id") FROM "Party"))
+        ''')
+        print("  ✓ Seeded Party 1 (capacity 50)")
@@ -0,0 +1,26 @@
+"""
+PartyStats (파티별 승인 인원 카운터) 추가
+
+카운터가 없는 파티만 집계값으로 초기화합니다. 이미 있는 카운터는 API가 같은 트랜잭션에서
+갱신하고 있으므로 덮어쓰지 않습니다. (집계 중 승인된 건이 사라지지 않도록)
+"""
+
+
+async def upgrade(m):
+    await m.execute('''
+        CREATE TABLE IF NOT EXISTS "PartyStats" (
+            "partyId" INTEGER PRIMARY KEY,
+            "approvedCount" INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    print("  ✓ PartyStats table ready")
+
+    count = await m.execute('''
+        INSERT INTO "PartyStats" ("partyId", "approvedCount")
+        SELECT "partyId", COUNT(*)
+        FROM "Enrollment"
+        WHERE status = 'approved'
+        GROUP BY "partyId"
+        ON CONFLICT ("partyId") DO NOTHING
+    ''')
+    print(f"  ✓ Initialized approved counts for {count} parties")
@@ -0,0 +1,65 @@
+"""
+Enrollment (userId, partyId) 고유 인덱스 - 중복 참가 신청 정리 후 생성
+
+Prisma init 마이그레이션으로 만든 DB에는 이미 있으므로 없을 때만 중복을 정리하고 생성합니다.
+인덱스 생성 중 새 중복이 들어오면 생성이 실패하고 INVALID 인덱스가 남는데,
+다시 실행하면 중복을 다시 정리하고 INVALID 인덱스를 지운 뒤 새로 만듭니다.
+"""
+
+
+# 삭제한 중복 행을 옮겨 두는 테이블 (중복이 있을 때만 생성, 확인 후 직접 삭제)
+BACKUP_TABLE = "EnrollmentDuplicateBackup"
+
+# 같은 (userId, partyId)에서 남길 행의 순서 - 승인 > 대기 > 거절, 쿠폰을 사용한 행, 최근 행
+RANKED = '''
+    SELECT id,
+           ROW_NUMBER() OVER (
+               PARTITION BY "userId", "partyId"
+               ORDER BY CASE status WHEN 'approved' THEN 0 WHEN 'pending' THEN 1 ELSE 2 END,
+                        CASE WHEN "couponUsed" THEN 0 ELSE 1 END,
+                        "createdAt" DESC, id DESC
+           ) AS rn
+    FROM "Enrollment"
+'''
+
+
+async def upgrade(m):
+    if await m.index_valid("Enrollment_userId_partyId_key"):
+        print("  ✓ Unique index Enrollment_userId_partyId_key already exists")
+        return
+
+    # 최근 행만 남기면 승인 / 쿠폰 사용 기록이 나중에 들어온 대기 신청에 덮여 사라지므로 상태 순으로 선택
+    # 삭제하는 행은 같은 트랜잭션에서 백업 테이블로 옮기고 출력
+    removed = []
+    if await m.scalar(f'SELECT COUNT(*) FROM ({RANKED}) ranked WHERE rn > 1'):
+        await m.execute(f'CREATE TABLE IF NOT EXISTS "{BACKUP_TABLE}" (LIKE "Enrollment")')
+        removed = await m.fetch(f'''
+            WITH removed AS (
+                DELETE FROM "Enrollment" e
+                USING ({RANKED}) ranked
+                WHERE e.id = ranked.id AND ranked.rn > 1
+                RETURNING e.*
+            ), backup AS (
+                INSERT INTO "{BACKUP_TABLE}" SELECT * FROM removed
+            )
+            SELECT id, "userId", "partyId", status, "couponUsed", "createdAt" FROM removed ORDER BY id
+        ''')
+        for row in removed:
+            print(f"    - removed Enrollment {row.id} (userId={row.userId}, partyId={row.partyId}, "
+                  f"status={row.status}, couponUsed={row.couponUsed}, createdAt={row.createdAt})")
+        print(f"  ✓ Removed {len(removed)} duplicate enrollments (backed up to {BACKUP_TABLE})")
+    else:
+        print("  ✓ No duplicate enrollments")
+
+    await m.create_index("Enrollment_userId_partyId_key", '"Enrollment" ("userId", "partyId")', unique=True)
+
+    if removed:
+        # 같은 사용자의 승인 행이 중복으로 세어졌을 수 있으므로 승인 인원 카운터 재계산
+        await m.execute('''
+            UPDATE "PartyStats" s
+            SET "approvedCount" = (
+                SELECT COUNT(*) FROM "Enrollment" e
+                WHERE e."partyId" = s."partyId" AND e.status = 'approved'
+            )
+        ''')
+        print("  ✓ Recomputed PartyStats approved counts")
@@ -0,0 +1,23 @@
+"""
+조회 / keyset 페이지 인덱스 (models.py의 Index와 같은 이름)
+"""
+
+INDEXES = [
+    # 회원가입 전화번호 중복 확인 (repository.phone_taken)
+    ("User_phone_idx", '"User" (phone)'),
+    # 파티별 상태 집계
+    ("Enrollment_partyId_status_idx", '"Enrollment" ("partyId", status)'),
+    # 승인 대기 목록 - 대기 중인 행만 포함하는 부분 인덱스
+    ("Enrollment_pending_createdAt_id_idx", '"Enrollment" ("createdAt", id) WHERE status = \'pending\''),
+    # 전체 / 파티별 목록 keyset 페이지
+    ("Enrollment_createdAt_id_idx", '"Enrollment" ("createdAt", id)'),
+    ("Enrollment_partyId_createdAt_id_idx", '"Enrollment" ("partyId", "createdAt", id)'),
+]
+
+
+async def upgrade(m):
+    for name, definition in INDEXES:
+        await m.create_index(name, definition)
+
+    await m.execute('ANALYZE "User", "Enrollment"')
+    print("  ✓ Updated planner statistics")
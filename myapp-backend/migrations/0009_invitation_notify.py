@@ -0,0 +1,39 @@
+"""
+초대코드 변경 알림 트리거 (models.py의 INVITATION_NOTIFY_FUNCTION / TRIGGER와 같은 내용)
+
+Invitation 행이 추가 / 변경 / 삭제되면 vanta_events 채널로 알려 각 워커의
+초대코드 인덱스(invitation_index.py)가 DB 조회 없이 갱신됩니다.
+"""
+
+FUNCTION = """
+CREATE OR REPLACE FUNCTION invitation_notify() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM pg_notify('vanta_events', json_build_object(
+            'topic', 'invitation', 'data', json_build_object('code', OLD.code, 'isActive', NULL))::text);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM pg_notify('vanta_events', json_build_object(
+            'topic', 'invitation', 'data', json_build_object('code', NEW.code, 'isActive', NEW.is_active))::text);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+async def upgrade(m):
+    await m.execute(FUNCTION)
+
+    exists = await m.scalar(
+        "SELECT 1 FROM pg_trigger WHERE tgname = 'Invitation_notify' AND tgrelid = '\"Invitation\"'::regclass"
+    )
+    if exists:
+        print("  ✓ Invitation_notify trigger already exists")
+        return
+
+    await m.execute('''
+        CREATE TRIGGER "Invitation_notify" AFTER INSERT OR UPDATE OR DELETE ON "Invitation"
+        FOR EACH ROW EXECUTE FUNCTION invitation_notify()
+    ''')
+    print("  ✓ Created Invitation_notify trigger")
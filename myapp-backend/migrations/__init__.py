@@ -0,0 +1,5 @@
+"""
+버전별 스키마 마이그레이션 (migrate.py로 실행)
+
+파일 이름은 NNNN_name.py이며, 각 파일은 async def upgrade(m: migrate.Migrator)를 정의합니다.
+"""
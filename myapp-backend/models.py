@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import DDL, Column, Integer, String, Boolean, DateTime, ForeignKey, Index, UniqueConstraint, event, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -14,6 +14,34 @@ class Invitation(Base):
     is_active = Column(Boolean, default=True, nullable=False)
 
 
+# 초대코드 추가 / 활성화 변경 / 삭제를 모든 워커의 초대코드 인덱스(invitation_index.py)에 알림
+# (관리자가 Prisma Studio나 SQL로 직접 바꿔도 전달됨, migrations/0009_invitation_notify.py)
+INVITATION_NOTIFY_FUNCTION = """
+CREATE OR REPLACE FUNCTION invitation_notify() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM pg_notify('vanta_events', json_build_object(
+            'topic', 'invitation', 'data', json_build_object('code', OLD.code, 'isActive', NULL))::text);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM pg_notify('vanta_events', json_build_object(
+            'topic', 'invitation', 'data', json_build_object('code', NEW.code, 'isActive', NEW.is_active))::text);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+INVITATION_NOTIFY_TRIGGER = """
+CREATE TRIGGER "Invitation_notify" AFTER INSERT OR UPDATE OR DELETE ON "Invitation"
+FOR EACH ROW EXECUTE FUNCTION invitation_notify()
+"""
+
+event.listen(Invitation.__table__, "after_create", DDL(INVITATION_NOTIFY_FUNCTION).execute_if(dialect="postgresql"))
+event.listen(Invitation.__table__, "after_create", DDL(INVITATION_NOTIFY_TRIGGER).execute_if(dialect="postgresql"))
+
+
+# 회원가입 세션은 register_sessions.py의 세션 저장소를 사용합니다. (기존 테이블 호환용으로만 유지)
 class RegisterSession(Base):
     __tablename__ = "RegisterSession"
 
@@ -40,6 +68,11 @@ class User(Base):
     # Relationship with Enrollment
     enrollments = relationship("Enrollment", back_populates="user")
 
+    __table_args__ = (
+        # 회원가입 시 전화번호 중복 확인 (migrations/0008_lookup_indexes.py)
+        Index("User_phone_idx", "phone"),
+    )
+
 
 class Enrollment(Base):
     __tablename__ = "Enrollment"
@@ -56,6 +89,34 @@ class Enrollment(Base):
     user = relationship("User", back_populates="enrollments")
 
     __table_args__ = (
-        # Unique constraint on userId and partyId
+        # Unique constraint on userId and partyId (schema.prisma의 @@unique와 동일한 이름)
+        UniqueConstraint("userId", "partyId", name="Enrollment_userId_partyId_key"),
+        # 아래 인덱스는 migrations/0008_lookup_indexes.py로 운영 DB에 생성합니다.
+        # 파티별 상태 집계 (승인 인원 재계산 등)
+        Index("Enrollment_partyId_status_idx", "partyId", "status"),
+        # 승인 대기 목록 (status = 'pending'인 행만 포함, 최신순 keyset 페이지)
+        Index(
+            "Enrollment_pending_createdAt_id_idx", "createdAt", "id",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        # 전체 / 파티별 목록 keyset 페이지 (pagination.py)
+        Index("Enrollment_createdAt_id_idx", "createdAt", "id"),
+        Index("Enrollment_partyId_createdAt_id_idx", "partyId", "createdAt", "id"),
         {"schema": None},
     )
+
+
+class Party(Base):
+    __tablename__ = "Party"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String, nullable=False)
+    capacity = Column(Integer, nullable=False)  # 최대 승인 인원
+
+
+class PartyStats(Base):
+    __tablename__ = "PartyStats"
+
+    # 파티별 승인 인원 카운터 (approve/reject 시 같은 트랜잭션에서 갱신)
+    partyId = Column(Integer, primary_key=True, autoincrement=False)
+    approvedCount = Column(Integer, default=0, nullable=False)
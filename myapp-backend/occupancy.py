@@ -0,0 +1,116 @@
+"""
+파티 정원(승인 인원) 집계 및 정원 제한
+
+승인 인원은 PartyStats 테이블의 카운터로 관리합니다. approve/reject 핸들러가
+Enrollment 상태를 바꿀 때 같은 트랜잭션 안에서 카운터를 갱신하므로
+조회는 파티 인원과 무관하게 PK 조회 한 번으로 끝납니다.
+
+정원은 Party.capacity (없으면 DEFAULT_PARTY_CAPACITY)입니다. 승인은 reserve_spots로
+카운터 행을 잠근 뒤 남은 자리만큼만 증가시키므로 동시에 승인해도 정원을 넘지 않습니다.
+잠금 순서는 항상 Enrollment → PartyStats 입니다.
+"""
+from typing import Tuple
+
+from sqlalchemy import select, func, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import config
+from models import Enrollment, Party, PartyStats
+
+
+def _capacity_of(party_id: int):
+    """파티 정원 스칼라 서브쿼리 (Party 행이 없으면 기본 정원)"""
+    return func.coalesce(
+        select(Party.capacity).where(Party.id == party_id).scalar_subquery(),
+        config.DEFAULT_PARTY_CAPACITY,
+    )
+
+
+def _approved_of(party_id: int):
+    """승인 인원 COUNT 스칼라 서브쿼리"""
+    return select(func.count()).select_from(Enrollment).where(
+        Enrollment.partyId == party_id,
+        Enrollment.status == "approved"
+    ).scalar_subquery()
+
+
+async def count_approved(db: AsyncSession, party_id: int) -> int:
+    """Enrollment 테이블에서 직접 승인 인원 집계 (카운터가 없을 때의 fallback)"""
+    result = await db.execute(select(_approved_of(party_id)))
+    return result.scalar_one()
+
+
+async def get_occupancy(db: AsyncSession, party_id: int) -> Tuple[int, int]:
+    """파티의 (정원, 승인 인원) 조회 - 카운터 우선, 없으면 COUNT 집계"""
+    result = await db.execute(
+        select(
+            _capacity_of(party_id),
+            select(PartyStats.approvedCount).where(PartyStats.partyId == party_id).scalar_subquery(),
+        )
+    )
+    capacity, approved_count = result.one()
+
+    if approved_count is None:
+        # 승인 이력이 없는 파티 - 카운터 행은 첫 승인 시 생성됨
+        approved_count = await count_approved(db, party_id)
+
+    return capacity, approved_count
+
+
+async def reserve_spots(db: AsyncSession, party_id: int, requested: int) -> int:
+    """
+    정원 한도 안에서 승인 인원 카운터 증가 (커밋은 호출자가 수행)
+
+    카운터 행을 FOR UPDATE로 잠그므로 동시에 승인하는 트랜잭션은 순서대로 처리됩니다.
+    카운터 행이 없으면 (카운터 도입 전에 승인된 파티 등) 현재 승인 인원으로 만듭니다.
+
+    Args:
+        db: 데이터베이스 세션 (Enrollment 상태 변경과 같은 트랜잭션)
+        party_id: 파티 ID
+        requested: 승인하려는 인원
+
+    Returns:
+        실제로 확보한 자리 수 (0 ~ requested)
+    """
+    await db.execute(
+        insert(PartyStats)
+        .values(partyId=party_id, approvedCount=_approved_of(party_id))
+        .on_conflict_do_nothing(index_elements=[PartyStats.partyId])
+    )
+    result = await db.execute(
+        select(PartyStats.approvedCount, _capacity_of(party_id))
+        .where(PartyStats.partyId == party_id)
+        .with_for_update(of=PartyStats)
+    )
+    approved_count, capacity = result.one()
+
+    granted = max(0, min(requested, capacity - approved_count))
+    if granted:
+        await db.execute(
+            update(PartyStats)
+            .where(PartyStats.partyId == party_id)
+            .values(approvedCount=approved_count + granted)
+        )
+    return granted
+
+
+async def adjust_approved_count(db: AsyncSession, party_id: int, delta: int) -> None:
+    """
+    승인 인원 카운터 증감 (정원 검사 없음, 커밋은 호출자가 수행)
+
+    카운터 행이 없으면 현재 승인 인원 + delta로 만들므로 Enrollment 상태 변경을 쓰기 전에 호출합니다.
+
+    Args:
+        db: 데이터베이스 세션 (Enrollment 상태 변경과 같은 트랜잭션)
+        party_id: 파티 ID
+        delta: 증감값 (승인 +1, 승인 취소 -1)
+    """
+    stmt = insert(PartyStats).values(
+        partyId=party_id, approvedCount=func.greatest(_approved_of(party_id) + delta, 0)
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PartyStats.partyId],
+        set_={"approvedCount": func.greatest(PartyStats.approvedCount + delta, 0)},
+    )
+    await db.execute(stmt)
@@ -0,0 +1,68 @@
+"""
+Enrollment 목록 keyset 페이지네이션
+
+OFFSET 대신 (createdAt, id) 기준으로 다음 페이지를 조회합니다. 커서는 마지막 행의
+(createdAt, id)를 base64로 인코딩한 문자열이며, 페이지 깊이와 관계없이 조회 비용이 일정합니다.
+"""
+import base64
+from datetime import datetime
+from typing import Optional, Sequence, Tuple
+
+from sqlalchemy import Select, tuple_
+
+from models import Enrollment
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(created_at: datetime, enrollment_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{enrollment_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    커서 디코딩
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, enrollment_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(enrollment_id)
+    except (ValueError, UnicodeError):
+        raise ValueError("잘못된 페이지 커서입니다.")
+
+
+def order_by_keyset(stmt: Select, descending: bool = False) -> Select:
+    """(createdAt, id) 순서로 정렬"""
+    if descending:
+        return stmt.order_by(Enrollment.createdAt.desc(), Enrollment.id.desc())
+    return stmt.order_by(Enrollment.createdAt, Enrollment.id)
+
+
+def keyset_page(stmt: Select, cursor: Optional[str], limit: int, descending: bool = False) -> Select:
+    """
+    커서 이후의 한 페이지를 조회하는 쿼리 생성
+
+    다음 페이지 존재 여부를 알기 위해 limit + 1개 행을 조회합니다.
+    결과는 split_page로 잘라서 사용합니다.
+    """
+    if cursor:
+        key = tuple_(Enrollment.createdAt, Enrollment.id)
+        position = tuple_(*decode_cursor(cursor))
+        stmt = stmt.where(key < position if descending else key > position)
+
+    return order_by_keyset(stmt, descending).limit(limit + 1)
+
+
+def split_page(rows: Sequence, limit: int) -> Tuple[Sequence, Optional[str]]:
+    """조회한 행을 (현재 페이지, 다음 페이지 커서)로 분리"""
+    if len(rows) <= limit:
+        return rows, None
+
+    page = rows[:limit]
+    last = page[-1]
+    return page, encode_cursor(last.createdAt, last.id)
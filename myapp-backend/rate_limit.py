@@ -0,0 +1,217 @@
+"""
+인증 없이 호출되는 API의 요청 수 제한 (token bucket)
+
+/auth/login은 시도마다 bcrypt 검증을 하고, /auth/invitation/verify는 유효한 코드마다
+회원가입 세션을 만듭니다. 같은 IP나 같은 아이디 / 초대코드로 짧은 시간에 요청이 몰리면
+해시 / DB 작업을 하기 전에 429로 거절합니다.
+
+제한은 "burst/seconds" 형식입니다. (예: 10/60 → 최대 10회 연속, 60초에 걸쳐 10회분이 다시 채워짐)
+
+백엔드 (RATE_LIMIT_BACKEND, 기본값은 REGISTER_SESSION_BACKEND와 같음):
+- memory: 워커 프로세스 메모리. 워커가 1개일 때만 정확합니다.
+- shared: 같은 서버의 모든 gunicorn 워커가 공유하는 SQLite 파일 (SHARED_STATE_DIR)
+  버킷 하나를 UPSERT 한 번으로 갱신하므로 워커 간에도 토큰을 중복으로 쓰지 않습니다.
+"""
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import config
+import metrics
+
+MAX_KEY_LENGTH = 128
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    name: str
+    burst: int
+    period_seconds: float
+
+    @property
+    def rate(self) -> float:
+        """초당 채워지는 토큰 수"""
+        return self.burst / self.period_seconds
+
+    @classmethod
+    def parse(cls, name: str, spec: str) -> "RateLimit":
+        """
+        "10/60" 형식 파싱
+
+        Raises:
+            ValueError: 형식이 올바르지 않은 경우
+        """
+        try:
+            burst, seconds = spec.split("/")
+            limit = cls(name, int(burst), float(seconds))
+        except ValueError:
+            raise ValueError(f"Invalid rate limit for {name}: {spec!r} (expected 'burst/seconds')")
+        if limit.burst < 1 or limit.period_seconds <= 0:
+            raise ValueError(f"Invalid rate limit for {name}: {spec!r}")
+        return limit
+
+
+class RateLimited(Exception):
+    """요청 수 제한 초과"""
+
+    def __init__(self, limit: RateLimit, retry_after: float):
+        super().__init__(f"{limit.name} rate limit exceeded")
+        self.limit = limit
+        self.retry_after = retry_after
+
+
+class MemoryRateLimitStore:
+    """프로세스 메모리 기반 버킷 저장소"""
+
+    # take 호출 N번마다 가득 찬 버킷 정리
+    SWEEP_INTERVAL = 1000
+
+    def __init__(self):
+        # key → (남은 토큰, 마지막 갱신 시각, 가득 차는 데 걸리는 시간)
+        self._buckets: Dict[str, Tuple[float, float, float]] = {}
+        self._takes = 0
+
+    def _sweep(self, now: float) -> None:
+        full = [key for key, (_, updated_at, period) in self._buckets.items() if updated_at + period <= now]
+        for key in full:
+            del self._buckets[key]
+
+    async def take(self, key: str, limit: RateLimit) -> float:
+        """토큰 1개 사용 - 허용되면 0, 아니면 다시 시도할 수 있을 때까지의 초"""
+        now = time.monotonic()
+        self._takes += 1
+        if self._takes % self.SWEEP_INTERVAL == 0:
+            self._sweep(now)
+
+        tokens, updated_at, _ = self._buckets.get(key, (limit.burst, now, limit.period_seconds))
+        tokens = min(limit.burst, tokens + (now - updated_at) * limit.rate)
+        if tokens < 1:
+            self._buckets[key] = (tokens, now, limit.period_seconds)
+            return (1 - tokens) / limit.rate
+
+        self._buckets[key] = (tokens - 1, now, limit.period_seconds)
+        return 0.0
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+
+class SharedRateLimitStore:
+    """
+    SQLite 파일 기반 버킷 저장소
+
+    같은 서버의 여러 워커 프로세스가 하나의 파일을 공유합니다. (WAL 모드)
+    SQLite 호출은 스레드에서 실행하여 이벤트 루프를 막지 않습니다.
+    """
+
+    SWEEP_INTERVAL = 1000
+
+    # 토큰이 1개 이상 채워져 있을 때만 1개 사용 (없으면 새 버킷에서 1개 사용)
+    _TAKE = """
+        INSERT INTO rate_limit_bucket (key, tokens, updatedAt, period)
+        VALUES (:key, :burst - 1, :now, :period)
+        ON CONFLICT (key) DO UPDATE SET
+            tokens = min(:burst, tokens + (:now - updatedAt) * :rate) - 1,
+            updatedAt = :now,
+            period = :period
+        WHERE min(:burst, tokens + (:now - updatedAt) * :rate) >= 1
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._takes = 0
+        self._conn = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS rate_limit_bucket (
+                key TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updatedAt REAL NOT NULL,
+                period REAL NOT NULL
+            )
+            """
+        )
+
+    def _take(self, key: str, limit: RateLimit) -> float:
+        now = time.time()
+        params = {"key": key, "burst": limit.burst, "rate": limit.rate, "now": now, "period": limit.period_seconds}
+        with self._lock:
+            self._takes += 1
+            if self._takes % self.SWEEP_INTERVAL == 0:
+                self._conn.execute("DELETE FROM rate_limit_bucket WHERE updatedAt + period <= ?", (now,))
+
+            if self._conn.execute(self._TAKE, params).rowcount == 1:
+                return 0.0
+
+            row = self._conn.execute(
+                "SELECT min(:burst, tokens + (:now - updatedAt) * :rate) FROM rate_limit_bucket WHERE key = :key",
+                params,
+            ).fetchone()
+        tokens = row[0] if row else 0.0
+        return max(0.0, 1 - tokens) / limit.rate
+
+    async def take(self, key: str, limit: RateLimit) -> float:
+        """토큰 1개 사용 - 허용되면 0, 아니면 다시 시도할 수 있을 때까지의 초"""
+        return await asyncio.to_thread(self._take, key, limit)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM rate_limit_bucket")
+
+
+async def enforce(limit: RateLimit, value: Optional[str]) -> None:
+    """
+    value(IP, 아이디, 초대코드 등)의 버킷에서 토큰 1개 사용
+
+    Raises:
+        RateLimited: 토큰이 없는 경우 (예외 핸들러가 429 + Retry-After로 응답)
+    """
+    if not config.RATE_LIMIT_ENABLED or not value:
+        return
+
+    # 임의로 긴 값으로 저장소를 키우지 못하도록 키 길이 제한
+    retry_after = await rate_limit_store.take(f"{limit.name}:{value[:MAX_KEY_LENGTH]}", limit)
+    if retry_after:
+        metrics.RATE_LIMITED.labels(limit.name).inc()
+        raise RateLimited(limit, retry_after)
+
+
+def client_ip(request) -> str:
+    """
+    요청한 클라이언트 IP
+
+    RATE_LIMIT_PROXY_HOPS개의 프록시(Railway 등)를 거쳐 들어오는 경우, 가장 바깥 프록시가
+    X-Forwarded-For 끝에서 N번째에 붙인 주소를 사용합니다. (그 앞의 값은 클라이언트가 조작할 수 있음)
+    """
+    hops = config.RATE_LIMIT_PROXY_HOPS
+    if hops:
+        forwarded = [ip.strip() for ip in request.headers.get("x-forwarded-for", "").split(",") if ip.strip()]
+        if len(forwarded) >= hops:
+            return forwarded[-hops]
+    return request.client.host if request.client else ""
+
+
+LOGIN_PER_IP = RateLimit.parse("login_ip", config.LOGIN_RATE_LIMIT_PER_IP)
+LOGIN_PER_USER = RateLimit.parse("login_user", config.LOGIN_RATE_LIMIT_PER_USER)
+INVITATION_PER_IP = RateLimit.parse("invitation_ip", config.INVITATION_RATE_LIMIT_PER_IP)
+INVITATION_PER_CODE = RateLimit.parse("invitation_code", config.INVITATION_RATE_LIMIT_PER_CODE)
+
+
+def _create_store():
+    if config.RATE_LIMIT_BACKEND == "shared":
+        os.makedirs(config.SHARED_STATE_DIR, exist_ok=True)
+        return SharedRateLimitStore(os.path.join(config.SHARED_STATE_DIR, "rate_limits.sqlite3"))
+
+    if config.RATE_LIMIT_BACKEND == "memory":
+        return MemoryRateLimitStore()
+
+    raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {config.RATE_LIMIT_BACKEND}")
+
+
+rate_limit_store = _create_store()
@@ -0,0 +1,175 @@
+"""
+회원가입 세션 저장소
+
+초대코드 검증부터 비밀번호 입력까지의 단계별 입력값을 임시로 보관합니다.
+마지막 단계(save_password)에서만 DB에 User를 생성하고, 그 전까지는 DB를 사용하지 않습니다.
+
+백엔드 (REGISTER_SESSION_BACKEND):
+- memory: 워커 프로세스 메모리 (기본값). 워커가 1개일 때만 사용하세요.
+- shared: 같은 서버의 모든 gunicorn 워커가 공유하는 SQLite 파일 (SHARED_STATE_DIR)
+
+세션은 마지막 갱신 후 REGISTER_SESSION_TTL_SECONDS가 지나면 만료됩니다.
+"""
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, fields
+from typing import Dict, Optional, Tuple
+from uuid import uuid4
+
+import config
+
+
+@dataclass
+class RegisterSessionData:
+    sessionId: str
+    invitationId: int
+    name: Optional[str] = None
+    birthday: Optional[str] = None
+    phone: Optional[str] = None
+    userId: Optional[str] = None
+
+
+SESSION_FIELDS = tuple(f.name for f in fields(RegisterSessionData))
+
+
+class MemoryRegisterSessionStore:
+    """프로세스 메모리 기반 세션 저장소"""
+
+    # create 호출 N번마다 만료된 세션 정리
+    SWEEP_INTERVAL = 100
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._sessions: Dict[str, Tuple[float, RegisterSessionData]] = {}
+        self._creates = 0
+
+    def _sweep(self, now: float) -> None:
+        expired = [key for key, (expires_at, _) in self._sessions.items() if expires_at <= now]
+        for key in expired:
+            del self._sessions[key]
+
+    async def create(self, invitation_id: int) -> str:
+        now = time.monotonic()
+        self._creates += 1
+        if self._creates % self.SWEEP_INTERVAL == 0:
+            self._sweep(now)
+
+        session = RegisterSessionData(sessionId=uuid4().hex, invitationId=invitation_id)
+        self._sessions[session.sessionId] = (now + self.ttl_seconds, session)
+        return session.sessionId
+
+    async def get(self, session_id: str) -> Optional[RegisterSessionData]:
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+
+        expires_at, session = entry
+        if expires_at <= time.monotonic():
+            del self._sessions[session_id]
+            return None
+
+        return RegisterSessionData(**vars(session))
+
+    async def update(self, session_id: str, **values) -> bool:
+        session = await self.get(session_id)
+        if session is None:
+            return False
+
+        for key, value in values.items():
+            setattr(session, key, value)
+        self._sessions[session_id] = (time.monotonic() + self.ttl_seconds, session)
+        return True
+
+    async def delete(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+
+class SharedRegisterSessionStore:
+    """
+    SQLite 파일 기반 세션 저장소
+
+    같은 서버의 여러 워커 프로세스가 하나의 파일을 공유합니다. (WAL 모드)
+    SQLite 호출은 스레드에서 실행하여 이벤트 루프를 막지 않습니다.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS register_session (
+                sessionId TEXT PRIMARY KEY,
+                invitationId INTEGER NOT NULL,
+                name TEXT,
+                birthday TEXT,
+                phone TEXT,
+                userId TEXT,
+                expiresAt REAL NOT NULL
+            )
+            """
+        )
+
+    def _execute(self, sql: str, params: tuple = ()) -> Tuple[list, int]:
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            return cursor.fetchall(), cursor.rowcount
+
+    async def _run(self, sql: str, params: tuple = ()) -> Tuple[list, int]:
+        """(조회 결과 행, 변경된 행 수) 반환"""
+        return await asyncio.to_thread(self._execute, sql, params)
+
+    async def create(self, invitation_id: int) -> str:
+        session_id = uuid4().hex
+        now = time.time()
+        await self._run("DELETE FROM register_session WHERE expiresAt <= ?", (now,))
+        await self._run(
+            "INSERT INTO register_session (sessionId, invitationId, expiresAt) VALUES (?, ?, ?)",
+            (session_id, invitation_id, now + self.ttl_seconds),
+        )
+        return session_id
+
+    async def get(self, session_id: str) -> Optional[RegisterSessionData]:
+        rows, _ = await self._run(
+            f"SELECT {', '.join(SESSION_FIELDS)} FROM register_session WHERE sessionId = ? AND expiresAt > ?",
+            (session_id, time.time()),
+        )
+        if not rows:
+            return None
+        return RegisterSessionData(*rows[0])
+
+    async def update(self, session_id: str, **values) -> bool:
+        unknown = set(values) - set(SESSION_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown register session fields: {sorted(unknown)}")
+
+        assignments = ", ".join(f"{key} = ?" for key in values)
+        now = time.time()
+        _, rowcount = await self._run(
+            f"UPDATE register_session SET {assignments}, expiresAt = ? WHERE sessionId = ? AND expiresAt > ?",
+            (*values.values(), now + self.ttl_seconds, session_id, now),
+        )
+        return rowcount == 1
+
+    async def delete(self, session_id: str) -> None:
+        await self._run("DELETE FROM register_session WHERE sessionId = ?", (session_id,))
+
+
+def _create_store():
+    if config.REGISTER_SESSION_BACKEND == "shared":
+        os.makedirs(config.SHARED_STATE_DIR, exist_ok=True)
+        path = os.path.join(config.SHARED_STATE_DIR, "register_sessions.sqlite3")
+        return SharedRegisterSessionStore(path, config.REGISTER_SESSION_TTL_SECONDS)
+
+    if config.REGISTER_SESSION_BACKEND == "memory":
+        return MemoryRegisterSessionStore(config.REGISTER_SESSION_TTL_SECONDS)
+
+    raise ValueError(f"Unknown REGISTER_SESSION_BACKEND: {config.REGISTER_SESSION_BACKEND}")
+
+
+register_session_store = _create_store()
@@ -0,0 +1,93 @@
+"""
+자주 실행되는 단건 조회 (ORM 객체 생성 없이 필요한 컬럼만 조회)
+
+인증, 로그인, 참가 여부 / 쿠폰 확인, 초대코드 검증은 요청마다 실행되지만 몇 개 컬럼만 읽습니다.
+AsyncSession.execute(select(Model))은 매번 ORM 컴파일 단계와 identity map 등록,
+속성 계측이 붙은 객체 생성을 거치므로, 여기서는
+
+- 모듈 로드 시 한 번 만든 statement를 재사용하고 (SQL 컴파일 캐시 적중)
+- 세션의 커넥션에서 Core로 실행하여 (같은 트랜잭션, ORM 처리 생략)
+- Row 또는 __slots__ 레코드를 반환합니다.
+
+반환값은 세션에 연결되지 않으므로 수정 후 commit해도 DB에 반영되지 않습니다.
+변경이 필요한 경우에는 기존처럼 UPDATE 문이나 ORM 객체를 사용하세요.
+
+성능 비교: python bench_repository.py
+"""
+from typing import Any, List, Optional
+
+from sqlalchemy import bindparam, exists, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Enrollment, Invitation, User
+from user_cache import CachedUser
+
+# CachedUser.__slots__와 같은 순서
+_USER_BY_ID = select(
+    User.id, User.userId, User.name, User.birthday, User.phone, User.invitationId
+).where(User.id == bindparam("id"))
+
+_LOGIN_BY_USER_ID = select(User.id, User.name, User.password).where(User.userId == bindparam("user_id"))
+
+_USER_ID_TAKEN = select(exists().where(User.userId == bindparam("user_id")))
+
+_PHONE_TAKEN = select(exists().where(User.phone == bindparam("phone")))
+
+# (userId, partyId)는 고유 인덱스(Enrollment_userId_partyId_key)이므로 최대 한 행
+_ENROLLMENT_BY_USER_PARTY = (
+    select(Enrollment.id, Enrollment.partyId, Enrollment.status, Enrollment.couponUsed, Enrollment.createdAt)
+    .where(Enrollment.userId == bindparam("user_id"), Enrollment.partyId == bindparam("party_id"))
+)
+
+_INVITATION_BY_CODE = select(Invitation.id, Invitation.is_active).where(Invitation.code == bindparam("code"))
+
+_INVITATION_STATES = select(Invitation.code, Invitation.is_active)
+
+
+async def _first(db: AsyncSession, statement, params: dict) -> Optional[Row]:
+    conn = await db.connection()
+    result = await conn.execute(statement, params)
+    return result.first()
+
+
+async def _scalar(db: AsyncSession, statement, params: dict) -> Any:
+    conn = await db.connection()
+    result = await conn.execute(statement, params)
+    return result.scalar()
+
+
+async def get_user_by_id(db: AsyncSession, id: int) -> Optional[CachedUser]:
+    """User.id로 조회 (인증용, 비밀번호 해시 제외)"""
+    row = await _first(db, _USER_BY_ID, {"id": id})
+    return CachedUser(*row) if row is not None else None
+
+
+async def get_login_user(db: AsyncSession, user_id: str) -> Optional[Row]:
+    """로그인 아이디(User.userId)로 조회 - Row(id, name, password)"""
+    return await _first(db, _LOGIN_BY_USER_ID, {"user_id": user_id})
+
+
+async def user_id_taken(db: AsyncSession, user_id: str) -> bool:
+    return await _scalar(db, _USER_ID_TAKEN, {"user_id": user_id})
+
+
+async def phone_taken(db: AsyncSession, phone: str) -> bool:
+    return await _scalar(db, _PHONE_TAKEN, {"phone": phone})
+
+
+async def get_enrollment(db: AsyncSession, user_id: int, party_id: int) -> Optional[Row]:
+    """(User.id, partyId)의 참가 신청 조회 - Row(id, partyId, status, couponUsed, createdAt)"""
+    return await _first(db, _ENROLLMENT_BY_USER_PARTY, {"user_id": user_id, "party_id": party_id})
+
+
+async def get_invitation_by_code(db: AsyncSession, code: str) -> Optional[Row]:
+    """초대코드 조회 - Row(id, is_active)"""
+    return await _first(db, _INVITATION_BY_CODE, {"code": code})
+
+
+async def get_invitation_states(db: AsyncSession) -> List[Row]:
+    """모든 초대코드 - Row(code, is_active) 목록 (초대코드 인덱스용)"""
+    conn = await db.connection()
+    result = await conn.execute(_INVITATION_STATES)
+    return result.all()
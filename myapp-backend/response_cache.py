@@ -0,0 +1,111 @@
+"""
+공개 조회 API 응답 캐시 (프로세스 내 TTL + ETag)
+
+인증이 필요 없는 조회 API의 응답 본문을 라우트별 TTL 동안 캐시합니다.
+- 캐시 적중 시 DB를 조회하지 않습니다. (get_db 세션은 쿼리 전까지 커넥션을 잡지 않음)
+- 같은 키를 동시에 요청하면 한 요청만 응답을 만들고 나머지는 그 결과를 기다립니다.
+- 응답 본문의 해시로 강한 ETag를 만들고, If-None-Match가 일치하면 304를 반환합니다.
+
+캐시는 워커마다 따로 존재합니다. 파티 정보는 승인/거절 시 발행되는 party:{id} 이벤트가
+LISTEN/NOTIFY로 모든 워커에 전달되고, 각 워커의 events.publish_local이 invalidate를 호출하여
+함께 무효화됩니다. (리스너가 재연결 중이라 알림을 놓친 워커는 TTL이 지나면 갱신)
+"""
+import asyncio
+import hashlib
+import time
+from typing import Awaitable, Callable, Dict
+
+from fastapi import Request, Response
+from fastapi.responses import ORJSONResponse
+
+
+class _CachedBody:
+    __slots__ = ("expires_at", "body", "etag")
+
+    def __init__(self, expires_at: float, body: bytes, etag: str):
+        self.expires_at = expires_at
+        self.body = body
+        self.etag = etag
+
+
+_entries: Dict[str, _CachedBody] = {}
+_inflight: Dict[str, "asyncio.Future[_CachedBody]"] = {}
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    return any(candidate.strip() == etag for candidate in if_none_match.split(","))
+
+
+async def _build(key: str, ttl: int, build: Callable[[], Awaitable[dict]]) -> _CachedBody:
+    while True:
+        future = _inflight.get(key)
+        if future is None:
+            break
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            # 응답을 만들던 요청이 취소됨 (클라이언트 연결 종료 등) - 기다리던 요청이 다시 만듦
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        body = ORJSONResponse(await build()).body
+        entry = _CachedBody(time.monotonic() + ttl, body, f'"{hashlib.sha1(body).hexdigest()}"')
+        _entries[key] = entry
+        future.set_result(entry)
+        return entry
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        future.set_exception(exc)
+        # 기다리는 요청이 없을 때 "exception was never retrieved" 경고 방지
+        future.exception()
+        raise
+    finally:
+        del _inflight[key]
+
+
+async def cached_json(
+    request: Request,
+    key: str,
+    ttl: int,
+    build: Callable[[], Awaitable[dict]],
+) -> Response:
+    """
+    캐시된 JSON 응답 반환 (없거나 만료되면 build로 생성)
+
+    Args:
+        request: If-None-Match 헤더 확인용
+        key: 캐시 키 (예: "party:1:info")
+        ttl: 캐시 유지 시간(초), Cache-Control max-age로도 사용
+        build: 응답 dict를 만드는 코루틴 함수
+    """
+    entry = _entries.get(key)
+    if entry is None or entry.expires_at <= time.monotonic():
+        entry = await _build(key, ttl, build)
+
+    headers = {"ETag": entry.etag, "Cache-Control": f"public, max-age={ttl}"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, entry.etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+def invalidate(key: str) -> None:
+    """캐시 항목 제거 (현재 워커, 다른 워커는 events.publish_local에서 호출)"""
+    _entries.pop(key, None)
+
+
+def clear() -> None:
+    _entries.clear()
+
+
+def party_info_key(party_id: int) -> str:
+    return f"party:{party_id}:info"
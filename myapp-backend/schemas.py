@@ -0,0 +1,358 @@
+"""
+API 응답 모델
+
+각 라우트의 response_model로 선언되어 OpenAPI 문서에 응답 형식이 표시되고,
+핸들러가 dict를 반환하면 pydantic-core로 검증 / 직렬화한 뒤 ORJSONResponse로 응답합니다.
+extra="forbid"이므로 모델에 없는 키를 반환하면 조용히 빠지지 않고 오류가 납니다.
+(성공 / 실패 응답 Union도 이 설정으로 정확히 한 모델에만 맞음)
+
+관리자 목록처럼 행이 많은 응답은 검증을 거치지 않고 listing_response로
+조회한 행(tuple)에서 바로 JSON을 만듭니다. 응답 형식은 아래 목록 모델과 같습니다.
+
+직렬화 비교: python bench_serialization.py
+"""
+from datetime import datetime
+from typing import List, Literal, Optional, Sequence, Tuple, Union
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+
+
+class ApiModel(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+
+class MessageResponse(ApiModel):
+    """결과 메시지만 있는 응답 (대부분의 실패 응답)"""
+    ok: bool
+    message: str
+
+
+class OkResponse(ApiModel):
+    ok: Literal[True]
+
+
+# ====================================================================================
+# 헬스 체크 / 준비 상태 / 결제 정보
+# ====================================================================================
+
+
+class HealthResponse(ApiModel):
+    status: str
+    service: str
+
+
+class ReadyResponse(ApiModel):
+    ready: bool
+    warmedUpAt: Optional[str]
+    warmupMs: Optional[float]
+    lastError: Optional[str]
+
+
+class PaymentInfo(ApiModel):
+    bankName: str
+    accountNumber: str
+    accountHolder: str
+    amount: int
+
+
+class PaymentInfoResponse(ApiModel):
+    ok: Literal[True]
+    payment: PaymentInfo
+
+
+# ====================================================================================
+# 초대코드 / 로그인 / 회원가입
+# ====================================================================================
+
+
+class InvitationValidResponse(ApiModel):
+    valid: Literal[True]
+    sessionId: str
+
+
+class InvitationInvalidResponse(ApiModel):
+    valid: Literal[False]
+    message: str
+
+
+InvitationResponse = Union[InvitationValidResponse, InvitationInvalidResponse]
+
+
+class LoginSuccessResponse(ApiModel):
+    ok: Literal[True]
+    userId: int
+    name: str
+    accessToken: str
+    tokenType: str
+
+
+LoginResponse = Union[LoginSuccessResponse, MessageResponse]
+
+RegisterStepResponse = Union[OkResponse, MessageResponse]
+
+
+class RegisterSuccessResponse(ApiModel):
+    ok: Literal[True]
+    userId: int
+    accessToken: str
+    tokenType: str
+
+
+RegisterResponse = Union[RegisterSuccessResponse, MessageResponse]
+
+
+# ====================================================================================
+# 참가 신청 / 파티 정보
+# ====================================================================================
+
+
+class EnrollResponse(ApiModel):
+    ok: bool
+    message: str
+    enrollment_id: int
+    status: str
+
+
+class EnrollmentCheckResponse(ApiModel):
+    enrolled: bool
+
+
+class PartyInfoResponse(ApiModel):
+    ok: Literal[True]
+    partyId: int
+    totalSpots: int
+    enrolledCount: int
+    spotsLeft: int
+
+
+# ====================================================================================
+# 관리자 목록 (listing_response로 직렬화)
+# ====================================================================================
+
+
+class EnrollmentUser(ApiModel):
+    id: int
+    name: str
+    birthday: str
+    phone: str
+
+
+class EnrollmentItem(ApiModel):
+    id: int
+    partyId: int
+    enrolled: bool
+    createdAt: datetime
+    user: EnrollmentUser
+
+
+class EnrollmentListResponse(ApiModel):
+    enrollments: List[EnrollmentItem]
+    count: int
+    nextCursor: Optional[str]
+
+
+class PartyEnrollmentListResponse(ApiModel):
+    partyId: int
+    enrollments: List[EnrollmentItem]
+    count: int
+    nextCursor: Optional[str]
+
+
+class PendingEnrollmentUser(ApiModel):
+    id: int
+    userId: Optional[str]
+    name: str
+    birthday: str
+    phone: str
+
+
+class PendingEnrollmentItem(ApiModel):
+    id: int
+    partyId: int
+    status: str
+    createdAt: datetime
+    user: PendingEnrollmentUser
+
+
+class PendingEnrollmentListResponse(ApiModel):
+    ok: Literal[True]
+    enrollments: List[PendingEnrollmentItem]
+    count: int
+    nextCursor: Optional[str]
+
+
+# EnrollmentItem / PendingEnrollmentItem의 필드 순서 (user 제외) - SELECT 컬럼 순서와 같아야 함
+ENROLLMENT_ITEM_FIELDS = ("id", "partyId", "enrolled", "createdAt")
+ENROLLMENT_USER_FIELDS = ("id", "name", "birthday", "phone")
+PENDING_ITEM_FIELDS = ("id", "partyId", "status", "createdAt")
+PENDING_USER_FIELDS = ("id", "userId", "name", "birthday", "phone")
+
+
+def listing_response(
+    rows: Sequence[tuple],
+    item_fields: Tuple[str, ...],
+    user_fields: Tuple[str, ...],
+    next_cursor: Optional[str],
+    **head,
+) -> ORJSONResponse:
+    """
+    조회한 행에서 바로 목록 응답 생성 (pydantic 검증 / jsonable_encoder 생략)
+
+    각 행은 item_fields 컬럼 다음에 user_fields 컬럼이 오는 순서여야 합니다.
+    datetime은 orjson이 ISO 8601 문자열로 직렬화합니다. head는 목록 앞에 붙는 키입니다.
+    count는 이 페이지의 항목 수입니다. (전체 건수를 세면 페이지마다 목록 전체를 읽게 되므로 제공하지 않음)
+    """
+    split = len(item_fields)
+    items = []
+    for row in rows:
+        item = dict(zip(item_fields, row))
+        item["user"] = dict(zip(user_fields, row[split:]))
+        items.append(item)
+    return ORJSONResponse({**head, "enrollments": items, "count": len(items), "nextCursor": next_cursor})
+
+
+# ====================================================================================
+# 승인 관리 (관리자)
+# ====================================================================================
+
+
+class EnrollmentActionResponse(ApiModel):
+    ok: Literal[True]
+    message: str
+    enrollment_id: int
+
+
+EnrollmentDecisionResponse = Union[EnrollmentActionResponse, MessageResponse]
+
+
+class BulkOutcome(ApiModel):
+    enrollment_id: int
+    outcome: Literal["updated", "unchanged", "not_found", "capacity_exceeded"]
+
+
+class BulkUpdateResultResponse(ApiModel):
+    ok: Literal[True]
+    status: Literal["approved", "rejected"]
+    updated: int
+    results: List[BulkOutcome]
+
+
+BulkUpdateResponse = Union[BulkUpdateResultResponse, MessageResponse]
+
+
+class ConnectionBudget(ApiModel):
+    maxConnections: int
+    reserved: int
+    workers: int
+
+
+class LivenessStatus(ApiModel):
+    ok: Optional[bool]
+    lastCheckedAt: Optional[str]
+    latencyMs: Optional[float]
+    consecutiveFailures: int
+    lastError: Optional[str]
+
+
+class ReplicaStatus(ApiModel):
+    configured: bool
+    inUse: bool
+    lagSeconds: Optional[float]
+    maxLagSeconds: float
+    lastError: Optional[str]
+
+
+class PoolStatusResponse(ApiModel):
+    ok: Literal[True]
+    poolSize: int
+    checkedOut: int
+    checkedIn: int
+    timeoutSeconds: float
+    budget: ConnectionBudget
+    pgbouncer: bool
+    liveness: LivenessStatus
+    replica: ReplicaStatus
+
+
+class HashingStats(ApiModel):
+    workers: int
+    queueLimit: int
+    inFlight: int
+    queueDepth: int
+    completed: int
+    rejected: int
+    avgWaitSeconds: float
+    avgRunSeconds: float
+    maxLatencySeconds: float
+
+
+class HashingStatsResponse(ApiModel):
+    ok: Literal[True]
+    hashing: HashingStats
+
+
+# ====================================================================================
+# 쿠폰 / 프로필
+# ====================================================================================
+
+
+class CouponResponse(ApiModel):
+    ok: Literal[True]
+    couponUsed: bool
+    partyId: int
+    status: str
+
+
+class CouponStatusResponse(ApiModel):
+    """승인되지 않은 참가 신청 (status 포함)"""
+    ok: Literal[False]
+    message: str
+    status: str
+
+
+CouponLookupResponse = Union[CouponResponse, CouponStatusResponse, MessageResponse]
+
+
+class CouponUseResponse(ApiModel):
+    ok: bool
+    code: Literal["redeemed", "not_found", "already_used"]
+    message: str
+
+
+class CouponUseNotApprovedResponse(ApiModel):
+    ok: Literal[False]
+    code: Literal["not_approved"]
+    message: str
+    status: str
+
+
+CouponUseResult = Union[CouponUseResponse, CouponUseNotApprovedResponse]
+
+
+class ProfileUser(ApiModel):
+    id: int
+    userId: Optional[str]
+    name: str
+    birthday: str
+    phone: str
+
+
+class ProfileEnrollment(ApiModel):
+    partyId: int
+    enrolledAt: datetime
+    couponUsed: bool
+    status: str
+
+
+class CouponSummary(ApiModel):
+    total: int
+    used: int
+    available: int
+
+
+class ProfileResponse(ApiModel):
+    ok: Literal[True]
+    user: ProfileUser
+    enrollments: List[ProfileEnrollment]
+    couponSummary: CouponSummary
@@ -15,16 +15,22 @@ if [ -d "venv" ]; then
     source venv/bin/activate
 fi
 
+# 여러 워커가 회원가입 세션을 공유하도록 shared 저장소 사용
+export REGISTER_SESSION_BACKEND="${REGISTER_SESSION_BACKEND:-shared}"
+
+# 리버스 프록시(Railway 등) 1개 뒤에서 실행 - 요청 수 제한은 X-Forwarded-For의 클라이언트 IP 기준
+# (프록시 없이 직접 노출하는 경우 RATE_LIMIT_PROXY_HOPS=0으로 실행)
+export RATE_LIMIT_PROXY_HOPS="${RATE_LIMIT_PROXY_HOPS:-1}"
+
 # Gunicorn으로 애플리케이션 실행
-# -w: worker 프로세스 수 (CPU 코어 수 * 2 + 1 권장)
 # -k: worker 클래스 (uvicorn.workers.UvicornWorker 사용)
 # --bind: 바인딩할 주소와 포트
 # --access-logfile: 액세스 로그 파일
 # --error-logfile: 에러 로그 파일
 # --log-level: 로그 레벨
 
+# 워커 수는 gunicorn.conf.py에서 WEB_CONCURRENCY(기본 4)로 설정
 exec gunicorn main:app \
-    -w 4 \
     -k uvicorn.workers.UvicornWorker \
     --bind 0.0.0.0:8000 \
     --access-logfile logs/access.log \
@@ -0,0 +1,54 @@
+"""
+인증 사용자 캐시 테스트
+"""
+from sqlalchemy import update
+
+from models import User
+from user_cache import invalidate_user
+
+
+def test_authenticated_requests_reuse_cached_user(data):
+    async def scenario():
+        await data.create_user(1)
+        await data.create_user(2, name="첫이름")
+        headers = data.auth_headers(2)
+
+        async with data.client() as client:
+            await client.get("/profile/2", headers=headers)
+
+            # 두 번째 요청부터는 User 조회 없이 Enrollment 조회만 실행
+            with data.count_queries() as counter:
+                response = await client.get("/profile/2", headers=headers)
+            assert response.json()["user"]["name"] == "첫이름"
+            assert counter["count"] == 1
+
+            # ORM을 거치지 않은 변경은 명시적으로 무효화
+            async with data.session_factory() as db:
+                await db.execute(update(User).where(User.id == 2).values(name="새이름"))
+                await db.commit()
+            invalidate_user(2)
+
+            response = await client.get("/profile/2", headers=headers)
+            assert response.json()["user"]["name"] == "새이름"
+
+    data.run(scenario)
+
+
+def test_orm_update_invalidates_cache(data):
+    async def scenario():
+        await data.create_user(1)
+        await data.create_user(2, name="첫이름")
+        headers = data.auth_headers(2)
+
+        async with data.client() as client:
+            await client.get("/profile/2", headers=headers)
+
+            async with data.session_factory() as db:
+                user = await db.get(User, 2)
+                user.name = "새이름"
+                await db.commit()
+
+            response = await client.get("/profile/2", headers=headers)
+            assert response.json()["user"]["name"] == "새이름"
+
+    data.run(scenario)
@@ -0,0 +1,66 @@
+"""
+관리자 일괄 승인/거절 (POST /admin/enrollments/bulk) 테스트
+"""
+from sqlalchemy import select
+
+from models import Enrollment, PartyStats
+
+
+def test_bulk_approve_and_reject(data):
+    async def scenario():
+        await data.create_user(1)
+        for user_id in range(2, 12):
+            await data.create_user(user_id)
+            await data.create_enrollment(user_id, party_id=1, status="approved" if user_id == 2 else "pending")
+        headers = data.auth_headers(1)
+
+        async with data.client() as client:
+            with data.count_queries() as counter:
+                response = await client.post(
+                    "/admin/enrollments/bulk",
+                    json={"enrollment_ids": list(range(1, 11)) + [999], "status": "approved"},
+                    headers=headers,
+                )
+            # 관리자 조회 + 잠금 조회 + 카운터 확보(3) + UPDATE + 이벤트(정원 조회, NOTIFY) (건수와 무관)
+            assert counter["count"] == 8
+
+            body = response.json()
+            assert body["updated"] == 9
+            outcomes = {item["enrollment_id"]: item["outcome"] for item in body["results"]}
+            assert outcomes[1] == "unchanged"
+            assert outcomes[999] == "not_found"
+            assert all(outcomes[id] == "updated" for id in range(2, 11))
+
+            info = (await client.get("/party/1/info")).json()
+            assert info["enrolledCount"] == 10
+
+            response = await client.post(
+                "/admin/enrollments/bulk",
+                json={"enrollment_ids": [1, 2, 3], "status": "rejected"},
+                headers=headers,
+            )
+            assert response.json()["updated"] == 3
+
+        async with data.session_factory() as db:
+            approved_count = (await db.execute(select(PartyStats.approvedCount))).scalar_one()
+            statuses = (await db.execute(select(Enrollment.status).order_by(Enrollment.id))).scalars().all()
+        assert approved_count == 7
+        assert statuses[:3] == ["rejected"] * 3
+
+    data.run(scenario)
+
+
+def test_bulk_request_is_capped(data):
+    async def scenario():
+        import config
+
+        await data.create_user(1)
+        async with data.client() as client:
+            response = await client.post(
+                "/admin/enrollments/bulk",
+                json={"enrollment_ids": list(range(config.BULK_ENROLLMENT_MAX + 1)), "status": "approved"},
+                headers=data.auth_headers(1),
+            )
+        assert response.json()["ok"] is False
+
+    data.run(scenario)
@@ -0,0 +1,48 @@
+"""
+쿠폰 사용 (PUT /coupon/use) 테스트
+"""
+import asyncio
+
+from sqlalchemy import select
+
+from models import Enrollment
+
+
+def test_concurrent_redemptions_succeed_exactly_once(data):
+    async def scenario():
+        await data.create_user(2)
+        await data.create_enrollment(2, party_id=1, status="approved")
+        headers = data.auth_headers(2)
+
+        async with data.client() as client:
+            responses = await asyncio.gather(*[
+                client.put("/coupon/use", json={"user_id": 2, "party_id": 1}, headers=headers)
+                for _ in range(40)
+            ])
+
+        codes = [response.json()["code"] for response in responses]
+        assert codes.count("redeemed") == 1
+        assert codes.count("already_used") == 39
+
+        async with data.session_factory() as db:
+            coupon_used = (await db.execute(select(Enrollment.couponUsed))).scalar_one()
+        assert coupon_used is True
+
+    data.run(scenario)
+
+
+def test_redemption_result_codes(data):
+    async def scenario():
+        await data.create_user(2)
+        await data.create_enrollment(2, party_id=1, status="pending")
+        headers = data.auth_headers(2)
+
+        async with data.client() as client:
+            not_approved = await client.put("/coupon/use", json={"user_id": 2, "party_id": 1}, headers=headers)
+            not_found = await client.put("/coupon/use", json={"user_id": 2, "party_id": 9}, headers=headers)
+
+        assert not_approved.json()["code"] == "not_approved"
+        assert not_approved.json()["status"] == "pending"
+        assert not_found.json()["code"] == "not_found"
+
+    data.run(scenario)
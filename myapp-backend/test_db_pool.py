@@ -0,0 +1,80 @@
+"""
+DB 커넥션 풀 크기 계산 / pgBouncer 모드 / 생존 확인 테스트
+"""
+import asyncio
+import os
+
+import asyncpg
+import pytest
+
+
+def test_pool_size_fits_connection_budget():
+    from database import pool_size_for_budget
+
+    # 20개 예산, 예비 2개, 워커 4개 (각 워커 LISTEN 1개) -> 워커당 3개, 합계 2 + 4 + 12 = 18
+    assert pool_size_for_budget(20, 2, 4) == 3
+    assert pool_size_for_budget(20, 2, 1) == 17
+    for budget, reserved, workers in [(20, 2, 4), (60, 5, 4), (25, 0, 3), (10, 2, 2)]:
+        per_worker = pool_size_for_budget(budget, reserved, workers)
+        assert reserved + workers * (per_worker + 1) <= budget
+
+    with pytest.raises(ValueError):
+        pool_size_for_budget(8, 2, 4)
+
+
+def test_pgbouncer_mode_disables_statement_caches(monkeypatch):
+    import config
+    from database import _connect_args
+
+    assert _connect_args() == {}
+
+    monkeypatch.setattr(config, "DB_PGBOUNCER", True)
+    args = _connect_args()
+    assert args["statement_cache_size"] == 0
+    assert args["prepared_statement_cache_size"] == 0
+    assert args["prepared_statement_name_func"]() != args["prepared_statement_name_func"]()
+
+
+def test_liveness_check_and_pool_status(data):
+    async def scenario():
+        from database import pool_monitor
+
+        await data.create_user(1)
+        assert await pool_monitor.check() is True
+
+        async with data.client() as client:
+            response = await client.get("/admin/db/pool", headers=data.auth_headers(1))
+        body = response.json()
+        assert body["ok"] is True
+        assert body["poolSize"] == data.engine.sync_engine.pool.size()
+        assert body["liveness"]["ok"] is True
+        assert body["liveness"]["consecutiveFailures"] == 0
+
+    data.run(scenario)
+
+
+def test_liveness_check_recovers_after_server_side_disconnect(data):
+    async def scenario():
+        from sqlalchemy import text
+        from database import pool_monitor
+
+        async with data.engine.connect() as conn:
+            backend_pid = (await conn.execute(text("SELECT pg_backend_pid()"))).scalar_one()
+
+        # 풀에 남아 있는 유휴 커넥션을 서버에서 끊음 (DB 재시작 / 유휴 타임아웃과 동일)
+        admin_conn = await asyncpg.connect(os.environ["TEST_DATABASE_URL"])
+        try:
+            await admin_conn.execute("SELECT pg_terminate_backend($1)", backend_pid)
+            # 종료 신호는 비동기로 처리되므로 백엔드가 실제로 끝날 때까지 대기
+            while await admin_conn.fetchval("SELECT count(*) FROM pg_stat_activity WHERE pid = $1", backend_pid):
+                await asyncio.sleep(0.01)
+        finally:
+            await admin_conn.close()
+
+        # 끊긴 커넥션은 생존 확인에서 발견되고 풀이 무효화됨 -> 다음 요청은 정상 처리
+        checks = [await pool_monitor.check() for _ in range(2)]
+        assert checks == [False, True]
+        async with data.client() as client:
+            assert (await client.get("/party/1/info")).status_code == 200
+
+    data.run(scenario)
@@ -0,0 +1,53 @@
+"""
+파티 참가 신청 (POST /enroll) 테스트
+"""
+import asyncio
+
+from sqlalchemy import func, select
+
+from models import Enrollment
+
+
+def test_concurrent_enroll_creates_single_row(data):
+    async def scenario():
+        await data.create_user(2)
+        headers = data.auth_headers(2)
+
+        async with data.client() as client:
+            await client.get("/profile/2", headers=headers)  # 사용자 캐시 채우기
+
+            with data.count_queries() as counter:
+                response = await client.post("/enroll", json={"user_id": 2, "party_id": 1}, headers=headers)
+            assert response.json()["status"] == "pending"
+            assert counter["count"] == 1
+
+            responses = await asyncio.gather(*[
+                client.post("/enroll", json={"user_id": 2, "party_id": 1}, headers=headers)
+                for _ in range(20)
+            ])
+
+        enrollment_ids = {r.json()["enrollment_id"] for r in responses}
+        assert enrollment_ids == {response.json()["enrollment_id"]}
+
+        async with data.session_factory() as db:
+            count = (await db.execute(select(func.count()).select_from(Enrollment))).scalar_one()
+        assert count == 1
+
+    data.run(scenario)
+
+
+def test_enroll_reports_existing_status(data):
+    async def scenario():
+        await data.create_user(2)
+        await data.create_enrollment(2, party_id=1, status="rejected")
+
+        async with data.client() as client:
+            with data.count_queries() as counter:
+                response = await client.post("/enroll", json={"user_id": 2, "party_id": 1}, headers=data.auth_headers(2))
+
+        assert response.json()["ok"] is False
+        assert response.json()["status"] == "rejected"
+        # 사용자 조회 + INSERT + 기존 행 조회
+        assert counter["count"] == 3
+
+    data.run(scenario)
@@ -0,0 +1,141 @@
+"""
+관리자 enrollment 목록 API 테스트
+
+목록 API가 행 수와 관계없이 일정한 개수의 쿼리만 실행하는지 확인합니다. (N+1 방지)
+"""
+import csv
+import io
+import json
+from datetime import datetime
+
+from user_cache import clear_user_cache
+
+LISTING_URLS = [
+    "/enrollments",
+    "/enrollments/party/1",
+    "/admin/enrollments/pending",
+]
+
+
+async def measure_listings(data, client, expected_count):
+    query_counts = {}
+    for url in LISTING_URLS:
+        clear_user_cache()
+        with data.count_queries() as counter:
+            response = await client.get(url, headers=data.auth_headers(1))
+        assert response.status_code == 200
+        assert response.json()["count"] == expected_count
+        query_counts[url] = counter["count"]
+    return query_counts
+
+
+def test_listing_query_count_is_constant(data):
+    async def scenario():
+        await data.create_user(1)
+        for user_id in range(2, 4):
+            await data.create_user(user_id)
+            await data.create_enrollment(user_id)
+
+        async with data.client() as client:
+            small = await measure_listings(data, client, expected_count=2)
+
+            for user_id in range(4, 42):
+                await data.create_user(user_id)
+                await data.create_enrollment(user_id)
+
+            large = await measure_listings(data, client, expected_count=40)
+
+        assert small == large
+
+    data.run(scenario)
+
+
+def test_pending_listing_serializes_user(data):
+    async def scenario():
+        await data.create_user(1)
+        await data.create_user(2, userId="guest", name="게스트", phone="010-1234-5678")
+        await data.create_enrollment(2, status="pending")
+        await data.create_enrollment(1, status="approved")
+
+        async with data.client() as client:
+            response = await client.get("/admin/enrollments/pending", headers=data.auth_headers(1))
+
+        body = response.json()
+        assert body["count"] == 1
+        enrollment = body["enrollments"][0]
+        assert enrollment["status"] == "pending"
+        assert enrollment["user"] == {
+            "id": 2,
+            "userId": "guest",
+            "name": "게스트",
+            "birthday": "2000-01-01",
+            "phone": "010-1234-5678",
+        }
+
+    data.run(scenario)
+
+
+def test_keyset_pagination_walks_every_row_once(data):
+    async def scenario():
+        await data.create_user(1)
+        for user_id in range(2, 27):
+            await data.create_user(user_id)
+            # createdAt이 같은 행이 있어도 id로 순서가 결정되어야 함
+            await data.create_enrollment(user_id, createdAt=datetime(2025, 12, 1, 12, user_id // 5))
+
+        seen = []
+        async with data.client() as client:
+            for url in ("/enrollments", "/admin/enrollments/pending"):
+                seen.clear()
+                cursor = None
+                while True:
+                    params = {"limit": 7}
+                    if cursor:
+                        params["cursor"] = cursor
+                    body = (await client.get(url, params=params, headers=data.auth_headers(1))).json()
+                    seen.extend(item["id"] for item in body["enrollments"])
+                    # count는 전체 건수가 아닌 이 페이지의 항목 수
+                    assert body["count"] == len(body["enrollments"]) <= 7
+                    cursor = body["nextCursor"]
+                    if cursor is None:
+                        break
+
+                assert sorted(seen) == list(range(1, 26))
+                assert len(seen) == len(set(seen))
+
+    data.run(scenario)
+
+
+def test_invalid_cursor_is_rejected(data):
+    async def scenario():
+        await data.create_user(1)
+        async with data.client() as client:
+            response = await client.get("/enrollments", params={"cursor": "garbage"}, headers=data.auth_headers(1))
+        assert response.status_code == 400
+
+    data.run(scenario)
+
+
+def test_streaming_export(data):
+    async def scenario():
+        await data.create_user(1)
+        for user_id in range(2, 12):
+            await data.create_user(user_id)
+            await data.create_enrollment(user_id, party_id=1 if user_id % 2 else 2)
+
+        async with data.client() as client:
+            ndjson = await client.get("/enrollments", params={"format": "ndjson"}, headers=data.auth_headers(1))
+            csv_response = await client.get(
+                "/enrollments/party/2", params={"format": "csv"}, headers=data.auth_headers(1)
+            )
+
+        lines = [json.loads(line) for line in ndjson.text.splitlines()]
+        assert ndjson.headers["content-type"] == "application/x-ndjson"
+        assert [line["id"] for line in lines] == list(range(1, 11))
+        assert lines[0]["user_id"] == 2
+
+        rows = list(csv.reader(io.StringIO(csv_response.text.lstrip("\ufeff"))))
+        assert rows[0] == ["id", "partyId", "enrolled", "createdAt", "user_id", "name", "birthday", "phone"]
+        assert len(rows) == 1 + 5
+
+    data.run(scenario)
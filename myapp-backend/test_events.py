@@ -0,0 +1,134 @@
+"""
+실시간 이벤트 (SSE pub/sub) 테스트
+"""
+import asyncio
+import json
+
+from sqlalchemy import text
+
+
+def test_approve_publishes_events_after_commit(data):
+    async def scenario():
+        from events import enrollment_topic, event_broker, party_topic
+
+        await data.create_user(1)
+        await data.create_user(2)
+        await data.create_enrollment(2, party_id=1, status="pending")
+
+        async with data.client() as client:
+            with event_broker.subscribe(party_topic(1), enrollment_topic(2, 1)) as queue:
+                response = await client.post(
+                    "/admin/enrollments/approve", json={"enrollment_id": 1}, headers=data.auth_headers(1)
+                )
+                assert response.json()["ok"] is True
+
+                events = dict([queue.get_nowait(), queue.get_nowait()])
+                assert queue.empty()
+
+            assert events[enrollment_topic(2, 1)] == {"enrollmentId": 1, "partyId": 1, "status": "approved"}
+            assert events[party_topic(1)] == {"partyId": 1, "totalSpots": 50, "enrolledCount": 1, "spotsLeft": 49}
+            assert event_broker.subscriber_count() == 0
+
+    data.run(scenario)
+
+
+def test_rolled_back_changes_publish_nothing(data):
+    async def scenario():
+        import config
+        from events import event_broker, party_topic
+
+        await data.create_user(1)
+        await data.create_user(2)
+        await data.create_user(3)
+        await data.create_enrollment(2, party_id=1, status="approved")
+        await data.create_enrollment(3, party_id=1, status="pending")
+
+        original_capacity = config.DEFAULT_PARTY_CAPACITY
+        config.DEFAULT_PARTY_CAPACITY = 1
+        try:
+            async with data.client() as client:
+                with event_broker.subscribe(party_topic(1)) as queue:
+                    response = await client.post(
+                        "/admin/enrollments/approve", json={"enrollment_id": 2}, headers=data.auth_headers(1)
+                    )
+                    assert response.json()["ok"] is False
+                    assert queue.empty()
+        finally:
+            config.DEFAULT_PARTY_CAPACITY = original_capacity
+
+    data.run(scenario)
+
+
+def test_notifications_from_other_workers_reach_subscribers(data):
+    async def scenario():
+        import response_cache
+        from events import NOTIFY_CHANNEL, event_broker, party_topic
+
+        await data.create_user(1)
+
+        async with data.client() as client:
+            await client.get("/party/1/info")
+        assert response_cache.party_info_key(1) in response_cache._entries
+
+        await event_broker.start()
+        try:
+            with event_broker.subscribe(party_topic(1)) as queue:
+                payload = {"pid": -1, "topic": party_topic(1), "data": {"partyId": 1, "spotsLeft": 10}}
+                # 리스너 연결이 LISTEN을 시작할 때까지 재전송
+                for _ in range(50):
+                    async with data.engine.begin() as conn:
+                        await conn.execute(
+                            text("SELECT pg_notify(:channel, :payload)"),
+                            {"channel": NOTIFY_CHANNEL, "payload": json.dumps(payload)},
+                        )
+                    try:
+                        topic, event_data = await asyncio.wait_for(queue.get(), timeout=0.1)
+                        break
+                    except asyncio.TimeoutError:
+                        continue
+                else:
+                    raise AssertionError("notification was not delivered")
+        finally:
+            await event_broker.stop()
+
+        assert topic == party_topic(1)
+        assert event_data == {"partyId": 1, "spotsLeft": 10}
+        # 다른 워커의 변경도 응답 캐시를 무효화
+        assert response_cache.party_info_key(1) not in response_cache._entries
+
+    data.run(scenario)
+
+
+def test_stream_sends_snapshot_then_events(data):
+    async def scenario():
+        from events import event_broker, party_topic, stream_events
+
+        topic = party_topic(1)
+        stream = stream_events([topic], [(topic, {"spotsLeft": 50})])
+
+        assert await stream.__anext__() == 'event: spots\ndata: {"spotsLeft": 50}\n\n'
+        next_frame = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+        event_broker.publish_local(topic, {"spotsLeft": 49})
+        assert await next_frame == 'event: spots\ndata: {"spotsLeft": 49}\n\n'
+
+        await stream.aclose()
+        assert event_broker.subscriber_count() == 0
+
+    data.run(scenario)
+
+
+def test_stream_rejects_invalid_tokens(data):
+    import jwt
+    import config
+
+    async def scenario():
+        no_user_id = jwt.encode({"sub": "1"}, config.JWT_SECRET_KEY, algorithm=config.JWT_ALGORITHM)
+
+        async with data.client() as client:
+            for token in ("not-a-jwt", jwt.encode({"user_id": 1}, "wrong-secret", algorithm="HS256"), no_user_id):
+                response = await client.get("/party/1/events", params={"token": token})
+                assert response.status_code == 401
+                assert response.headers["www-authenticate"] == "Bearer"
+
+    data.run(scenario)
@@ -0,0 +1,50 @@
+"""
+비밀번호 해시 워커 풀 테스트 (hashing.py)
+"""
+import asyncio
+import threading
+
+import pytest
+
+
+def test_cancelled_requests_keep_their_slot_until_the_job_finishes(data, monkeypatch):
+    import config
+    import hashing
+    from hashing import PasswordHasherBusy
+
+    monkeypatch.setattr(config, "BCRYPT_QUEUE_LIMIT", 0)
+    release = threading.Event()
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        started = asyncio.Semaphore(0)
+
+        def blocking():
+            loop.call_soon_threadsafe(started.release)
+            release.wait(5)
+            return "done"
+
+        requests = [asyncio.ensure_future(hashing._run("hash", blocking)) for _ in range(config.BCRYPT_WORKERS)]
+        for _ in requests:
+            await started.acquire()
+
+        # 클라이언트 연결 종료 등으로 요청이 취소되어도 워커 스레드는 아직 실행 중
+        for request in requests:
+            request.cancel()
+        await asyncio.gather(*requests, return_exceptions=True)
+        assert hashing.get_stats()["inFlight"] == config.BCRYPT_WORKERS
+        with pytest.raises(PasswordHasherBusy):
+            await hashing._run("hash", blocking)
+
+        release.set()
+        for _ in range(50):
+            if hashing.get_stats()["inFlight"] == 0:
+                break
+            await asyncio.sleep(0.02)
+        assert hashing.get_stats()["inFlight"] == 0
+        assert await hashing._run("hash", blocking) == "done"
+
+    try:
+        data.run(scenario)
+    finally:
+        release.set()
@@ -0,0 +1,115 @@
+"""
+초대코드 인덱스 테스트 (invitation_index.py)
+"""
+import asyncio
+
+from sqlalchemy import text
+
+
+async def _add_invitations(data, **codes):
+    from models import Invitation
+
+    async with data.session_factory() as db:
+        for code, is_active in codes.items():
+            db.add(Invitation(code=code, is_active=is_active))
+        await db.commit()
+
+
+async def _verify(client, code):
+    return (await client.post("/auth/invitation/verify", json={"invitation_code": code})).json()
+
+
+def test_unknown_and_inactive_codes_skip_the_database(data):
+    from invitation_index import invitation_index
+
+    async def scenario():
+        await _add_invitations(data, PARTY2025=True, OLD2024=False)
+        await invitation_index.load()
+
+        async with data.client() as client:
+            with data.count_queries() as counter:
+                assert await _verify(client, "TYPO2025") == {"valid": False, "message": "초대코드가 유효하지 않습니다."}
+                assert await _verify(client, "OLD2024") == {"valid": False, "message": "비활성화된 초대코드입니다."}
+            assert counter["count"] == 0
+
+            with data.count_queries() as counter:
+                assert (await _verify(client, "PARTY2025"))["valid"] is True
+            assert counter["count"] == 1
+
+            # 알림이 오기 전에 비활성화되어도 활성 코드는 DB에서 다시 확인하므로 바로 거절
+            async with data.engine.begin() as conn:
+                await conn.execute(text('UPDATE "Invitation" SET is_active = false WHERE code = \'PARTY2025\''))
+            assert await _verify(client, "PARTY2025") == {"valid": False, "message": "비활성화된 초대코드입니다."}
+
+    data.run(scenario)
+
+
+def test_trigger_notifications_update_the_index(data):
+    from events import event_broker
+    from invitation_index import invitation_index
+
+    async def wait_for(code, expected):
+        for _ in range(50):
+            if invitation_index._codes.get(code) == expected:
+                return
+            await asyncio.sleep(0.05)
+        raise AssertionError(f"{code} did not become {expected}")
+
+    async def scenario():
+        await _add_invitations(data, PARTY2025=True)
+        await invitation_index.load()
+
+        await event_broker.start()
+        try:
+            # 리스너 연결이 LISTEN을 시작할 때까지 변경을 반복
+            for attempt in range(50):
+                async with data.engine.begin() as conn:
+                    await conn.execute(text(f"INSERT INTO \"Invitation\" (code, is_active) VALUES ('NEW{attempt}', true)"))
+                await asyncio.sleep(0.05)
+                if invitation_index._codes.get(f"NEW{attempt}"):
+                    break
+            else:
+                raise AssertionError("notification was not delivered")
+
+            async with data.engine.begin() as conn:
+                await conn.execute(text('UPDATE "Invitation" SET is_active = false WHERE code = \'PARTY2025\''))
+            await wait_for("PARTY2025", False)
+
+            async with data.engine.begin() as conn:
+                await conn.execute(text('UPDATE "Invitation" SET code = \'PARTY2026\' WHERE code = \'PARTY2025\''))
+            await wait_for("PARTY2026", False)
+            await wait_for("PARTY2025", None)
+
+            async with data.engine.begin() as conn:
+                await conn.execute(text('DELETE FROM "Invitation" WHERE code = \'PARTY2026\''))
+            await wait_for("PARTY2026", None)
+        finally:
+            await event_broker.stop()
+
+    data.run(scenario)
+
+
+def test_changes_during_a_reload_are_not_lost(data, monkeypatch):
+    import repository
+    from invitation_index import invitation_index
+
+    get_invitation_states = repository.get_invitation_states
+
+    async def slow_states(db):
+        rows = await get_invitation_states(db)
+        # 조회가 끝난 뒤 응답 전에 도착한 알림
+        invitation_index.apply({"code": "PARTY2025", "isActive": False})
+        invitation_index.apply({"code": "NEW", "isActive": True})
+        return rows
+
+    monkeypatch.setattr(repository, "get_invitation_states", slow_states)
+
+    async def scenario():
+        await _add_invitations(data, PARTY2025=True)
+        assert not invitation_index.loaded
+
+        await invitation_index.load()
+        assert invitation_index.loaded
+        assert invitation_index._codes == {"PARTY2025": False, "NEW": True}
+
+    data.run(scenario)
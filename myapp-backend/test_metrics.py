@@ -0,0 +1,88 @@
+"""
+Prometheus 지표 (/metrics) 테스트
+"""
+import os
+import subprocess
+import sys
+
+from prometheus_client import multiprocess
+from prometheus_client.parser import text_string_to_metric_families
+
+
+def _samples(text: str) -> dict:
+    return {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in text_string_to_metric_families(text)
+        for sample in family.samples
+    }
+
+
+def test_route_pool_and_bcrypt_metrics(data):
+    async def scenario():
+        from hashing import hash_password
+
+        await data.create_user(1, password=await hash_password("pw"))
+
+        async with data.client() as client:
+            before = _samples((await client.get("/metrics")).text)
+            await client.get("/party/1/info")
+            await client.get("/party/2/info")
+            await client.post("/auth/login", json={"user_id": "user1", "password": "pw"})
+            after = _samples((await client.get("/metrics")).text)
+
+        def delta(name, **labels):
+            key = (name, tuple(sorted(labels.items())))
+            return after.get(key, 0) - before.get(key, 0)
+
+        # 경로 값이 아니라 라우트 템플릿으로 집계
+        assert delta(
+            "http_request_duration_seconds_count", method="GET", route="/party/{party_id}/info", status="200"
+        ) == 2
+        assert after[("http_requests_in_progress", (("method", "GET"), ("route", "/metrics")))] == 1
+        assert delta("password_hash_duration_seconds_count", operation="verify") == 1
+        assert delta("db_pool_checkout_wait_seconds_count") >= 3
+        assert after[("db_pool_size", ())] == data.engine.sync_engine.pool.size()
+        assert after[("db_pool_checked_out_connections", ())] == 0
+
+    data.run(scenario)
+
+
+def test_metrics_token(data, monkeypatch):
+    import config
+    monkeypatch.setattr(config, "METRICS_TOKEN", "secret")
+
+    async def scenario():
+        async with data.client() as client:
+            assert (await client.get("/metrics")).status_code == 401
+            response = await client.get("/metrics", headers={"Authorization": "Bearer secret"})
+            assert response.status_code == 200
+
+    data.run(scenario)
+
+
+WORKER_SCRIPT = """
+import metrics
+metrics.REQUEST_LATENCY.labels("GET", "/health", "200").observe(0.01)
+metrics.REQUESTS_IN_PROGRESS.labels("GET", "/health").inc()
+"""
+
+
+def test_metrics_aggregate_across_worker_processes(tmp_path):
+    env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=str(tmp_path))
+    backend_dir = os.path.dirname(os.path.abspath(__file__))
+    for _ in range(4):
+        worker = subprocess.Popen([sys.executable, "-c", WORKER_SCRIPT], cwd=backend_dir, env=env)
+        assert worker.wait() == 0
+        # gunicorn.conf.py의 child_exit와 동일
+        multiprocess.mark_process_dead(worker.pid, str(tmp_path))
+
+    render = "import metrics; print(metrics.render()[0].decode())"
+    output = subprocess.run(
+        [sys.executable, "-c", render], cwd=backend_dir, env=env, check=True, capture_output=True, text=True
+    ).stdout
+    samples = _samples(output)
+
+    labels = (("method", "GET"), ("route", "/health"), ("status", "200"))
+    assert samples[("http_request_duration_seconds_count", labels)] == 4
+    # 종료된 워커의 처리 중 요청 수는 합산하지 않음 (livesum)
+    assert samples.get(("http_requests_in_progress", (("method", "GET"), ("route", "/health"))), 0) == 0
@@ -0,0 +1,199 @@
+"""
+마이그레이션 실행기 테스트 (migrate.py, migrations/)
+"""
+import asyncio
+
+import pytest
+
+
+def _migrator(**options):
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+    from database import DATABASE_URL
+    from migrate import Migrator
+
+    options = {"retry_delay": 0, "batch_pause": 0, **options}
+    return Migrator(create_async_engine(DATABASE_URL, poolclass=NullPool), **options)
+
+
+async def _drop_everything(data):
+    from models import Base
+    async with data.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.exec_driver_sql('DROP TABLE IF EXISTS "SchemaMigration"')
+
+
+async def _schema(conn):
+    """{(테이블, 컬럼)}, {인덱스 이름}"""
+    columns = await conn.exec_driver_sql('''
+        SELECT table_name, column_name FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name <> 'SchemaMigration'
+    ''')
+    indexes = await conn.exec_driver_sql('''
+        SELECT indexname FROM pg_indexes
+        WHERE schemaname = current_schema() AND tablename <> 'SchemaMigration'
+    ''')
+    return {tuple(row) for row in columns}, {row[0] for row in indexes}
+
+
+def test_migrations_build_the_model_schema_and_record_versions(data):
+    from migrate import discover, run_migrations
+    from models import Base
+
+    async def scenario():
+        await _drop_everything(data)
+        m = _migrator()
+        try:
+            applied = await run_migrations(m)
+            assert applied == [version for version, _, _ in discover()]
+            # 두 번째 실행은 아무것도 하지 않음
+            assert await run_migrations(m) == []
+        finally:
+            await m.engine.dispose()
+
+        async with data.engine.begin() as conn:
+            migrated = await _schema(conn)
+            await conn.exec_driver_sql('DROP TABLE "SchemaMigration"')
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+            assert migrated == await _schema(conn)
+
+    data.run(scenario)
+
+
+def test_existing_schema_is_recorded_without_changes(data):
+    """create_all(또는 예전 스크립트)로 만든 DB에서도 모든 버전이 그대로 적용 처리됨"""
+    from sqlalchemy import text
+    from migrate import discover, run_migrations
+
+    async def scenario():
+        await data.create_user(1)
+        await data.create_enrollment(1, status="pending")
+        m = _migrator()
+        try:
+            assert len(await run_migrations(m)) == len(discover())
+        finally:
+            await m.engine.dispose()
+
+        async with data.session_factory() as db:
+            statuses = (await db.execute(text('SELECT status FROM "Enrollment"'))).scalars().all()
+        # 대기 중인 신청이 승인으로 바뀌지 않음
+        assert statuses == ["pending"]
+
+    data.run(scenario)
+
+
+def test_status_backfill_in_batches_on_legacy_rows(data):
+    from migrate import run_migrations
+
+    async def scenario():
+        await _drop_everything(data)
+        m = _migrator(batch_size=2)
+        try:
+            await run_migrations(m, target="0001")
+            async with m.engine.begin() as conn:
+                await conn.exec_driver_sql('''
+                    INSERT INTO "User" (name, password, birthday, phone, "invitationId")
+                    SELECT 'u' || g, 'x', '2000-01-01', '010-' || g, 1 FROM generate_series(1, 5) AS g
+                ''')
+                await conn.exec_driver_sql('''
+                    INSERT INTO "Enrollment" ("userId", "partyId", enrolled)
+                    SELECT g, 1, g % 2 = 1 FROM generate_series(1, 5) AS g
+                ''')
+
+            assert await run_migrations(m, target="0002") == ["0002"]
+
+            async with m.engine.begin() as conn:
+                rows = (await conn.exec_driver_sql(
+                    'SELECT enrolled, status FROM "Enrollment" ORDER BY id'
+                )).all()
+                assert [status for _, status in rows] == ["approved", "pending", "approved", "pending", "approved"]
+
+                nullable = (await conn.exec_driver_sql('''
+                    SELECT is_nullable FROM information_schema.columns
+                    WHERE table_name = 'Enrollment' AND column_name = 'status'
+                ''')).scalar()
+                assert nullable == "NO"
+
+                # 새 행은 기본값 pending
+                await conn.exec_driver_sql('INSERT INTO "Enrollment" ("userId", "partyId") VALUES (1, 2)')
+                new_status = (await conn.exec_driver_sql(
+                    'SELECT status FROM "Enrollment" WHERE "partyId" = 2'
+                )).scalar()
+                assert new_status == "pending"
+        finally:
+            await m.engine.dispose()
+
+    data.run(scenario)
+
+
+def test_unique_index_keeps_the_strongest_duplicate_and_backs_up_the_rest(data):
+    from migrate import run_migrations
+
+    async def scenario():
+        await _drop_everything(data)
+        m = _migrator()
+        try:
+            await run_migrations(m, target="0006")
+            async with m.engine.begin() as conn:
+                await conn.exec_driver_sql('''
+                    INSERT INTO "User" (name, password, birthday, phone, "invitationId")
+                    SELECT 'u' || g, 'x', '2000-01-01', '010-' || g, 1 FROM generate_series(1, 3) AS g
+                ''')
+                # (userId, partyId, status, couponUsed, createdAt 순서) - 나중에 들어온 행이 더 약한 상태
+                await conn.exec_driver_sql('''
+                    INSERT INTO "Enrollment" ("userId", "partyId", enrolled, status, "couponUsed", "createdAt") VALUES
+                        (1, 1, true, 'approved', false, '2025-12-01'),
+                        (1, 1, true, 'pending', false, '2025-12-02'),
+                        (1, 1, true, 'rejected', false, '2025-12-03'),
+                        (2, 1, true, 'approved', false, '2025-12-03'),
+                        (2, 1, true, 'approved', true, '2025-12-01'),
+                        (3, 1, true, 'pending', false, '2025-12-01'),
+                        (3, 1, true, 'pending', false, '2025-12-02')
+                ''')
+                await conn.exec_driver_sql('''INSERT INTO "PartyStats" ("partyId", "approvedCount") VALUES (1, 3)''')
+
+            assert await run_migrations(m, target="0007") == ["0007"]
+
+            async with m.engine.begin() as conn:
+                kept = (await conn.exec_driver_sql('SELECT id FROM "Enrollment" ORDER BY id')).scalars().all()
+                backup = (await conn.exec_driver_sql(
+                    'SELECT id, status FROM "EnrollmentDuplicateBackup" ORDER BY id'
+                )).all()
+                approved = (await conn.exec_driver_sql('SELECT "approvedCount" FROM "PartyStats"')).scalar()
+            assert kept == [1, 5, 7]
+            assert [tuple(row) for row in backup] == [(2, "pending"), (3, "rejected"), (4, "approved"), (6, "pending")]
+            assert approved == 2
+        finally:
+            async with m.engine.begin() as conn:
+                await conn.exec_driver_sql('DROP TABLE IF EXISTS "EnrollmentDuplicateBackup"')
+            await m.engine.dispose()
+
+    data.run(scenario)
+
+
+def test_lock_timeout_retries_until_the_lock_is_released(data):
+    from sqlalchemy.exc import DBAPIError
+
+    async def scenario():
+        m = _migrator(lock_timeout_ms=50, retries=3)
+        try:
+            async with data.engine.connect() as holder:
+                # 긴 트랜잭션이 Enrollment를 읽는 중 (ACCESS SHARE)
+                await holder.exec_driver_sql('SELECT * FROM "Enrollment"')
+
+                with pytest.raises(DBAPIError, match="lock timeout"):
+                    await m.execute('ALTER TABLE "Enrollment" ADD COLUMN note VARCHAR')
+
+                async def release():
+                    await asyncio.sleep(0.1)
+                    await holder.rollback()
+
+                m.retry_delay = 0.1
+                release_task = asyncio.create_task(release())
+                await m.execute('ALTER TABLE "Enrollment" ADD COLUMN note VARCHAR')
+                await release_task
+        finally:
+            await m.engine.dispose()
+
+    data.run(scenario)
@@ -0,0 +1,113 @@
+"""
+파티 정원 제한 테스트
+
+여러 관리자가 동시에 승인해도 승인 인원이 Party.capacity를 넘지 않는지 확인합니다.
+"""
+import asyncio
+
+from sqlalchemy import func, select
+
+from models import Enrollment, Party, PartyStats
+
+CAPACITY = 5
+
+
+async def seed_party(data, applicants: int):
+    await data.create_user(1)
+    async with data.session_factory() as db:
+        db.add(Party(id=1, name="After-Christmas Party", capacity=CAPACITY))
+        await db.commit()
+    for user_id in range(2, applicants + 2):
+        await data.create_user(user_id)
+        await data.create_enrollment(user_id, party_id=1)
+
+
+async def approved_totals(data):
+    async with data.session_factory() as db:
+        counter = (await db.execute(select(PartyStats.approvedCount))).scalar_one()
+        rows = (await db.execute(
+            select(func.count()).select_from(Enrollment).where(Enrollment.status == "approved")
+        )).scalar_one()
+    return counter, rows
+
+
+def test_parallel_approvals_never_exceed_capacity(data):
+    async def scenario():
+        await seed_party(data, applicants=30)
+        headers = data.auth_headers(1)
+
+        async with data.client() as client:
+            single = [
+                client.post("/admin/enrollments/approve", json={"enrollment_id": id}, headers=headers)
+                for id in range(1, 21)
+            ]
+            bulk = [
+                client.post(
+                    "/admin/enrollments/bulk",
+                    json={"enrollment_ids": list(range(start, start + 5)), "status": "approved"},
+                    headers=headers,
+                )
+                for start in (16, 21, 26)
+            ]
+            responses = await asyncio.gather(*single, *bulk)
+
+            info = (await client.get("/party/1/info")).json()
+
+        assert all(response.status_code == 200 for response in responses)
+        assert await approved_totals(data) == (CAPACITY, CAPACITY)
+        assert (info["totalSpots"], info["enrolledCount"], info["spotsLeft"]) == (CAPACITY, CAPACITY, 0)
+
+    data.run(scenario)
+
+
+def test_rejecting_frees_a_spot(data):
+    async def scenario():
+        await seed_party(data, applicants=CAPACITY + 1)
+        headers = data.auth_headers(1)
+
+        async with data.client() as client:
+            response = await client.post(
+                "/admin/enrollments/bulk",
+                json={"enrollment_ids": list(range(1, CAPACITY + 2)), "status": "approved"},
+                headers=headers,
+            )
+            outcomes = [item["outcome"] for item in response.json()["results"]]
+            assert outcomes == ["updated"] * CAPACITY + ["capacity_exceeded"]
+
+            last = {"enrollment_id": CAPACITY + 1}
+            assert (await client.post("/admin/enrollments/approve", json=last, headers=headers)).json()["ok"] is False
+
+            await client.post("/admin/enrollments/reject", json={"enrollment_id": 1}, headers=headers)
+            assert (await client.post("/admin/enrollments/approve", json=last, headers=headers)).json()["ok"] is True
+
+        assert await approved_totals(data) == (CAPACITY, CAPACITY)
+
+    data.run(scenario)
+
+
+def test_missing_counter_row_is_seeded_from_approved_enrollments(data):
+    async def scenario():
+        await seed_party(data, applicants=CAPACITY + 2)
+        # 카운터 도입 전에 승인된 행 (PartyStats 행 없음)
+        async with data.engine.begin() as conn:
+            await conn.exec_driver_sql('''UPDATE "Enrollment" SET status = 'approved' WHERE id <= 4''')
+            await conn.exec_driver_sql('DELETE FROM "PartyStats"')
+        headers = data.auth_headers(1)
+
+        async with data.client() as client:
+            response = await client.post(
+                "/admin/enrollments/bulk",
+                json={"enrollment_ids": [5, 6, 7], "status": "approved"},
+                headers=headers,
+            )
+            outcomes = [item["outcome"] for item in response.json()["results"]]
+            assert outcomes == ["updated", "capacity_exceeded", "capacity_exceeded"]
+        assert await approved_totals(data) == (CAPACITY, CAPACITY)
+
+        async with data.engine.begin() as conn:
+            await conn.exec_driver_sql('DELETE FROM "PartyStats"')
+        async with data.client() as client:
+            await client.post("/admin/enrollments/reject", json={"enrollment_id": 1}, headers=headers)
+        assert await approved_totals(data) == (CAPACITY - 1, CAPACITY - 1)
+
+    data.run(scenario)
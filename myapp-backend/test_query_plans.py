@@ -0,0 +1,166 @@
+"""
+자주 실행되는 쿼리의 실행 계획 테스트
+
+운영과 비슷한 규모(사용자 2만 명, 참가 신청 4만 건)의 데이터를 넣고 ANALYZE한 뒤,
+API / repository가 실제로 실행한 SQL을 그대로 EXPLAIN하여 User / Enrollment를
+순차 스캔(Seq Scan)하면 실패합니다. 목록 keyset 페이지는 인덱스 순서로 읽어
+별도 정렬(Sort)이 없어야 합니다.
+
+인덱스는 models.py에 선언되어 있고 운영 DB에는 migrate.py (migrations/0008_lookup_indexes.py)로 생성합니다.
+"""
+import json
+
+USERS = 20_000
+PARTIES = 20
+
+# 테이블 크기가 작으면 순차 스캔이 더 싸므로 검사 대상에서 제외
+CHECKED_TABLES = {"User", "Enrollment"}
+
+
+async def _seed(data):
+    async with data.engine.begin() as conn:
+        await conn.exec_driver_sql("""INSERT INTO "Invitation" (code, is_active) VALUES ('PLAN', true)""")
+        await conn.exec_driver_sql(f"""
+            INSERT INTO "User" (id, "userId", name, password, birthday, phone, "invitationId")
+            SELECT g, 'user' || g, '유저' || g, 'not-a-hash', '2000-01-01',
+                   '010-' || lpad(g::text, 8, '0'), 1
+            FROM generate_series(1, {USERS}) AS g
+        """)
+        await conn.exec_driver_sql(f"""
+            INSERT INTO "Party" (id, name, capacity)
+            SELECT g, 'party' || g, {USERS} FROM generate_series(1, {PARTIES}) AS g
+        """)
+        # 사용자마다 두 파티에 신청 - 대기 5%, 거절 약 30%, 나머지 승인
+        await conn.exec_driver_sql(f"""
+            INSERT INTO "Enrollment" ("userId", "partyId", enrolled, status, "couponUsed", "createdAt")
+            SELECT u, (u + k * 7) % {PARTIES} + 1, true,
+                   CASE WHEN u % 20 = 0 THEN 'pending' WHEN u % 3 = 0 THEN 'rejected' ELSE 'approved' END,
+                   false, timestamp '2025-12-01' + (u * 2 + k) * interval '1 second'
+            FROM generate_series(1, {USERS}) AS u, generate_series(0, 1) AS k
+        """)
+        await conn.exec_driver_sql("""
+            INSERT INTO "PartyStats" ("partyId", "approvedCount")
+            SELECT "partyId", COUNT(*) FROM "Enrollment" WHERE status = 'approved' GROUP BY "partyId"
+        """)
+        await conn.exec_driver_sql('ANALYZE "User", "Enrollment", "Invitation", "Party", "PartyStats"')
+
+
+async def _capture(data, call):
+    """call 실행 중 DB에 보낸 SELECT 문과 파라미터 수집"""
+    from sqlalchemy import event
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(data.engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        await call()
+    finally:
+        event.remove(data.engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    assert statements, "no statements captured"
+    return statements
+
+
+async def _explain(data, statements):
+    """[(SQL, 실행 계획 노드 목록)]"""
+    async with data.engine.connect() as conn:
+        raw = (await conn.get_raw_connection()).driver_connection
+        plans = []
+        for statement, parameters in statements:
+            plan = await raw.fetchval(f"EXPLAIN (FORMAT JSON) {statement}", *(parameters or ()))
+            # SQLAlchemy가 등록한 json codec이 있으면 이미 디코딩된 값이 옴
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            plans.append((statement, list(_nodes(plan[0]["Plan"]))))
+        return plans
+
+
+def _nodes(plan):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _nodes(child)
+
+
+def _assert_no_seq_scan(plans):
+    for statement, nodes in plans:
+        scanned = [n["Relation Name"] for n in nodes if n["Node Type"] == "Seq Scan"]
+        assert not CHECKED_TABLES & set(scanned), f"Seq Scan on {scanned}:\n{statement}"
+
+
+def _assert_no_sort(plans):
+    for statement, nodes in plans:
+        assert not [n for n in nodes if n["Node Type"] in ("Sort", "Incremental Sort")], \
+            f"Sort in keyset page:\n{statement}"
+
+
+def _index_names(plans):
+    return {n.get("Index Name") for _, nodes in plans for n in nodes}
+
+
+def test_single_row_lookups_use_indexes(data):
+    import repository
+    from occupancy import count_approved
+
+    async def scenario():
+        await _seed(data)
+
+        async def lookups():
+            async with data.session_factory() as db:
+                assert await repository.phone_taken(db, "010-00012345")
+                assert await repository.user_id_taken(db, "user777")
+                assert (await repository.get_login_user(db, "user777")).id == 777
+                assert (await repository.get_user_by_id(db, 777)).userId == "user777"
+                assert (await repository.get_enrollment(db, 777, (777 % PARTIES) + 1)) is not None
+                assert (await repository.get_invitation_by_code(db, "PLAN")).is_active
+                assert await count_approved(db, 3) > 0
+
+        plans = await _explain(data, await _capture(data, lookups))
+        _assert_no_seq_scan(plans)
+        assert {"User_phone_idx", "Enrollment_partyId_status_idx"} <= _index_names(plans)
+
+    data.run(scenario)
+
+
+def test_pending_list_uses_partial_index(data):
+    async def scenario():
+        await _seed(data)
+        headers = data.auth_headers(1)
+
+        async def pages():
+            async with data.client() as client:
+                first = (await client.get("/admin/enrollments/pending", headers=headers)).json()
+                assert first["nextCursor"]
+                response = await client.get(
+                    "/admin/enrollments/pending", params={"cursor": first["nextCursor"]}, headers=headers
+                )
+                assert response.status_code == 200
+
+        plans = await _explain(data, await _capture(data, pages))
+        _assert_no_seq_scan(plans)
+        _assert_no_sort(plans)
+        assert "Enrollment_pending_createdAt_id_idx" in _index_names(plans)
+
+    data.run(scenario)
+
+
+def test_enrollment_listings_use_keyset_indexes(data):
+    async def scenario():
+        await _seed(data)
+        headers = data.auth_headers(1)
+
+        async def pages():
+            async with data.client() as client:
+                for url in ("/enrollments", "/enrollments/party/3"):
+                    first = (await client.get(url, headers=headers)).json()
+                    response = await client.get(url, params={"cursor": first["nextCursor"]}, headers=headers)
+                    assert response.status_code == 200
+
+        plans = await _explain(data, await _capture(data, pages))
+        _assert_no_seq_scan(plans)
+        _assert_no_sort(plans)
+        assert {"Enrollment_createdAt_id_idx", "Enrollment_partyId_createdAt_id_idx"} <= _index_names(plans)
+
+    data.run(scenario)
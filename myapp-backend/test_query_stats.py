@@ -0,0 +1,89 @@
+"""
+요청별 쿼리 통계 / 느린 쿼리 로그 / N+1 감지 테스트
+"""
+import logging
+
+import pytest
+
+
+def _app():
+    """QueryStatsMiddleware만 적용한 테스트용 앱"""
+    from fastapi import Depends, FastAPI
+    from sqlalchemy import select
+    from database import QueryStatsMiddleware, current_query_stats, get_db
+    from models import User
+
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/users/{count}")
+    async def load_users_one_by_one(count: int, db=Depends(get_db)):
+        for id in range(1, count + 1):
+            await db.execute(select(User).where(User.id == id))
+        stats = current_query_stats()
+        return {"statements": stats.count, "dbSeconds": stats.seconds}
+
+    return app
+
+
+def _client(app):
+    import httpx
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver")
+
+
+def test_statement_shape_ignores_bind_numbers_and_in_list_length():
+    from database import statement_shape
+
+    assert statement_shape('SELECT * FROM "User" WHERE id IN ($1, $2, $3)') == \
+        statement_shape('SELECT * FROM "User" WHERE id IN ($1)')
+    assert statement_shape("SELECT $1::INTEGER") == "SELECT ?::INTEGER"
+
+
+def test_counts_statements_per_request(data):
+    async def scenario():
+        async with _client(_app()) as client:
+            body = (await client.get("/users/3")).json()
+        assert body["statements"] == 3
+        assert body["dbSeconds"] > 0
+
+    data.run(scenario)
+
+
+def test_repeated_statement_raises_in_test_mode(data):
+    from database import RepeatedQueryError
+
+    async def scenario():
+        async with _client(_app()) as client:
+            assert (await client.get("/users/10")).status_code == 200
+            with pytest.raises(RepeatedQueryError, match=r"GET /users/\{count\}"):
+                await client.get("/users/11")
+
+    data.run(scenario)
+
+
+def test_repeated_statement_warns_in_warn_mode(data, monkeypatch, caplog):
+    import config
+    monkeypatch.setattr(config, "QUERY_REPEAT_MODE", "warn")
+
+    async def scenario():
+        async with _client(_app()) as client:
+            assert (await client.get("/users/11")).status_code == 200
+
+    with caplog.at_level(logging.WARNING, logger="database"):
+        data.run(scenario)
+    assert [r.message for r in caplog.records if "Possible N+1" in r.message]
+
+
+def test_slow_queries_are_logged_with_route(data, monkeypatch, caplog):
+    import config
+    monkeypatch.setattr(config, "SLOW_QUERY_THRESHOLD_MS", 0)
+
+    async def scenario():
+        async with _client(_app()) as client:
+            await client.get("/users/1")
+
+    with caplog.at_level(logging.WARNING, logger="database"):
+        data.run(scenario)
+    assert any(
+        "Slow query" in r.message and "GET /users/{count}" in r.message for r in caplog.records
+    )
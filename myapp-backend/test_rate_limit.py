@@ -0,0 +1,183 @@
+"""
+요청 수 제한 테스트 (rate_limit.py)
+"""
+import asyncio
+
+import pytest
+
+from rate_limit import MemoryRateLimitStore, RateLimit, SharedRateLimitStore
+
+
+def test_parse_rejects_invalid_specs():
+    assert RateLimit.parse("login", "10/60") == RateLimit("login", 10, 60.0)
+    for spec in ("10", "0/60", "10/0", "a/b"):
+        with pytest.raises(ValueError):
+            RateLimit.parse("login", spec)
+
+
+def test_memory_store_refills_after_burst():
+    async def scenario():
+        store = MemoryRateLimitStore()
+        limit = RateLimit("test", 3, 0.3)
+
+        assert [await store.take("k", limit) for _ in range(3)] == [0.0, 0.0, 0.0]
+        retry_after = await store.take("k", limit)
+        assert 0 < retry_after <= 0.1
+        # 다른 키는 영향 없음
+        assert await store.take("other", limit) == 0.0
+
+        await asyncio.sleep(retry_after + 0.02)
+        assert await store.take("k", limit) == 0.0
+
+    asyncio.run(scenario())
+
+
+def test_shared_store_counts_tokens_across_workers(tmp_path):
+    async def scenario():
+        path = str(tmp_path / "rate_limits.sqlite3")
+        worker_a = SharedRateLimitStore(path)
+        worker_b = SharedRateLimitStore(path)
+        limit = RateLimit("test", 4, 60)
+
+        results = await asyncio.gather(*(
+            (worker_a if i % 2 else worker_b).take("k", limit) for i in range(6)
+        ))
+        assert sorted(results)[:4] == [0.0] * 4
+        # 1개가 다시 채워지는 데 15초
+        assert all(14 < r <= 15 for r in sorted(results)[4:])
+
+        worker_a.clear()
+        assert await worker_b.take("k", limit) == 0.0
+
+    asyncio.run(scenario())
+
+
+def test_login_is_rejected_before_hashing_and_db(data, monkeypatch):
+    import main
+    import rate_limit
+
+    monkeypatch.setattr(rate_limit, "LOGIN_PER_USER", RateLimit("login_user", 2, 60))
+    verified = []
+
+    async def verify_password(password, hashed):
+        verified.append(password)
+        return False
+
+    monkeypatch.setattr(main, "verify_password", verify_password)
+
+    async def scenario():
+        await data.create_user(1, userId="hong")
+
+        async with data.client() as client:
+            for _ in range(2):
+                response = await client.post("/auth/login", json={"user_id": "hong", "password": "wrong"})
+                assert response.json()["ok"] is False
+
+            with data.count_queries() as counter:
+                response = await client.post("/auth/login", json={"user_id": "hong", "password": "wrong"})
+            assert response.status_code == 429
+            assert int(response.headers["Retry-After"]) == 30
+            assert counter["count"] == 0
+            assert len(verified) == 2
+
+            # 다른 아이디는 제한되지 않음
+            response = await client.post("/auth/login", json={"user_id": "kim", "password": "wrong"})
+            assert response.status_code == 200
+
+    data.run(scenario)
+
+
+def test_invitation_verify_is_limited_per_ip_and_code(data, monkeypatch):
+    import rate_limit
+    from models import Invitation
+
+    monkeypatch.setattr(rate_limit, "INVITATION_PER_IP", RateLimit("invitation_ip", 4, 60))
+    monkeypatch.setattr(rate_limit, "INVITATION_PER_CODE", RateLimit("invitation_code", 2, 60))
+
+    async def scenario():
+        async with data.session_factory() as db:
+            db.add(Invitation(code="PARTY2025", is_active=True))
+            await db.commit()
+
+        async with data.client() as client:
+            codes = ["PARTY2025", "PARTY2025", "PARTY2025", "WRONG", "WRONG"]
+            statuses = [
+                (await client.post("/auth/invitation/verify", json={"invitation_code": code})).status_code
+                for code in codes
+            ]
+            # 코드별 2회, IP별 4회 (코드 제한에 걸린 요청도 IP 토큰은 사용)
+            assert statuses == [200, 200, 429, 200, 429]
+
+        rate_limit.rate_limit_store.clear()
+        monkeypatch.setattr(rate_limit.config, "RATE_LIMIT_ENABLED", False)
+        async with data.client() as client:
+            for _ in range(3):
+                response = await client.post("/auth/invitation/verify", json={"invitation_code": "PARTY2025"})
+                assert response.json()["valid"] is True
+
+    data.run(scenario)
+
+
+def test_client_ip_uses_forwarded_address_behind_proxies(monkeypatch):
+    from types import SimpleNamespace
+
+    import rate_limit
+
+    request = SimpleNamespace(
+        headers={"x-forwarded-for": "6.6.6.6, 1.2.3.4, 10.0.0.2"},
+        client=SimpleNamespace(host="10.0.0.1"),
+    )
+    assert rate_limit.client_ip(request) == "10.0.0.1"
+
+    monkeypatch.setattr(rate_limit.config, "RATE_LIMIT_PROXY_HOPS", 2)
+    # 조작 가능한 맨 앞 값이 아니라 프록시가 붙인 주소
+    assert rate_limit.client_ip(request) == "1.2.3.4"
+
+    request.headers = {}
+    assert rate_limit.client_ip(request) == "10.0.0.1"
+
+
+def _deployed_proxy_hops():
+    """railway.json / nixpacks.toml / start.sh의 RATE_LIMIT_PROXY_HOPS 기본값"""
+    import json
+    import os
+    import re
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    with open(os.path.join(here, "railway.json")) as f:
+        commands = {"railway.json": json.load(f)["deploy"]["startCommand"]}
+    for name in ("nixpacks.toml", "start.sh"):
+        with open(os.path.join(here, name)) as f:
+            commands[name] = f.read()
+
+    hops = {}
+    for name, command in commands.items():
+        match = re.search(r"RATE_LIMIT_PROXY_HOPS=\"?\$\{RATE_LIMIT_PROXY_HOPS:-(\d+)\}", command)
+        assert match, f"{name} does not set RATE_LIMIT_PROXY_HOPS"
+        hops[name] = int(match.group(1))
+    return hops
+
+
+def test_deployed_config_limits_clients_behind_the_proxy_separately(data, monkeypatch):
+    import rate_limit
+
+    hops = _deployed_proxy_hops()
+    assert set(hops.values()) == {1}, hops
+    monkeypatch.setattr(rate_limit.config, "RATE_LIMIT_PROXY_HOPS", hops["railway.json"])
+    monkeypatch.setattr(rate_limit, "LOGIN_PER_IP", RateLimit("login_ip", 2, 60))
+
+    async def scenario():
+        async with data.client() as client:
+            def login(forwarded_for):
+                return client.post(
+                    "/auth/login",
+                    json={"user_id": "nobody", "password": "x"},
+                    headers={"X-Forwarded-For": forwarded_for},
+                )
+
+            # 모든 요청의 접속 주소는 프록시 하나, 프록시가 붙인 마지막 값만 다름
+            statuses = [(await login(f"9.9.9.{i}, 1.1.1.1")).status_code for i in range(3)]
+            assert statuses == [200, 200, 429]
+            assert (await login("2.2.2.2")).status_code == 200
+
+    data.run(scenario)
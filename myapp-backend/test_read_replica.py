@@ -0,0 +1,146 @@
+"""
+읽기 전용 복제본 라우팅 테스트 (database.ReplicaRouter, get_read_db)
+
+복제본은 같은 테스트 DB를 가리키는 별도 엔진으로 흉내 냅니다. (복제 지연은 재생 위치를 고정하여 재현)
+"""
+import asyncio
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event, text
+
+
+def _router(url=None, max_lag_seconds=5.0):
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+    from database import DATABASE_URL, ReplicaRouter
+
+    replica = create_async_engine(url or DATABASE_URL, poolclass=NullPool)
+    return ReplicaRouter(replica, max_lag_seconds=max_lag_seconds, interval_seconds=60)
+
+
+@contextmanager
+def _count(engine):
+    counter = {"count": 0}
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        counter["count"] += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_reads_go_to_a_caught_up_replica_and_writes_to_the_primary(data, monkeypatch):
+    import database
+
+    router = _router()
+    monkeypatch.setattr(database, "replica_router", router)
+
+    async def scenario():
+        await data.create_user(1)
+        try:
+            assert await router.check() < 1
+            assert router.usable()
+
+            async with data.client() as client:
+                with _count(router.engine) as replica, data.count_queries() as primary:
+                    assert (await client.get("/enrollment/check/1/1")).json() == {"enrolled": False}
+                assert replica["count"] >= 1 and primary["count"] == 0
+
+                # 응답 캐시에 저장되는 파티 정보는 primary에서 읽음 (무효화 후 지연된 값을 캐시하지 않도록)
+                with _count(router.engine) as replica, data.count_queries() as primary:
+                    assert (await client.get("/party/1/info")).status_code == 200
+                assert replica["count"] == 0 and primary["count"] >= 1
+
+                with _count(router.engine) as replica:
+                    enroll = await client.post(
+                        "/enroll", json={"user_id": 1, "party_id": 2}, headers=data.auth_headers(1)
+                    )
+                    assert enroll.json()["status"] == "pending"
+                assert replica["count"] == 0
+        finally:
+            await router.engine.dispose()
+
+    data.run(scenario)
+
+
+def test_stalled_replica_falls_back_to_the_primary(data, monkeypatch):
+    import database
+
+    router = _router(max_lag_seconds=0.2)
+    monkeypatch.setattr(database, "replica_router", router)
+
+    async def scenario():
+        await data.create_user(1)
+        try:
+            await router.check()
+            assert router.usable()
+
+            # 복제본이 재생을 멈춤 - 이후 primary에 커밋된 변경은 복제본에 없음
+            stalled_at = await router._replayed_lsn()
+
+            async def stalled():
+                return stalled_at
+
+            monkeypatch.setattr(router, "_replayed_lsn", stalled)
+            await data.create_enrollment(1, party_id=1, status="approved")
+
+            await router.check()
+            # 마지막으로 따라잡은 시점부터 시간이 지나면 사용하지 않음
+            await asyncio.sleep(0.25)
+            await router.check()
+            assert not router.usable() and router.lag_seconds() > 0.2
+
+            async with data.client() as client:
+                with _count(router.engine) as replica:
+                    assert (await client.get("/enrollment/check/1/1")).json() == {"enrolled": True}
+                assert replica["count"] == 0
+        finally:
+            await router.engine.dispose()
+
+    data.run(scenario)
+
+
+def test_unreachable_replica_is_never_used(data, monkeypatch):
+    import database
+    from database import DATABASE_URL
+
+    url = DATABASE_URL.rsplit("/", 1)[0] + "/vanta_missing_replica" + (
+        "?" + DATABASE_URL.split("?", 1)[1] if "?" in DATABASE_URL else ""
+    )
+    router = _router(url=url)
+    monkeypatch.setattr(database, "replica_router", router)
+
+    async def scenario():
+        try:
+            assert await router.check() is None
+            assert router.last_error and not router.usable()
+            assert router.status()["inUse"] is False
+
+            async with data.client() as client:
+                assert (await client.get("/enrollment/check/1/1")).json() == {"enrolled": False}
+        finally:
+            await router.engine.dispose()
+
+    data.run(scenario)
+
+
+def test_read_sessions_are_read_only(data):
+    from sqlalchemy.exc import DBAPIError
+    from database import get_db, get_read_db
+
+    async def scenario():
+        # 복제본이 없으면 primary를 읽기 전용 트랜잭션으로 사용
+        async for db in get_read_db():
+            with pytest.raises(DBAPIError, match="read-only"):
+                await db.execute(text('''INSERT INTO "Party" (id, name, capacity) VALUES (1, 'p', 10)'''))
+
+        # 같은 풀 커넥션으로 여는 쓰기 세션은 영향 없음
+        async for db in get_db():
+            await db.execute(text('''INSERT INTO "Party" (id, name, capacity) VALUES (1, 'p', 10)'''))
+            await db.commit()
+
+    data.run(scenario)
@@ -0,0 +1,116 @@
+"""
+한 번에 회원가입 테스트 (POST /auth/register)
+"""
+import asyncio
+
+from sqlalchemy import text
+
+
+def _body(**fields):
+    return {
+        "invitation_code": "PARTY2025",
+        "name": "홍길동",
+        "birthday": "2000-01-01",
+        "phone": "010-1234-5678",
+        "user_id": "hong",
+        "password": "secret",
+        **fields,
+    }
+
+
+async def _setup(data):
+    from models import Invitation
+
+    async with data.session_factory() as db:
+        db.add(Invitation(code="PARTY2025", is_active=True))
+        db.add(Invitation(code="OLD2024", is_active=False))
+        await db.commit()
+
+
+async def _users(data):
+    async with data.engine.connect() as conn:
+        rows = await conn.execute(text('SELECT "userId", phone FROM "User" ORDER BY id'))
+        return [tuple(row) for row in rows]
+
+
+def test_register_creates_the_user_in_one_request(data):
+    async def scenario():
+        await _setup(data)
+
+        async with data.client() as client:
+            response = (await client.post("/auth/register", json=_body())).json()
+            assert response["ok"] is True and response["tokenType"] == "bearer"
+
+            login = (await client.post("/auth/login", json={"user_id": "hong", "password": "secret"})).json()
+            assert login["userId"] == response["userId"]
+
+            headers = {"Authorization": f"Bearer {response['accessToken']}"}
+            profile = (await client.get(f"/profile/{response['userId']}", headers=headers)).json()
+            assert profile["user"]["name"] == "홍길동"
+
+            for body, message in (
+                (_body(invitation_code="TYPO"), "초대코드가 유효하지 않습니다."),
+                (_body(invitation_code="OLD2024"), "비활성화된 초대코드입니다."),
+                (_body(user_id="kim"), "이미 사용 중인 전화번호입니다."),
+                (_body(phone="010-0000-0000"), "이미 사용 중인 ID입니다."),
+            ):
+                assert (await client.post("/auth/register", json=body)).json() == {"ok": False, "message": message}
+
+        assert await _users(data) == [("hong", "010-1234-5678")]
+
+    data.run(scenario)
+
+
+def _hash_after_both_arrive(monkeypatch):
+    """두 요청이 중복 확인을 모두 통과한 뒤에 해시가 끝나도록 (최종 INSERT에서 경합)"""
+    import main
+
+    arrived = []
+    both = asyncio.Event()
+
+    async def hash_password(password):
+        arrived.append(password)
+        if len(arrived) == 2:
+            both.set()
+        await both.wait()
+        return f"hashed-{password}"
+
+    monkeypatch.setattr(main, "hash_password", hash_password)
+
+
+def test_concurrent_signups_with_the_same_phone_create_one_user(data, monkeypatch):
+    _hash_after_both_arrive(monkeypatch)
+
+    async def scenario():
+        await _setup(data)
+
+        async with data.client() as client:
+            responses = await asyncio.gather(
+                client.post("/auth/register", json=_body(user_id="hong")),
+                client.post("/auth/register", json=_body(user_id="kim")),
+            )
+
+        results = sorted((r.json()["ok"], r.json().get("message")) for r in responses)
+        assert results == [(False, "이미 사용 중인 전화번호입니다."), (True, None)]
+        assert len(await _users(data)) == 1
+
+    data.run(scenario)
+
+
+def test_concurrent_signups_with_the_same_user_id_create_one_user(data, monkeypatch):
+    _hash_after_both_arrive(monkeypatch)
+
+    async def scenario():
+        await _setup(data)
+
+        async with data.client() as client:
+            responses = await asyncio.gather(
+                client.post("/auth/register", json=_body(phone="010-1111-1111")),
+                client.post("/auth/register", json=_body(phone="010-2222-2222")),
+            )
+
+        results = sorted((r.json()["ok"], r.json().get("message")) for r in responses)
+        assert results == [(False, "이미 사용 중인 ID입니다."), (True, None)]
+        assert [user_id for user_id, _ in await _users(data)] == ["hong"]
+
+    data.run(scenario)
@@ -0,0 +1,79 @@
+"""
+회원가입 세션 저장소 테스트
+"""
+import asyncio
+
+from register_sessions import MemoryRegisterSessionStore, SharedRegisterSessionStore
+
+
+def test_memory_store_expires_sessions():
+    async def scenario():
+        store = MemoryRegisterSessionStore(ttl_seconds=0.05)
+        session_id = await store.create(invitation_id=7)
+        assert await store.update(session_id, name="홍길동")
+        assert (await store.get(session_id)).name == "홍길동"
+
+        await asyncio.sleep(0.1)
+        assert await store.get(session_id) is None
+        assert not await store.update(session_id, birthday="2000-01-01")
+
+    asyncio.run(scenario())
+
+
+def test_shared_store_is_visible_across_workers(tmp_path):
+    async def scenario():
+        path = str(tmp_path / "sessions.sqlite3")
+        worker_a = SharedRegisterSessionStore(path, ttl_seconds=60)
+        worker_b = SharedRegisterSessionStore(path, ttl_seconds=60)
+
+        session_id = await worker_a.create(invitation_id=3)
+        assert await worker_b.update(session_id, name="홍길동", birthday="2000-01-01")
+
+        session = await worker_a.get(session_id)
+        assert (session.invitationId, session.name, session.birthday) == (3, "홍길동", "2000-01-01")
+
+        await worker_b.delete(session_id)
+        assert await worker_a.get(session_id) is None
+
+    asyncio.run(scenario())
+
+
+def test_signup_touches_database_only_at_password_step(data):
+    async def scenario():
+        from models import Invitation, User
+        from sqlalchemy import select
+
+        async with data.session_factory() as db:
+            db.add(Invitation(code="PARTY2025", is_active=True))
+            await db.commit()
+
+        async with data.client() as client:
+            response = await client.post("/auth/invitation/verify", json={"invitation_code": "PARTY2025"})
+            session_id = response.json()["sessionId"]
+
+            with data.count_queries() as counter:
+                for path, body in (
+                    ("/auth/register/name", {"name": "홍길동"}),
+                    ("/auth/register/birthday", {"birthday": "2000-01-01"}),
+                ):
+                    response = await client.put(path, json={"session_id": session_id, **body})
+                    assert response.json() == {"ok": True}
+            assert counter["count"] == 0
+
+            for path, body in (
+                ("/auth/register/phone", {"phone": "010-1111-2222"}),
+                ("/auth/register/userid", {"user_id": "gildong"}),
+                ("/auth/register/password", {"password": "secret-pw"}),
+            ):
+                response = await client.put(path, json={"session_id": session_id, **body})
+                assert response.json()["ok"] is True
+
+            # 가입이 끝난 세션은 삭제됨
+            response = await client.put("/auth/register/name", json={"session_id": session_id, "name": "x"})
+            assert response.json()["ok"] is False
+
+        async with data.session_factory() as db:
+            user = (await db.execute(select(User).where(User.userId == "gildong"))).scalar_one()
+            assert (user.name, user.phone) == ("홍길동", "010-1111-2222")
+
+    data.run(scenario)
@@ -0,0 +1,46 @@
+"""
+repository.py 단건 조회 테스트
+"""
+from datetime import datetime
+
+
+def test_lookups_return_lightweight_rows(data):
+    async def scenario():
+        import repository
+        from models import Invitation
+        from user_cache import CachedUser
+
+        await data.create_user(1, userId="alice", phone="010-1111-2222", password="hash")
+        await data.create_enrollment(1, party_id=1, status="approved")
+        async with data.session_factory() as db:
+            db.add(Invitation(code="VIP", is_active=False))
+            await db.commit()
+
+        async with data.session_factory() as db:
+            user = await repository.get_user_by_id(db, 1)
+            assert isinstance(user, CachedUser)
+            assert (user.userId, user.phone) == ("alice", "010-1111-2222")
+            assert await repository.get_user_by_id(db, 999) is None
+
+            login = await repository.get_login_user(db, "alice")
+            assert (login.id, login.password) == (1, "hash")
+            assert await repository.get_login_user(db, "bob") is None
+
+            assert await repository.user_id_taken(db, "alice") is True
+            assert await repository.user_id_taken(db, "bob") is False
+            assert await repository.phone_taken(db, "010-1111-2222") is True
+            assert await repository.phone_taken(db, "010-0000-0000") is False
+
+            enrollment = await repository.get_enrollment(db, 1, 1)
+            assert (enrollment.status, enrollment.couponUsed) == ("approved", False)
+            assert isinstance(enrollment.createdAt, datetime)
+            assert await repository.get_enrollment(db, 1, 2) is None
+
+            invitation = await repository.get_invitation_by_code(db, "VIP")
+            assert invitation.is_active is False
+            assert await repository.get_invitation_by_code(db, "NOPE") is None
+
+            # ORM 객체를 만들지 않으므로 세션에 아무것도 등록되지 않음
+            assert len(db.identity_map) == 0
+
+    data.run(scenario)
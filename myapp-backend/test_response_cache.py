@@ -0,0 +1,82 @@
+"""
+공개 조회 API 응답 캐시 테스트
+"""
+import asyncio
+
+
+def test_party_info_is_served_from_cache(data):
+    async def scenario():
+        await data.create_user(1)
+        await data.create_user(2)
+        await data.create_user(3)
+        await data.create_enrollment(2, party_id=1, status="pending")
+        await data.create_enrollment(3, party_id=1, status="approved")
+
+        async with data.client() as client:
+            with data.count_queries() as counter:
+                responses = await asyncio.gather(*[client.get("/party/1/info") for _ in range(20)])
+                responses.append(await client.get("/party/1/info"))
+            # 동시 요청이 와도 응답은 한 번만 생성
+            assert counter["count"] == 1
+            assert {r.headers["etag"] for r in responses} == {responses[0].headers["etag"]}
+            assert responses[0].headers["cache-control"] == "public, max-age=5"
+
+            etag = responses[0].headers["etag"]
+            not_modified = await client.get("/party/1/info", headers={"If-None-Match": etag})
+            assert not_modified.status_code == 304
+            assert not_modified.content == b""
+
+            # 승인하면 캐시가 무효화되어 새 응답과 ETag가 만들어짐
+            await client.post("/admin/enrollments/approve", json={"enrollment_id": 1}, headers=data.auth_headers(1))
+            changed = await client.get("/party/1/info", headers={"If-None-Match": etag})
+            assert changed.status_code == 200
+            assert changed.json()["enrolledCount"] == 2
+            assert changed.headers["etag"] != etag
+
+    data.run(scenario)
+
+
+def test_cancelled_build_is_retried_by_waiting_requests(data):
+    import response_cache
+
+    async def scenario():
+        started = asyncio.Event()
+        builds = []
+
+        async def build():
+            builds.append(len(builds))
+            if len(builds) == 1:
+                started.set()
+                await asyncio.sleep(10)
+            await asyncio.sleep(0)
+            return {"build": len(builds)}
+
+        async def get():
+            return await response_cache._build("test:key", 5, build)
+
+        first = asyncio.ensure_future(get())
+        await started.wait()
+        waiters = [asyncio.ensure_future(get()) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        # 응답을 만들던 요청만 취소되고, 기다리던 요청은 한 번 더 만든 결과를 받음
+        first.cancel()
+        entries = await asyncio.gather(*waiters)
+        assert first.cancelled()
+        assert {entry.body for entry in entries} == {b'{"build":2}'}
+        assert len(builds) == 2
+        assert "test:key" not in response_cache._inflight
+
+    data.run(scenario)
+
+
+def test_static_endpoints_send_etag(data):
+    async def scenario():
+        async with data.client() as client:
+            for url in ("/health", "/payment/info"):
+                first = await client.get(url)
+                assert first.status_code == 200
+                second = await client.get(url, headers={"If-None-Match": f'"other", {first.headers["etag"]}'})
+                assert second.status_code == 304
+
+    data.run(scenario)
@@ -0,0 +1,110 @@
+"""
+응답 모델 / orjson 직렬화 테스트
+"""
+from datetime import datetime
+
+import schemas
+
+
+def test_every_json_route_declares_a_response_model():
+    from fastapi.responses import ORJSONResponse
+    from fastapi.routing import APIRoute
+    from main import app
+
+    # 스트리밍 / Prometheus 텍스트 응답은 JSON이 아님
+    non_json = {"/party/{party_id}/events", "/metrics"}
+    missing = [
+        route.path for route in app.routes
+        if isinstance(route, APIRoute) and route.path not in non_json and route.response_model is None
+    ]
+    assert missing == []
+    assert app.router.default_response_class is ORJSONResponse
+
+
+def test_listing_response_matches_list_model():
+    from sqlalchemy.engine.result import result_tuple
+
+    columns = schemas.ENROLLMENT_ITEM_FIELDS + ("user_id", "name", "birthday", "phone")
+    make_row = result_tuple(columns)
+    created_at = datetime(2025, 12, 1, 9, 30, 0, 123456)
+    rows = [make_row((1, 2, True, created_at, 10, "홍길동", "2000-01-01", "010-0000-0010"))]
+
+    response = schemas.listing_response(
+        rows, schemas.ENROLLMENT_ITEM_FIELDS, schemas.ENROLLMENT_USER_FIELDS, "next", partyId=2
+    )
+
+    parsed = schemas.PartyEnrollmentListResponse.model_validate_json(response.body)
+    assert parsed.enrollments[0].user.name == "홍길동"
+    assert response.body.decode().startswith('{"partyId":2,"enrollments":[{"id":1,')
+    # 기존 응답과 같은 형식 (datetime.isoformat)
+    assert f'"createdAt":"{created_at.isoformat()}"' in response.body.decode()
+
+
+def test_user_flow_responses_pass_their_models(data):
+    from models import Invitation, Party
+
+    async def scenario():
+        async with data.session_factory() as db:
+            db.add(Invitation(code="PARTY2025", is_active=True))
+            db.add(Party(id=1, name="party", capacity=10))
+            await db.commit()
+        await data.create_user(1, userId="admin")
+        async with data.engine.begin() as conn:
+            # id를 지정해 만든 관리자 다음 번호부터 가입
+            await conn.exec_driver_sql("""SELECT setval(pg_get_serial_sequence('"User"', 'id'), 1)""")
+
+        async with data.client() as client:
+            verify = await client.post("/auth/invitation/verify", json={"invitation_code": "PARTY2025"})
+            session_id = verify.json()["sessionId"]
+            for path, body in (
+                ("/auth/register/name", {"name": "홍길동"}),
+                ("/auth/register/birthday", {"birthday": "2000-01-01"}),
+                ("/auth/register/phone", {"phone": "010-1234-5678"}),
+                ("/auth/register/userid", {"user_id": "hong"}),
+                ("/auth/register/password", {"password": "secret"}),
+            ):
+                response = await client.put(path, json={"session_id": session_id, **body})
+                assert response.status_code == 200 and response.json()["ok"], (path, response.text)
+
+            login = (await client.post("/auth/login", json={"user_id": "hong", "password": "secret"})).json()
+            assert set(login) == {"ok", "userId", "name", "accessToken", "tokenType"}
+            user_id = login["userId"]
+            headers = {"Authorization": f"Bearer {login['accessToken']}"}
+            admin = data.auth_headers(1)
+
+            enroll = (await client.post("/enroll", json={"user_id": user_id, "party_id": 1}, headers=headers)).json()
+            assert enroll["status"] == "pending"
+
+            coupon = (await client.get(f"/coupon/{user_id}/1", headers=headers)).json()
+            assert coupon == {"ok": False, "message": "참가 신청이 승인 대기 중입니다.", "status": "pending"}
+
+            use = (await client.put("/coupon/use", json={"user_id": user_id, "party_id": 1}, headers=headers)).json()
+            assert use["code"] == "not_approved"
+
+            approve = await client.post(
+                "/admin/enrollments/approve", json={"enrollment_id": enroll["enrollment_id"]}, headers=admin
+            )
+            assert approve.json()["enrollment_id"] == enroll["enrollment_id"]
+            again = await client.post(
+                "/admin/enrollments/approve", json={"enrollment_id": enroll["enrollment_id"]}, headers=admin
+            )
+            assert again.json() == {"ok": True, "message": "이미 승인된 enrollment입니다."}
+
+            use = (await client.put("/coupon/use", json={"user_id": user_id, "party_id": 1}, headers=headers)).json()
+            assert use["code"] == "redeemed"
+
+            profile = (await client.get(f"/profile/{user_id}", headers=headers)).json()
+            assert profile["couponSummary"] == {"total": 1, "used": 1, "available": 0}
+            datetime.fromisoformat(profile["enrollments"][0]["enrolledAt"])
+
+            for path in ("/admin/db/pool", "/admin/hashing/stats"):
+                assert (await client.get(path, headers=admin)).status_code == 200
+            for path in ("/health", "/payment/info", "/party/1/info"):
+                assert (await client.get(path)).status_code == 200
+
+            bulk = await client.post(
+                "/admin/enrollments/bulk", json={"enrollment_ids": [999], "status": "rejected"}, headers=admin
+            )
+            assert bulk.json()["results"] == [{"enrollment_id": 999, "outcome": "not_found"}]
+
+    data.run(scenario)
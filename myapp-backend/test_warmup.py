@@ -0,0 +1,92 @@
+"""
+워커 시작 warm-up / 준비 상태 테스트 (warmup.py)
+"""
+import asyncio
+
+
+def test_ready_only_after_warm_up(data):
+    from models import Invitation
+    from invitation_index import invitation_index
+    from warmup import readiness
+
+    async def scenario():
+        async with data.session_factory() as db:
+            db.add(Invitation(code="PARTY2025", is_active=True))
+            await db.commit()
+
+        async with data.client() as client:
+            response = await client.get("/ready")
+            assert response.status_code == 503
+            assert response.json()["ready"] is False
+            assert (await client.get("/health")).status_code == 200
+
+            try:
+                await readiness.start()
+                response = await client.get("/ready")
+                assert response.status_code == 200
+                assert response.json()["ready"] is True and response.json()["warmupMs"] > 0
+                assert invitation_index.loaded
+            finally:
+                await readiness.stop()
+
+            assert (await client.get("/ready")).status_code == 503
+
+    data.run(scenario)
+
+
+def test_warm_up_opens_pool_connections_and_runs_hot_statements(data):
+    from database import POOL_SIZE
+    from warmup import warm_up_pool
+
+    async def scenario():
+        pool = data.engine.sync_engine.pool
+        await data.engine.dispose()
+        assert pool.checkedin() == 0
+
+        connections = min(2, POOL_SIZE)
+        with data.count_queries() as counter:
+            assert await warm_up_pool(connections) == connections
+        # 커넥션마다 자주 실행되는 조회 7개
+        assert counter["count"] >= 7 * connections
+        assert data.engine.sync_engine.pool.checkedin() == connections
+
+        # 이후 요청은 미리 연 커넥션을 사용
+        async with data.client() as client:
+            assert (await client.post("/auth/login", json={"user_id": "nobody", "password": "x"})).status_code == 200
+        assert data.engine.sync_engine.pool.checkedin() == connections
+
+    data.run(scenario)
+
+
+def test_failed_warm_up_is_retried_in_the_background(data, monkeypatch):
+    import warmup
+    from warmup import readiness
+
+    warm_up_pool = warmup.warm_up_pool
+    attempts = []
+
+    async def flaky_warm_up_pool(connections):
+        attempts.append(connections)
+        if len(attempts) == 1:
+            raise ConnectionError("database is starting up")
+        return await warm_up_pool(connections)
+
+    monkeypatch.setattr(warmup, "warm_up_pool", flaky_warm_up_pool)
+    monkeypatch.setattr(warmup, "RETRY_DELAY_SECONDS", 0.05)
+
+    async def scenario():
+        try:
+            await readiness.start()
+            assert not readiness.ready
+            assert readiness.status()["lastError"] == "database is starting up"
+
+            for _ in range(40):
+                if readiness.ready:
+                    break
+                await asyncio.sleep(0.05)
+            assert readiness.ready and readiness.last_error is None
+            assert len(attempts) == 2
+        finally:
+            await readiness.stop()
+
+    data.run(scenario)
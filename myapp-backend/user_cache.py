@@ -0,0 +1,77 @@
+"""
+인증 사용자 캐시 (프로세스 내 LRU + TTL)
+
+get_current_user는 모든 인증 요청마다 User를 조회합니다. 인증과 핸들러에 필요한
+필드만 담은 CachedUser를 user id 기준으로 캐시하여 DB 왕복을 없앱니다.
+
+캐시는 워커 프로세스마다 따로 존재합니다. 같은 프로세스에서 User가 ORM으로
+수정/삭제되면 자동으로 무효화되고, Core UPDATE 등 ORM을 거치지 않는 변경은
+invalidate_user를 직접 호출해야 합니다. 다른 워커의 캐시는 TTL이 지나면 갱신됩니다.
+"""
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from sqlalchemy import event
+
+import config
+from models import User
+
+
+class CachedUser:
+    """인증에 사용하는 User 필드 (비밀번호 해시는 제외)"""
+
+    __slots__ = ("id", "userId", "name", "birthday", "phone", "invitationId")
+
+    def __init__(self, id: int, userId: str, name: str, birthday: str, phone: str, invitationId: int):
+        self.id = id
+        self.userId = userId
+        self.name = name
+        self.birthday = birthday
+        self.phone = phone
+        self.invitationId = invitationId
+
+
+_entries: "OrderedDict[int, tuple[float, CachedUser]]" = OrderedDict()
+
+
+def get_cached_user(user_id: int) -> Optional[CachedUser]:
+    """캐시된 사용자 조회 (없거나 만료되면 None)"""
+    entry = _entries.get(user_id)
+    if entry is None:
+        return None
+
+    expires_at, user = entry
+    if expires_at <= time.monotonic():
+        _entries.pop(user_id, None)
+        return None
+
+    _entries.move_to_end(user_id)
+    return user
+
+
+def cache_user(user: CachedUser) -> None:
+    """사용자 캐시 저장 (최대 크기를 넘으면 가장 오래 사용하지 않은 항목 제거)"""
+    if config.USER_CACHE_TTL_SECONDS <= 0:
+        return
+
+    _entries[user.id] = (time.monotonic() + config.USER_CACHE_TTL_SECONDS, user)
+    _entries.move_to_end(user.id)
+
+    while len(_entries) > config.USER_CACHE_MAX_SIZE:
+        _entries.popitem(last=False)
+
+
+def invalidate_user(user_id: int) -> None:
+    """사용자 정보가 변경되었을 때 캐시 항목 제거"""
+    _entries.pop(user_id, None)
+
+
+def clear_user_cache() -> None:
+    _entries.clear()
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_change(mapper, connection, target):
+    invalidate_user(target.id)
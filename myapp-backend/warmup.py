@@ -0,0 +1,123 @@
+"""
+워커 시작 시 warm-up 및 준비 상태 (/ready)
+
+배포나 워커 재시작 직후의 첫 요청들이 DB 연결(TCP/TLS), asyncpg 타입 조회,
+SQL 컴파일 / prepared statement 생성 비용을 치르지 않도록 트래픽을 받기 전에
+
+1. 풀 커넥션 DB_POOL_MIN_CONNECTIONS개를 미리 열고
+2. 각 커넥션에서 자주 실행되는 조회(repository.py, 파티 정원)를 한 번씩 실행한 뒤
+3. 초대코드 인덱스를 불러옵니다.
+
+모두 끝나야 /ready가 200을 반환합니다. (/health는 프로세스 생존만 확인)
+DB에 연결하지 못하면 워커는 그대로 실행되고 백그라운드에서 다시 시도하며, 그동안 /ready는 503입니다.
+"""
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import config
+import database
+import repository
+from invitation_index import invitation_index
+from occupancy import get_occupancy
+
+logger = logging.getLogger(__name__)
+
+RETRY_DELAY_SECONDS = 5
+
+
+async def _run_hot_statements(db: AsyncSession) -> None:
+    """요청마다 실행되는 조회를 존재하지 않는 값으로 한 번씩 실행 (컴파일 캐시 / prepared statement 생성)"""
+    await repository.get_user_by_id(db, 0)
+    await repository.get_login_user(db, "")
+    await repository.user_id_taken(db, "")
+    await repository.phone_taken(db, "")
+    await repository.get_enrollment(db, 0, 0)
+    await repository.get_invitation_by_code(db, "")
+    await get_occupancy(db, 0)
+
+
+async def warm_up_pool(connections: int) -> int:
+    """
+    풀 커넥션을 동시에 connections개 열고 각 커넥션에서 자주 실행되는 조회 실행
+
+    prepared statement는 커넥션마다 따로 만들어지므로 모든 커넥션에서 실행합니다.
+    끝나면 커넥션은 닫지 않고 풀로 돌려보냅니다.
+
+    Returns:
+        연 커넥션 수
+    """
+    connections = max(1, min(connections, database.POOL_SIZE))
+    async with AsyncExitStack() as stack:
+        # 모두 체크아웃한 상태에서 열어야 같은 커넥션을 재사용하지 않음
+        opened = [await stack.enter_async_context(database.engine.connect()) for _ in range(connections)]
+        for conn in opened:
+            async with AsyncSession(bind=conn) as db:
+                await _run_hot_statements(db)
+    return connections
+
+
+class Readiness:
+    def __init__(self):
+        self.ready = False
+        self.warmed_up_at: Optional[datetime] = None
+        self.warmup_seconds: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def warm_up(self) -> None:
+        started_at = time.perf_counter()
+        connections = await warm_up_pool(config.DB_POOL_MIN_CONNECTIONS)
+        await invitation_index.start()
+
+        self.warmup_seconds = time.perf_counter() - started_at
+        self.warmed_up_at = datetime.now(timezone.utc)
+        self.last_error = None
+        self.ready = True
+        logger.info(f"Warm-up finished in {self.warmup_seconds:.2f}s ({connections} connections)")
+
+    async def _retry(self) -> None:
+        while not self.ready:
+            await asyncio.sleep(RETRY_DELAY_SECONDS)
+            try:
+                await self.warm_up()
+            except Exception as exc:
+                self.last_error = str(exc)
+                logger.warning(f"Warm-up failed, retrying in {RETRY_DELAY_SECONDS}s: {exc}")
+
+    async def start(self) -> None:
+        """트래픽을 받기 전에 warm-up (실패하면 백그라운드에서 재시도)"""
+        try:
+            await self.warm_up()
+        except Exception as exc:
+            self.last_error = str(exc)
+            logger.warning(f"Warm-up failed, serving as not ready: {exc}")
+            self._task = asyncio.create_task(self._retry())
+
+    async def stop(self) -> None:
+        # 종료 중인 워커로 새 트래픽이 오지 않도록 먼저 not ready로 전환
+        self.ready = False
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await invitation_index.stop()
+
+    def status(self) -> dict:
+        return {
+            "ready": self.ready,
+            "warmedUpAt": self.warmed_up_at.isoformat() if self.warmed_up_at else None,
+            "warmupMs": round(self.warmup_seconds * 1000, 2) if self.warmup_seconds is not None else None,
+            "lastError": self.last_error,
+        }
+
+
+readiness = Readiness()
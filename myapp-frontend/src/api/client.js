@@ -257,6 +257,23 @@ class ApiClient {
     return response.json();
   }
 
+  // 남은 자리 수 / 본인 참가 신청 상태 실시간 구독 (Server-Sent Events)
+  // 반환된 함수를 호출하면 구독을 해제합니다.
+  subscribePartyEvents(partyId, { onSpots, onStatus } = {}) {
+    const token = this.getToken();
+    const query = token ? `?token=${encodeURIComponent(token)}` : '';
+    const source = new EventSource(`${API_BASE_URL}/party/${partyId}/events${query}`);
+
+    if (onSpots) {
+      source.addEventListener('spots', (event) => onSpots(JSON.parse(event.data)));
+    }
+    if (onStatus) {
+      source.addEventListener('status', (event) => onStatus(JSON.parse(event.data)));
+    }
+
+    return () => source.close();
+  }
+
   async getCoupon(userId, partyId) {
     const response = await this.fetchWithErrorHandling(`${API_BASE_URL}/coupon/${userId}/${partyId}`, {
       method: 'GET',
@@ -23,18 +23,26 @@ function Admin() {
   const loadPendingEnrollments = async () => {
     try {
       setLoading(true);
-      const response = await fetch(`${API_BASE_URL}/admin/enrollments/pending`, {
-        headers: apiClient.getHeaders(true),
-      });
-
-      if (!response.ok) {
-        throw new Error('Failed to load pending enrollments');
-      }
-
-      const data = await response.json();
-      if (data.ok) {
-        setPendingEnrollments(data.enrollments);
-      }
+      // 페이지 단위로 조회 (nextCursor가 없을 때까지)
+      const enrollments = [];
+      let cursor = null;
+      do {
+        const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+        const response = await fetch(`${API_BASE_URL}/admin/enrollments/pending${query}`, {
+          headers: apiClient.getHeaders(true),
+        });
+
+        if (!response.ok) {
+          throw new Error('Failed to load pending enrollments');
+        }
+
+        const data = await response.json();
+        if (!data.ok) break;
+        enrollments.push(...data.enrollments);
+        cursor = data.nextCursor;
+      } while (cursor);
+
+      setPendingEnrollments(enrollments);
     } catch (error) {
       console.error('Failed to load pending enrollments:', error);
       alert('승인 대기 목록을 불러오는데 실패했습니다.');
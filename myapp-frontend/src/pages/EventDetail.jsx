@@ -56,6 +56,18 @@ function EventDetail() {
     fetchData();
   }, [id, registrationData.userId]);
 
+  // 승인/거절로 남은 자리 수가 바뀌면 실시간 반영
+  useEffect(() => {
+    return apiClient.subscribePartyEvents(id, {
+      onSpots: (info) => {
+        setPartyInfo({
+          enrolledCount: info.enrolledCount,
+          totalSpots: info.totalSpots,
+        });
+      },
+    });
+  }, [id]);
+
   const handleEnroll = () => {
     navigate(`/payment/${id}`);
   };